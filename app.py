@@ -22,7 +22,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from src.forex_analyzer import ForexAnalyzer
 from src.data.data_fetcher import ForexDataFetcher
 from src.indicators.technical_indicators import TechnicalIndicators
-from src.auth.authentication_db import AuthenticatorDB, Permissions
+from src.auth.authentication_db import get_authenticator_db, Permissions
 
 # Page configuration
 st.set_page_config(
@@ -68,7 +68,7 @@ st.markdown("""
 
 # Initialize authentication with database
 if 'auth' not in st.session_state:
-    st.session_state.auth = AuthenticatorDB()
+    st.session_state.auth = get_authenticator_db()
 
 # Initialize session state
 if 'analyzer' not in st.session_state:
@@ -5,6 +5,7 @@ Scan multiple currency pairs and metals simultaneously
 
 import streamlit as st
 import pandas as pd
+import plotly.graph_objects as go
 import sys
 import os
 from dotenv import load_dotenv
@@ -15,13 +16,14 @@ load_dotenv()
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from src.forex_analyzer import ForexAnalyzer
-from src.auth.authentication_db import AuthenticatorDB, Permissions
+from src.data.data_fetcher import ForexDataFetcher
+from src.auth.authentication_db import get_authenticator_db, Permissions
 
 st.set_page_config(page_title="Multi-Pair Scanner", page_icon="📊", layout="wide")
 
 # Check authentication with database
 if 'auth' not in st.session_state:
-    st.session_state.auth = AuthenticatorDB()
+    st.session_state.auth = get_authenticator_db()
 
 auth = st.session_state.auth
 
@@ -161,9 +163,6 @@ if refresh_all_button:
     else:
         st.info(f"Refreshing data for {len(selected_symbols)} symbols...")
 
-        import shutil
-        from src.data.data_fetcher import ForexDataFetcher
-
         fetcher = ForexDataFetcher()
         cache_dir = 'data/cache'
 
@@ -197,6 +196,327 @@ if refresh_all_button:
         status_text.text("✅ All data refreshed!")
         st.success("Ready to scan with latest market data!")
 
+
+# Result columns that aren't valid identifiers, renamed for itertuples() attribute access
+_TUPLE_FIELDS = {'Stop Loss': 'Stop_Loss', 'Take Profit': 'Take_Profit', 'Risk %': 'Risk_Pct', 'R:R': 'RR'}
+
+# Detail-view strings formatted once per frame: (source column, display column, format)
+_DISPLAY_FORMATS = (
+    ('Price', 'Price_Str', '${:.5f}'),
+    ('RSI', 'RSI_Str', '{:.1f}'),
+    ('Entry', 'Entry_Str', '${:.5f}'),
+    ('Stop Loss', 'Stop_Loss_Str', '${:.5f}'),
+    ('Risk %', 'Risk_Str', 'Risk: {:.2f}%'),
+    ('Take Profit', 'Take_Profit_Str', '${:.5f}'),
+)
+
+# Optional detail fields whose presence is checked once per frame: (source column, mask column)
+_PRESENCE_MASKS = (
+    ('RSI', 'Has_RSI'),
+    ('Entry', 'Has_Entry'),
+    ('Duration', 'Has_Duration'),
+    ('Stop Loss', 'Has_Stop_Loss'),
+    ('Risk %', 'Has_Risk'),
+    ('Take Profit', 'Has_Take_Profit'),
+)
+
+
+def _prepare_detail_rows(df):
+    """Add pre-formatted display columns, presence masks and identifier-safe names for itertuples()"""
+    extra = {
+        name: df[col].map(fmt.format, na_action='ignore')
+        for col, name, fmt in _DISPLAY_FORMATS
+    }
+    extra.update({name: df[col].notna() for col, name in _PRESENCE_MASKS})
+    extra['Has_RR'] = df['R:R'].notna() & (df['R:R'] != 'N/A')
+    return df.assign(**extra).rename(columns=_TUPLE_FIELDS)
+
+
+# HTML for the detail grid, emitted as one markdown element instead of ~10 metric/caption elements
+_ROW_GRID = '<div style="display:grid;grid-template-columns:repeat(4,1fr);gap:1rem;margin-bottom:1rem;">{cells}</div>'
+_METRIC_CELL = (
+    '<div style="font-size:0.875rem;opacity:0.7;">{label}</div>'
+    '<div style="font-size:1.75rem;line-height:1.4;margin-bottom:0.5rem;">{value}</div>'
+)
+_CAPTION_CELL = '<div style="font-size:0.875rem;opacity:0.6;">{text}</div>'
+
+
+def _signal_row_html(row):
+    """Build the price/entry/stop/target grid for one scan result row"""
+    columns = (
+        _METRIC_CELL.format(label="Price", value=row.Price_Str)
+        + (_METRIC_CELL.format(label="RSI", value=row.RSI_Str) if row.Has_RSI else ''),
+        (_METRIC_CELL.format(label="Entry", value=row.Entry_Str) if row.Has_Entry else '')
+        + (_CAPTION_CELL.format(text=f"⏱️ {row.Duration}") if row.Has_Duration else ''),
+        (_METRIC_CELL.format(label="Stop Loss", value=row.Stop_Loss_Str) if row.Has_Stop_Loss else '')
+        + (_CAPTION_CELL.format(text=row.Risk_Str) if row.Has_Risk else ''),
+        (_METRIC_CELL.format(label="Take Profit", value=row.Take_Profit_Str) if row.Has_Take_Profit else '')
+        + (_CAPTION_CELL.format(text=f"R:R 1:{row.RR}") if row.Has_RR else ''),
+    )
+    return _ROW_GRID.format(cells=''.join(f'<div>{cell}</div>' for cell in columns))
+
+
+def _render_signal_rows(rows, show_timeframe=False):
+    """Render detail rows as a single markdown element"""
+    parts = []
+    for row in rows:
+        if show_timeframe:
+            parts.append(f'<p><b>{row.Timeframe} Timeframe</b></p>')
+        parts.append(_signal_row_html(row))
+        if show_timeframe:
+            parts.append('<hr>')
+    # Entity-encode '$' so markdown doesn't read price pairs as LaTeX
+    st.markdown(''.join(parts).replace('$', '&#36;'), unsafe_allow_html=True)
+
+
+# Column formats for the BUY/SELL tables (rendered client-side, no Styler)
+_SIGNAL_COLUMN_CONFIG = {
+    'Price': st.column_config.NumberColumn(format="$%.5f"),
+    'RSI': st.column_config.NumberColumn(format="%.1f"),
+    'Entry': st.column_config.NumberColumn(format="$%.5f"),
+    'Stop Loss': st.column_config.NumberColumn(format="$%.5f"),
+    'Take Profit': st.column_config.NumberColumn(format="$%.5f"),
+    'Risk %': st.column_config.NumberColumn(format="%.2f%%"),
+}
+
+
+def _render_signal_tab(signal_df, signal, timeframe_mode):
+    """Render one signal's results as a single table, with per-row cards on request"""
+    st.dataframe(
+        signal_df,
+        column_config=_SIGNAL_COLUMN_CONFIG,
+        hide_index=True,
+        use_container_width=True
+    )
+
+    if not st.toggle("Show detail cards", key=f"scanner_details_{signal}"):
+        return
+
+    detail_df = _prepare_detail_rows(signal_df)
+
+    if timeframe_mode == "Multi-Timeframe View":
+        # Group by symbol
+        for symbol in detail_df['Symbol'].unique():
+            symbol_df = detail_df[detail_df['Symbol'] == symbol]
+            timeframes_str = ", ".join(symbol_df['Timeframe'].tolist())
+
+            with st.expander(f"{symbol} - {signal} on {timeframes_str}"):
+                _render_signal_rows(symbol_df.itertuples(index=False, name='Sig'), show_timeframe=True)
+    else:
+        # Single timeframe mode
+        for row in detail_df.itertuples(index=False, name='Sig'):
+            with st.expander(f"{row.Symbol} - {row.Signal}"):
+                _render_signal_rows([row])
+
+
+@st.fragment
+def _render_results(df, timeframe_mode, selected_timeframe):
+    """Render scan results; widget events inside only rerun this fragment"""
+    if timeframe_mode == "Multi-Timeframe View":
+        st.success(f"✅ Scan complete! Analyzed {df['Symbol'].nunique()} symbols across {len(df)} timeframe entries")
+
+        # Summary metrics
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            buy_count = len(df[df['Signal'] == 'BUY'])
+            st.metric("BUY Signals", buy_count)
+
+        with col2:
+            sell_count = len(df[df['Signal'] == 'SELL'])
+            st.metric("SELL Signals", sell_count)
+
+        with col3:
+            hold_count = len(df[df['Signal'] == 'HOLD'])
+            st.metric("HOLD Signals", hold_count)
+
+        with col4:
+            total_entries = len(df)
+            st.metric("Total Entries", total_entries)
+    else:
+        st.success(f"✅ Scan complete! Analyzed {len(df)} symbols on {selected_timeframe.upper()} timeframe")
+
+        # Summary metrics
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            buy_count = len(df[df['Signal'] == 'BUY'])
+            st.metric("BUY Signals", buy_count)
+
+        with col2:
+            sell_count = len(df[df['Signal'] == 'SELL'])
+            st.metric("SELL Signals", sell_count)
+
+        with col3:
+            hold_count = len(df[df['Signal'] == 'HOLD'])
+            st.metric("HOLD Signals", hold_count)
+
+        with col4:
+            avg_rsi = df['RSI'].mean() if 'RSI' in df.columns and not df['RSI'].isna().all() else 0
+            st.metric("Avg RSI", f"{avg_rsi:.1f}" if avg_rsi else "N/A")
+
+    # Tabs for different views
+    if timeframe_mode == "Multi-Timeframe View":
+        tab1, tab2, tab3, tab4 = st.tabs(["📊 Overview", "🔥 Heatmap", "🎯 BUY Signals", "🔴 SELL Signals"])
+    else:
+        tab1, tab2, tab3 = st.tabs(["📊 Overview", "🎯 BUY Signals", "🔴 SELL Signals"])
+
+    with tab1:
+        st.subheader("All Scan Results")
+
+        # Color code signals
+        def color_signal(val):
+            if val == 'BUY':
+                return 'background-color: #d4edda; color: #155724'
+            elif val == 'SELL':
+                return 'background-color: #f8d7da; color: #721c24'
+            else:
+                return 'background-color: #fff3cd; color: #856404'
+
+        # Custom formatter that handles None values
+        def safe_format(val, format_str):
+            if pd.isna(val) or val is None:
+                return '-'
+            return format_str.format(val)
+
+        if timeframe_mode == "Multi-Timeframe View":
+            # Show timeframe in the display
+            styled_df = df.style.applymap(color_signal, subset=['Signal'])
+
+            # Apply formatting with None handling
+            format_dict = {}
+            if 'Price' in df.columns:
+                format_dict['Price'] = lambda x: safe_format(x, '{:.5f}')
+            if 'RSI' in df.columns:
+                format_dict['RSI'] = lambda x: safe_format(x, '{:.1f}')
+            if 'Risk %' in df.columns:
+                format_dict['Risk %'] = lambda x: safe_format(x, '{:.2f}%')
+            if 'Entry' in df.columns:
+                format_dict['Entry'] = lambda x: safe_format(x, '{:.5f}')
+            if 'Stop Loss' in df.columns:
+                format_dict['Stop Loss'] = lambda x: safe_format(x, '{:.5f}')
+            if 'Take Profit' in df.columns:
+                format_dict['Take Profit'] = lambda x: safe_format(x, '{:.5f}')
+
+            st.dataframe(
+                styled_df.format(format_dict),
+                use_container_width=True
+            )
+        else:
+            styled_df = df.style.applymap(color_signal, subset=['Signal'])
+
+            # Apply formatting with None handling
+            format_dict = {}
+            if 'Price' in df.columns:
+                format_dict['Price'] = lambda x: safe_format(x, '{:.5f}')
+            if 'RSI' in df.columns:
+                format_dict['RSI'] = lambda x: safe_format(x, '{:.1f}')
+            if 'Risk %' in df.columns:
+                format_dict['Risk %'] = lambda x: safe_format(x, '{:.2f}%')
+            if 'Entry' in df.columns:
+                format_dict['Entry'] = lambda x: safe_format(x, '{:.5f}')
+            if 'Stop Loss' in df.columns:
+                format_dict['Stop Loss'] = lambda x: safe_format(x, '{:.5f}')
+            if 'Take Profit' in df.columns:
+                format_dict['Take Profit'] = lambda x: safe_format(x, '{:.5f}')
+
+            st.dataframe(
+                styled_df.format(format_dict),
+                use_container_width=True
+            )
+
+    if timeframe_mode == "Multi-Timeframe View":
+        with tab2:
+            st.subheader("🔥 Multi-Timeframe Heatmap")
+            st.markdown("Visual representation of signals across all timeframes")
+
+            # Create pivot table for heatmap
+            heatmap_data = df.pivot_table(
+                index='Symbol',
+                columns='Timeframe',
+                values='Signal',
+                aggfunc='first'
+            )
+
+            # Convert signals to numeric for coloring
+            signal_map = {'BUY': 1, 'HOLD': 0, 'SELL': -1}
+            heatmap_numeric = heatmap_data.applymap(lambda x: signal_map.get(x, 0) if pd.notna(x) else 0)
+
+            # Create heatmap using plotly
+            fig = go.Figure(data=go.Heatmap(
+                z=heatmap_numeric.values,
+                x=heatmap_numeric.columns,
+                y=heatmap_numeric.index,
+                colorscale=[
+                    [0, '#f8d7da'],    # SELL - Red
+                    [0.5, '#fff3cd'],  # HOLD - Yellow
+                    [1, '#d4edda']     # BUY - Green
+                ],
+                text=heatmap_data.values,
+                texttemplate='%{text}',
+                textfont={"size": 12},
+                colorbar=dict(
+                    title="Signal",
+                    tickvals=[-1, 0, 1],
+                    ticktext=['SELL', 'HOLD', 'BUY']
+                ),
+                hoverongaps=False
+            ))
+
+            fig.update_layout(
+                title="Signal Heatmap Across Timeframes",
+                xaxis_title="Timeframe",
+                yaxis_title="Symbol",
+                height=400 + (len(heatmap_data.index) * 30),
+                yaxis_autorange='reversed'
+            )
+
+            st.plotly_chart(fig, use_container_width=True)
+
+            # Show strongest signals
+            st.markdown("### 💪 Strongest Signals")
+            st.markdown("*Pairs with consistent signals across multiple timeframes*")
+
+            # Count BUY/SELL per symbol
+            signal_strength = df.groupby('Symbol')['Signal'].value_counts().unstack(fill_value=0)
+
+            if 'BUY' in signal_strength.columns:
+                strong_buys = signal_strength.sort_values('BUY', ascending=False)
+                st.markdown("**🟢 Strong BUY Candidates:**")
+                for symbol, row in strong_buys.head(3).iterrows():
+                    if row.get('BUY', 0) >= 2:
+                        st.success(f"**{symbol}**: {int(row['BUY'])} timeframes showing BUY")
+
+            if 'SELL' in signal_strength.columns:
+                strong_sells = signal_strength.sort_values('SELL', ascending=False)
+                st.markdown("**🔴 Strong SELL Candidates:**")
+                for symbol, row in strong_sells.head(3).iterrows():
+                    if row.get('SELL', 0) >= 2:
+                        st.error(f"**{symbol}**: {int(row['SELL'])} timeframes showing SELL")
+
+    # BUY Signals tab
+    buy_tab = tab3 if timeframe_mode == "Multi-Timeframe View" else tab2
+    with buy_tab:
+        buy_df = df[df['Signal'] == 'BUY']
+
+        if len(buy_df) > 0:
+            st.subheader(f"🟢 {len(buy_df)} BUY Opportunities")
+            _render_signal_tab(buy_df, 'BUY', timeframe_mode)
+        else:
+            st.info("No BUY signals found in this scan")
+
+    # SELL Signals tab
+    sell_tab = tab4 if timeframe_mode == "Multi-Timeframe View" else tab3
+    with sell_tab:
+        sell_df = df[df['Signal'] == 'SELL']
+
+        if len(sell_df) > 0:
+            st.subheader(f"🔴 {len(sell_df)} SELL Opportunities")
+            _render_signal_tab(sell_df, 'SELL', timeframe_mode)
+        else:
+            st.info("No SELL signals found in this scan")
+
+
 # Main content
 if scan_button:
     if not selected_symbols:
@@ -358,343 +678,16 @@ if scan_button:
         status_text.empty()
         progress_bar.empty()
 
-        # Display results
+        # Persist results so tab/expander interactions rerun only the results fragment
         if results:
-            df = pd.DataFrame(results)
-
-            if timeframe_mode == "Multi-Timeframe View":
-                st.success(f"✅ Scan complete! Analyzed {len(selected_symbols)} symbols across {len(df)} timeframe entries")
-
-                # Summary metrics
-                col1, col2, col3, col4 = st.columns(4)
-
-                with col1:
-                    buy_count = len(df[df['Signal'] == 'BUY'])
-                    st.metric("BUY Signals", buy_count)
-
-                with col2:
-                    sell_count = len(df[df['Signal'] == 'SELL'])
-                    st.metric("SELL Signals", sell_count)
-
-                with col3:
-                    hold_count = len(df[df['Signal'] == 'HOLD'])
-                    st.metric("HOLD Signals", hold_count)
-
-                with col4:
-                    total_entries = len(df)
-                    st.metric("Total Entries", total_entries)
-            else:
-                st.success(f"✅ Scan complete! Analyzed {len(results)} symbols on {selected_timeframe.upper()} timeframe")
-
-                # Summary metrics
-                col1, col2, col3, col4 = st.columns(4)
-
-                with col1:
-                    buy_count = len(df[df['Signal'] == 'BUY'])
-                    st.metric("BUY Signals", buy_count)
-
-                with col2:
-                    sell_count = len(df[df['Signal'] == 'SELL'])
-                    st.metric("SELL Signals", sell_count)
-
-                with col3:
-                    hold_count = len(df[df['Signal'] == 'HOLD'])
-                    st.metric("HOLD Signals", hold_count)
-
-                with col4:
-                    avg_rsi = df['RSI'].mean() if 'RSI' in df.columns and not df['RSI'].isna().all() else 0
-                    st.metric("Avg RSI", f"{avg_rsi:.1f}" if avg_rsi else "N/A")
-
-            # Tabs for different views
-            if timeframe_mode == "Multi-Timeframe View":
-                tab1, tab2, tab3, tab4 = st.tabs(["📊 Overview", "🔥 Heatmap", "🎯 BUY Signals", "🔴 SELL Signals"])
-            else:
-                tab1, tab2, tab3 = st.tabs(["📊 Overview", "🎯 BUY Signals", "🔴 SELL Signals"])
-
-            with tab1:
-                st.subheader("All Scan Results")
-
-                # Color code signals
-                def color_signal(val):
-                    if val == 'BUY':
-                        return 'background-color: #d4edda; color: #155724'
-                    elif val == 'SELL':
-                        return 'background-color: #f8d7da; color: #721c24'
-                    else:
-                        return 'background-color: #fff3cd; color: #856404'
-
-                # Custom formatter that handles None values
-                def safe_format(val, format_str):
-                    if pd.isna(val) or val is None:
-                        return '-'
-                    return format_str.format(val)
-
-                if timeframe_mode == "Multi-Timeframe View":
-                    # Show timeframe in the display
-                    styled_df = df.style.applymap(color_signal, subset=['Signal'])
-
-                    # Apply formatting with None handling
-                    format_dict = {}
-                    if 'Price' in df.columns:
-                        format_dict['Price'] = lambda x: safe_format(x, '{:.5f}')
-                    if 'RSI' in df.columns:
-                        format_dict['RSI'] = lambda x: safe_format(x, '{:.1f}')
-                    if 'Risk %' in df.columns:
-                        format_dict['Risk %'] = lambda x: safe_format(x, '{:.2f}%')
-                    if 'Entry' in df.columns:
-                        format_dict['Entry'] = lambda x: safe_format(x, '{:.5f}')
-                    if 'Stop Loss' in df.columns:
-                        format_dict['Stop Loss'] = lambda x: safe_format(x, '{:.5f}')
-                    if 'Take Profit' in df.columns:
-                        format_dict['Take Profit'] = lambda x: safe_format(x, '{:.5f}')
-
-                    st.dataframe(
-                        styled_df.format(format_dict),
-                        use_container_width=True
-                    )
-                else:
-                    styled_df = df.style.applymap(color_signal, subset=['Signal'])
-
-                    # Apply formatting with None handling
-                    format_dict = {}
-                    if 'Price' in df.columns:
-                        format_dict['Price'] = lambda x: safe_format(x, '{:.5f}')
-                    if 'RSI' in df.columns:
-                        format_dict['RSI'] = lambda x: safe_format(x, '{:.1f}')
-                    if 'Risk %' in df.columns:
-                        format_dict['Risk %'] = lambda x: safe_format(x, '{:.2f}%')
-                    if 'Entry' in df.columns:
-                        format_dict['Entry'] = lambda x: safe_format(x, '{:.5f}')
-                    if 'Stop Loss' in df.columns:
-                        format_dict['Stop Loss'] = lambda x: safe_format(x, '{:.5f}')
-                    if 'Take Profit' in df.columns:
-                        format_dict['Take Profit'] = lambda x: safe_format(x, '{:.5f}')
-
-                    st.dataframe(
-                        styled_df.format(format_dict),
-                        use_container_width=True
-                    )
-
-            if timeframe_mode == "Multi-Timeframe View":
-                with tab2:
-                    st.subheader("🔥 Multi-Timeframe Heatmap")
-                    st.markdown("Visual representation of signals across all timeframes")
-
-                    # Create pivot table for heatmap
-                    heatmap_data = df.pivot_table(
-                        index='Symbol',
-                        columns='Timeframe',
-                        values='Signal',
-                        aggfunc='first'
-                    )
-
-                    # Convert signals to numeric for coloring
-                    signal_map = {'BUY': 1, 'HOLD': 0, 'SELL': -1}
-                    heatmap_numeric = heatmap_data.applymap(lambda x: signal_map.get(x, 0) if pd.notna(x) else 0)
-
-                    # Create heatmap using plotly
-                    import plotly.graph_objects as go
-
-                    fig = go.Figure(data=go.Heatmap(
-                        z=heatmap_numeric.values,
-                        x=heatmap_numeric.columns,
-                        y=heatmap_numeric.index,
-                        colorscale=[
-                            [0, '#f8d7da'],    # SELL - Red
-                            [0.5, '#fff3cd'],  # HOLD - Yellow
-                            [1, '#d4edda']     # BUY - Green
-                        ],
-                        text=heatmap_data.values,
-                        texttemplate='%{text}',
-                        textfont={"size": 12},
-                        colorbar=dict(
-                            title="Signal",
-                            tickvals=[-1, 0, 1],
-                            ticktext=['SELL', 'HOLD', 'BUY']
-                        ),
-                        hoverongaps=False
-                    ))
-
-                    fig.update_layout(
-                        title="Signal Heatmap Across Timeframes",
-                        xaxis_title="Timeframe",
-                        yaxis_title="Symbol",
-                        height=400 + (len(heatmap_data.index) * 30),
-                        yaxis_autorange='reversed'
-                    )
-
-                    st.plotly_chart(fig, use_container_width=True)
-
-                    # Show strongest signals
-                    st.markdown("### 💪 Strongest Signals")
-                    st.markdown("*Pairs with consistent signals across multiple timeframes*")
-
-                    # Count BUY/SELL per symbol
-                    signal_strength = df.groupby('Symbol')['Signal'].value_counts().unstack(fill_value=0)
-
-                    if 'BUY' in signal_strength.columns:
-                        strong_buys = signal_strength.sort_values('BUY', ascending=False)
-                        st.markdown("**🟢 Strong BUY Candidates:**")
-                        for symbol, row in strong_buys.head(3).iterrows():
-                            if row.get('BUY', 0) >= 2:
-                                st.success(f"**{symbol}**: {int(row['BUY'])} timeframes showing BUY")
-
-                    if 'SELL' in signal_strength.columns:
-                        strong_sells = signal_strength.sort_values('SELL', ascending=False)
-                        st.markdown("**🔴 Strong SELL Candidates:**")
-                        for symbol, row in strong_sells.head(3).iterrows():
-                            if row.get('SELL', 0) >= 2:
-                                st.error(f"**{symbol}**: {int(row['SELL'])} timeframes showing SELL")
-
-            # BUY Signals tab
-            buy_tab = tab3 if timeframe_mode == "Multi-Timeframe View" else tab2
-            with buy_tab:
-                buy_df = df[df['Signal'] == 'BUY']
-
-                if len(buy_df) > 0:
-                    st.subheader(f"🟢 {len(buy_df)} BUY Opportunities")
-
-                    if timeframe_mode == "Multi-Timeframe View":
-                        # Group by symbol
-                        for symbol in buy_df['Symbol'].unique():
-                            symbol_df = buy_df[buy_df['Symbol'] == symbol]
-                            timeframes_str = ", ".join(symbol_df['Timeframe'].tolist())
-
-                            with st.expander(f"{symbol} - BUY on {timeframes_str}"):
-                                for idx, row in symbol_df.iterrows():
-                                    st.markdown(f"**{row['Timeframe']} Timeframe**")
-                                    col1, col2, col3, col4 = st.columns(4)
-
-                                    with col1:
-                                        st.metric("Price", f"${row['Price']:.5f}")
-                                        if pd.notna(row.get('RSI')):
-                                            st.metric("RSI", f"{row['RSI']:.1f}")
-
-                                    with col2:
-                                        if pd.notna(row.get('Entry')):
-                                            st.metric("Entry", f"${row['Entry']:.5f}")
-                                        if pd.notna(row.get('Duration')):
-                                            st.caption(f"⏱️ {row['Duration']}")
-
-                                    with col3:
-                                        if pd.notna(row.get('Stop Loss')):
-                                            st.metric("Stop Loss", f"${row['Stop Loss']:.5f}")
-                                        if pd.notna(row.get('Risk %')):
-                                            st.caption(f"Risk: {row['Risk %']:.2f}%")
-
-                                    with col4:
-                                        if pd.notna(row.get('Take Profit')):
-                                            st.metric("Take Profit", f"${row['Take Profit']:.5f}")
-                                        if pd.notna(row.get('R:R')) and row.get('R:R') != 'N/A':
-                                            st.caption(f"R:R 1:{row['R:R']}")
-
-                                    st.divider()
-                    else:
-                        # Single timeframe mode
-                        for idx, row in buy_df.iterrows():
-                            with st.expander(f"{row['Symbol']} - {row['Signal']}"):
-                                col1, col2, col3, col4 = st.columns(4)
-
-                                with col1:
-                                    st.metric("Price", f"${row['Price']:.5f}")
-                                    if pd.notna(row.get('RSI')):
-                                        st.metric("RSI", f"{row['RSI']:.1f}")
-
-                                with col2:
-                                    if pd.notna(row.get('Entry')):
-                                        st.metric("Entry", f"${row['Entry']:.5f}")
-                                    if pd.notna(row.get('Duration')):
-                                        st.caption(f"⏱️ {row['Duration']}")
-
-                                with col3:
-                                    if pd.notna(row.get('Stop Loss')):
-                                        st.metric("Stop Loss", f"${row['Stop Loss']:.5f}")
-                                    if pd.notna(row.get('Risk %')):
-                                        st.caption(f"Risk: {row['Risk %']:.2f}%")
-
-                                with col4:
-                                    if pd.notna(row.get('Take Profit')):
-                                        st.metric("Take Profit", f"${row['Take Profit']:.5f}")
-                                    if pd.notna(row.get('R:R')) and row.get('R:R') != 'N/A':
-                                        st.caption(f"R:R 1:{row['R:R']}")
-                else:
-                    st.info("No BUY signals found in this scan")
-
-            # SELL Signals tab
-            sell_tab = tab4 if timeframe_mode == "Multi-Timeframe View" else tab3
-            with sell_tab:
-                sell_df = df[df['Signal'] == 'SELL']
-
-                if len(sell_df) > 0:
-                    st.subheader(f"🔴 {len(sell_df)} SELL Opportunities")
-
-                    if timeframe_mode == "Multi-Timeframe View":
-                        # Group by symbol
-                        for symbol in sell_df['Symbol'].unique():
-                            symbol_df = sell_df[sell_df['Symbol'] == symbol]
-                            timeframes_str = ", ".join(symbol_df['Timeframe'].tolist())
-
-                            with st.expander(f"{symbol} - SELL on {timeframes_str}"):
-                                for idx, row in symbol_df.iterrows():
-                                    st.markdown(f"**{row['Timeframe']} Timeframe**")
-                                    col1, col2, col3, col4 = st.columns(4)
-
-                                    with col1:
-                                        st.metric("Price", f"${row['Price']:.5f}")
-                                        if pd.notna(row.get('RSI')):
-                                            st.metric("RSI", f"{row['RSI']:.1f}")
-
-                                    with col2:
-                                        if pd.notna(row.get('Entry')):
-                                            st.metric("Entry", f"${row['Entry']:.5f}")
-                                        if pd.notna(row.get('Duration')):
-                                            st.caption(f"⏱️ {row['Duration']}")
-
-                                    with col3:
-                                        if pd.notna(row.get('Stop Loss')):
-                                            st.metric("Stop Loss", f"${row['Stop Loss']:.5f}")
-                                        if pd.notna(row.get('Risk %')):
-                                            st.caption(f"Risk: {row['Risk %']:.2f}%")
-
-                                    with col4:
-                                        if pd.notna(row.get('Take Profit')):
-                                            st.metric("Take Profit", f"${row['Take Profit']:.5f}")
-                                        if pd.notna(row.get('R:R')) and row.get('R:R') != 'N/A':
-                                            st.caption(f"R:R 1:{row['R:R']}")
-
-                                    st.divider()
-                    else:
-                        # Single timeframe mode
-                        for idx, row in sell_df.iterrows():
-                            with st.expander(f"{row['Symbol']} - {row['Signal']}"):
-                                col1, col2, col3, col4 = st.columns(4)
-
-                                with col1:
-                                    st.metric("Price", f"${row['Price']:.5f}")
-                                    if pd.notna(row.get('RSI')):
-                                        st.metric("RSI", f"{row['RSI']:.1f}")
-
-                                with col2:
-                                    if pd.notna(row.get('Entry')):
-                                        st.metric("Entry", f"${row['Entry']:.5f}")
-                                    if pd.notna(row.get('Duration')):
-                                        st.caption(f"⏱️ {row['Duration']}")
-
-                                with col3:
-                                    if pd.notna(row.get('Stop Loss')):
-                                        st.metric("Stop Loss", f"${row['Stop Loss']:.5f}")
-                                    if pd.notna(row.get('Risk %')):
-                                        st.caption(f"Risk: {row['Risk %']:.2f}%")
-
-                                with col4:
-                                    if pd.notna(row.get('Take Profit')):
-                                        st.metric("Take Profit", f"${row['Take Profit']:.5f}")
-                                    if pd.notna(row.get('R:R')) and row.get('R:R') != 'N/A':
-                                        st.caption(f"R:R 1:{row['R:R']}")
-                else:
-                    st.info("No SELL signals found in this scan")
-
-else:
+            st.session_state['scan_results'] = pd.DataFrame(results)
+            st.session_state['scan_view'] = (timeframe_mode, selected_timeframe)
+        else:
+            st.session_state.pop('scan_results', None)
+
+if 'scan_results' in st.session_state:
+    _render_results(st.session_state['scan_results'], *st.session_state['scan_view'])
+elif not scan_button:
     st.info("👈 Select symbols from the sidebar and click **Scan All** to begin")
 
     st.markdown("""
@@ -4,8 +4,11 @@ Train machine learning models on historical data
 """
 
 import streamlit as st
+import pandas as pd
 import sys
 import os
+import datetime
+import traceback
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -14,13 +17,13 @@ load_dotenv()
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from src.forex_analyzer import ForexAnalyzer
-from src.auth.authentication_db import AuthenticatorDB, Permissions
+from src.auth.authentication_db import get_authenticator_db, Permissions
 
 st.set_page_config(page_title="Model Training", page_icon="🤖", layout="wide")
 
 # Check authentication with database
 if 'auth' not in st.session_state:
-    st.session_state.auth = AuthenticatorDB()
+    st.session_state.auth = get_authenticator_db()
 
 auth = st.session_state.auth
 
@@ -44,6 +47,41 @@ st.markdown("Train machine learning models on historical forex and metals data")
 if 'analyzer' not in st.session_state:
     st.session_state.analyzer = ForexAnalyzer()
 
+
+def _train_model(symbol, save_path, force=False):
+    """
+    Train this session's analyzer, reusing the last result for the same
+    (symbol, save_path) while the saved model file is unchanged
+
+    On reuse the saved model is loaded into the current analyzer so it
+    matches the results shown; force=True always retrains.
+    """
+    analyzer = st.session_state.analyzer
+    stat = _model_stat(save_path)
+    key = (symbol, save_path, stat.st_mtime if stat is not None else None)
+    cached = st.session_state.get('train_result')
+    if not force and cached is not None and cached[0] == key:
+        analyzer.ml_model.load(save_path)
+        return cached[1]
+
+    results = analyzer.train_model(symbol=symbol, save_path=save_path)
+    _model_stat.clear()
+    if results and 'error' not in results:
+        stat = _model_stat(save_path)
+        key = (symbol, save_path, stat.st_mtime if stat is not None else None)
+        st.session_state.train_result = (key, results)
+    return results
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _model_stat(path):
+    """os.stat of the model file shared across reruns; None if it doesn't exist"""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
 # Sidebar
 with st.sidebar:
     st.header("Training Settings")
@@ -66,6 +104,11 @@ with st.sidebar:
         "models/forex_model.pkl"
     )
 
+    force_retrain = st.checkbox(
+        "Force retrain",
+        help="Retrain even if this symbol and path were already trained in this session"
+    )
+
     train_button = st.button("🚀 Start Training", type="primary", use_container_width=True)
 
 # Main content
@@ -130,10 +173,7 @@ if train_button:
     try:
         # Train the model
         with st.spinner("Training in progress... This may take a few minutes."):
-            results = st.session_state.analyzer.train_model(
-                symbol=symbol,
-                save_path=save_path
-            )
+            results = _train_model(symbol, save_path, force=force_retrain)
 
             progress_bar.progress(100)
 
@@ -166,28 +206,28 @@ if train_button:
                 report = results['classification_report']
 
                 # Create DataFrame from report
-                import pandas as pd
-
-                report_data = []
+                report_data = {'Class': [], 'Precision': [], 'Recall': [], 'F1-Score': [], 'Support': []}
                 for class_name, metrics in report.items():
                     if isinstance(metrics, dict):
-                        report_data.append({
-                            'Class': class_name,
-                            'Precision': metrics.get('precision', 0),
-                            'Recall': metrics.get('recall', 0),
-                            'F1-Score': metrics.get('f1-score', 0),
-                            'Support': metrics.get('support', 0)
-                        })
-
-                if report_data:
+                        report_data['Class'].append(class_name)
+                        report_data['Precision'].append(metrics.get('precision', 0))
+                        report_data['Recall'].append(metrics.get('recall', 0))
+                        report_data['F1-Score'].append(metrics.get('f1-score', 0))
+                        report_data['Support'].append(metrics.get('support', 0))
+
+                if report_data['Class']:
                     df = pd.DataFrame(report_data)
+                    # Scale to percent up front and format via column_config rather than a Styler
+                    df[['Precision', 'Recall', 'F1-Score']] *= 100
+                    percent = st.column_config.NumberColumn(format="%.2f%%")
                     st.dataframe(
-                        df.style.format({
-                            'Precision': '{:.2%}',
-                            'Recall': '{:.2%}',
-                            'F1-Score': '{:.2%}',
-                            'Support': '{:.0f}'
-                        }),
+                        df,
+                        column_config={
+                            'Precision': percent,
+                            'Recall': percent,
+                            'F1-Score': percent,
+                            'Support': st.column_config.NumberColumn(format="%.0f")
+                        },
                         use_container_width=True
                     )
 
@@ -209,7 +249,6 @@ if train_button:
 
     except Exception as e:
         st.error(f"❌ Training Error: {str(e)}")
-        import traceback
         with st.expander("Error Details"):
             st.code(traceback.format_exc())
 
@@ -221,17 +260,16 @@ else:
     st.subheader("Current Model Status")
 
     model_path = "models/forex_model.pkl"
-    if os.path.exists(model_path):
-        import datetime
-        mod_time = os.path.getmtime(model_path)
-        mod_datetime = datetime.datetime.fromtimestamp(mod_time)
+    model_stat = _model_stat(model_path)
+    if model_stat is not None:
+        mod_datetime = datetime.datetime.fromtimestamp(model_stat.st_mtime)
 
         st.success(f"✅ Model exists: `{model_path}`")
         st.info(f"Last trained: {mod_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
 
         col1, col2 = st.columns(2)
         with col1:
-            file_size = os.path.getsize(model_path) / 1024  # KB
+            file_size = model_stat.st_size / 1024  # KB
             st.metric("Model Size", f"{file_size:.1f} KB")
 
         with col2:
@@ -4,6 +4,8 @@ Admin-only page for managing users
 """
 
 import streamlit as st
+import pandas as pd
+import numpy as np
 import sys
 import os
 from datetime import datetime
@@ -14,13 +16,16 @@ load_dotenv()
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from src.auth.authentication_db import AuthenticatorDB, Role, Permissions
+from src.auth.authentication_db import get_authenticator_db, Role, Permissions
+from src.utils.validation import validate_password
 
 st.set_page_config(page_title="User Management", page_icon="👥", layout="wide")
 
+ROLE_LABELS = {Role.ADMIN: "👑 Admin", Role.USER: "👤 User"}
+
 # Check authentication with database
 if 'auth' not in st.session_state:
-    st.session_state.auth = AuthenticatorDB()
+    st.session_state.auth = get_authenticator_db()
 
 auth = st.session_state.auth
 
@@ -40,6 +45,20 @@ auth.render_user_info()
 st.title("👥 User Management")
 st.markdown("Manage user accounts and permissions")
 
+
+# Fetch all users once per run for every tab
+users = auth.get_all_users()
+users_by_name = {u['username']: u for u in users}
+
+# Build column-wise so pandas gets columnar input directly
+df = pd.DataFrame({
+    key: [u.get(key) for u in users]
+    for key in ('username', 'name', 'role', 'email', 'created')
+})
+
+# Encode the admin flag once; reused by the role badges and statistics
+is_admin = df['role'].to_numpy() == Role.ADMIN
+
 # Tabs for different operations
 tab1, tab2, tab3, tab4 = st.tabs(["📋 View Users", "➕ Create User", "🔑 Change Password", "🗑️ Delete User"])
 
@@ -47,27 +66,34 @@ tab1, tab2, tab3, tab4 = st.tabs(["📋 View Users", "➕ Create User", "🔑 Ch
 with tab1:
     st.subheader("Current Users")
 
-    users = auth.get_all_users()
-
     if users:
-        import pandas as pd
-        df = pd.DataFrame(users)
-
         # Format the display
         df['created'] = pd.to_datetime(df['created']).dt.strftime('%Y-%m-%d %H:%M')
 
         # Add role badges
-        def format_role(role):
-            if role == Role.ADMIN:
-                return "👑 Admin"
-            else:
-                return "👤 User"
-
-        df['role_display'] = df['role'].apply(format_role)
+        df['role_display'] = np.where(is_admin, ROLE_LABELS[Role.ADMIN], ROLE_LABELS[Role.USER])
+
+        # Filter and cap the rendered rows so large user bases stay responsive
+        filter_col, limit_col = st.columns([3, 1])
+        with filter_col:
+            username_filter = st.text_input("Filter by username", key="users_filter")
+        with limit_col:
+            show_count = st.number_input(
+                "Show",
+                min_value=1,
+                max_value=len(df),
+                value=min(100, len(df)),
+                key="users_show_count"
+            )
+
+        view = df
+        if username_filter:
+            view = view[view['username'].str.contains(username_filter, case=False, na=False, regex=False)]
+        view = view.head(int(show_count))
 
         # Display table
         st.dataframe(
-            df[['username', 'name', 'role_display', 'email', 'created']],
+            view[['username', 'name', 'role_display', 'email', 'created']],
             column_config={
                 'username': 'Username',
                 'name': 'Full Name',
@@ -79,7 +105,7 @@ with tab1:
             use_container_width=True
         )
 
-        st.caption(f"Total users: {len(users)}")
+        st.caption(f"Showing {len(view)} of {len(users)} users")
     else:
         st.info("No users found")
 
@@ -105,12 +131,11 @@ with tab2:
 
         if submitted:
             # Validation
+            password_error = validate_password(new_password, new_password_confirm)
             if not new_username or not new_name or not new_password:
                 st.error("Please fill in all required fields (marked with *)")
-            elif new_password != new_password_confirm:
-                st.error("Passwords do not match")
-            elif len(new_password) < 6:
-                st.error("Password must be at least 6 characters long")
+            elif password_error:
+                st.error(password_error)
             else:
                 # Create user
                 if auth.create_user(new_username, new_password, new_name, new_role, new_email):
@@ -121,15 +146,12 @@ with tab2:
 with tab3:
     st.subheader("Change User Password")
 
-    users = auth.get_all_users()
-    usernames = [u['username'] for u in users]
-
     with st.form("change_password_form"):
-        selected_user = st.selectbox("Select User", usernames)
+        selected_user = st.selectbox("Select User", list(users_by_name))
 
         # Show current user info
         if selected_user:
-            user_info = next((u for u in users if u['username'] == selected_user), None)
+            user_info = users_by_name.get(selected_user)
             if user_info:
                 col1, col2, col3 = st.columns(3)
                 col1.metric("Name", user_info['name'])
@@ -153,12 +175,9 @@ with tab3:
         submitted = st.form_submit_button("Change Password", type="primary", use_container_width=True)
 
         if submitted:
-            if not new_password:
-                st.error("Please enter a new password")
-            elif new_password != new_password_confirm:
-                st.error("Passwords do not match")
-            elif len(new_password) < 6:
-                st.error("Password must be at least 6 characters long")
+            password_error = validate_password(new_password, new_password_confirm)
+            if password_error:
+                st.error(password_error)
             elif selected_user == current_user and not old_password:
                 st.error("Please enter your current password")
             else:
@@ -170,20 +189,18 @@ with tab4:
     st.subheader("Delete User")
     st.warning("⚠️ This action cannot be undone!")
 
-    users = auth.get_all_users()
     current_user = auth.get_current_user()
 
     # Filter out current user
-    deletable_users = [u for u in users if u['username'] != current_user]
+    deletable_users = [name for name in users_by_name if name != current_user]
 
     if deletable_users:
         with st.form("delete_user_form"):
-            usernames = [u['username'] for u in deletable_users]
-            selected_user = st.selectbox("Select User to Delete", usernames)
+            selected_user = st.selectbox("Select User to Delete", deletable_users)
 
             # Show user info
             if selected_user:
-                user_info = next((u for u in deletable_users if u['username'] == selected_user), None)
+                user_info = users_by_name.get(selected_user)
                 if user_info:
                     st.info(f"""
                     **User Information:**
@@ -212,9 +229,8 @@ with tab4:
 st.divider()
 st.subheader("📊 User Statistics")
 
-users = auth.get_all_users()
-admin_count = sum(1 for u in users if u['role'] == Role.ADMIN)
-user_count = sum(1 for u in users if u['role'] == Role.USER)
+admin_count = int(is_admin.sum())
+user_count = len(df) - admin_count
 
 col1, col2, col3 = st.columns(3)
 col1.metric("Total Users", len(users))
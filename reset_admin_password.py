@@ -7,11 +7,13 @@ Resets the admin user password to a new password
 import sys
 import os
 import getpass
+import bcrypt
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.database.db_manager import DatabaseManager
+from src.utils.validation import validate_password
 
 
 def reset_admin_password():
@@ -33,21 +35,21 @@ def reset_admin_password():
     print("\n🔑 Enter new admin password:")
     new_password = getpass.getpass("New Password: ")
 
-    if len(new_password) < 6:
-        print("\n❌ Error: Password must be at least 6 characters long")
-        return
-
     # Confirm password
     confirm_password = getpass.getpass("Confirm Password: ")
 
-    if new_password != confirm_password:
-        print("\n❌ Error: Passwords do not match")
+    error = validate_password(new_password, confirm_password)
+    if error:
+        print(f"\n❌ Error: {error}")
         return
 
+    # Hash once up front so the database update never re-runs bcrypt
+    password_hash = bcrypt.hashpw(new_password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+
     # Reset password
     try:
         db = DatabaseManager(db_path)
-        success, message = db.change_password('admin', new_password)
+        success, message = db.change_password_hash('admin', password_hash)
 
         if success:
             print(f"\n✅ {message}")
@@ -0,0 +1,19 @@
+"""
+Synthetic OHLCV frames shared by the test scripts
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def random_walk_frame(rows=300, seed=7):
+    """Hourly random-walk OHLCV frame around 1.1"""
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.002, rows))
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.0005, rows),
+        'High': close + 0.003,
+        'Low': close - 0.003,
+        'Close': close,
+        'Volume': rng.integers(100, 1000, rows)
+    }, index=pd.date_range('2024-01-01', periods=rows, freq='h'))
@@ -6,6 +6,12 @@ A comprehensive forex forecasting application
 __version__ = '1.0.0'
 __author__ = 'Forex Analyzer Team'
 
-from .forex_analyzer import ForexAnalyzer
-
 __all__ = ['ForexAnalyzer']
+
+
+def __getattr__(name):
+    # Import lazily so auth/database-only entry points don't pull in the ML stack
+    if name == 'ForexAnalyzer':
+        from .forex_analyzer import ForexAnalyzer
+        return ForexAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,115 @@
+"""
+Trend Momentum Kernel
+Single-pass counters over the last ``lookback`` candles. With numba the loop
+kernel is compiled; without it a vectorized NumPy version is used instead of
+running the loop in the interpreter
+"""
+
+import numpy as np
+
+from ..utils._njit import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True, nogil=True)
+def _momentum_kernel_loop(open_, close, high, low, vol, lookback):
+    """
+    Count candle direction, highs/lows pattern and volume over one window
+
+    NaN comparisons are False, matching the pandas comparisons this
+    replaces; NaN volumes are skipped like ``Series.mean`` does. (No
+    fastmath: it would let the compiler drop the NaN checks.)
+
+    Args:
+        open_, close, high, low: float32 price arrays
+        vol: float32 volume array, empty when volume is not available
+        lookback: Number of trailing candles in the window
+
+    Returns:
+        Tuple of (bullish, bearish, price_change, higher_highs, lower_lows,
+        vol_head_mean, vol_tail_mean, direction) where direction is
+        1 (bullish bias), -1 (bearish bias) or 0
+    """
+    n = close.shape[0]
+    start = n - lookback
+
+    bullish = 0
+    bearish = 0
+    higher_highs = 0
+    lower_lows = 0
+    for i in range(start, n):
+        if close[i] > open_[i]:
+            bullish += 1
+        elif close[i] < open_[i]:
+            bearish += 1
+        if i > start:
+            if high[i] > high[i - 1]:
+                higher_highs += 1
+            if low[i] < low[i - 1]:
+                lower_lows += 1
+
+    price_change = (close[n - 1] - close[start]) / close[start]
+
+    # Mean of the first and last five candles of the window (accumulated
+    # in float64)
+    vol_head_sum = 0.0
+    vol_head_n = 0
+    vol_tail_sum = 0.0
+    vol_tail_n = 0
+    if vol.shape[0] == n:
+        for i in range(start, min(start + 5, n)):
+            if vol[i] == vol[i]:
+                vol_head_sum += vol[i]
+                vol_head_n += 1
+        for i in range(max(n - 5, start), n):
+            if vol[i] == vol[i]:
+                vol_tail_sum += vol[i]
+                vol_tail_n += 1
+
+    vol_head_mean = vol_head_sum / vol_head_n if vol_head_n else np.nan
+    vol_tail_mean = vol_tail_sum / vol_tail_n if vol_tail_n else np.nan
+
+    # Strong bias means 1.5x as many candles one way as the other
+    direction = int(bullish > bearish * 1.5) - int(bearish > bullish * 1.5)
+
+    return (bullish, bearish, price_change, higher_highs, lower_lows,
+            vol_head_mean, vol_tail_mean, direction)
+
+
+def _nan_skipping_mean(values: np.ndarray) -> float:
+    """Mean ignoring NaN (like Series.mean), NaN when nothing is left"""
+    values = values[~np.isnan(values)]
+    return values.mean() if values.size else np.nan
+
+
+def _momentum_kernel_numpy(open_, close, high, low, vol, lookback):
+    """
+    Vectorized equivalent of _momentum_kernel_loop for use without numba
+
+    Args and Returns match _momentum_kernel_loop.
+    """
+    n = close.shape[0]
+    start = n - lookback
+    window_close = close[start:]
+    window_open = open_[start:]
+
+    bullish = int(np.count_nonzero(window_close > window_open))
+    bearish = int(np.count_nonzero(window_close < window_open))
+    higher_highs = int(np.count_nonzero(np.diff(high[start:]) > 0))
+    lower_lows = int(np.count_nonzero(np.diff(low[start:]) < 0))
+
+    price_change = (window_close[-1] - window_close[0]) / window_close[0]
+
+    if vol.shape[0] == n:
+        window_vol = vol[start:]
+        vol_head_mean = _nan_skipping_mean(window_vol[:5])
+        vol_tail_mean = _nan_skipping_mean(window_vol[-5:])
+    else:
+        vol_head_mean = vol_tail_mean = np.nan
+
+    direction = int(bullish > bearish * 1.5) - int(bearish > bullish * 1.5)
+
+    return (bullish, bearish, price_change, higher_highs, lower_lows,
+            vol_head_mean, vol_tail_mean, direction)
+
+
+_momentum_kernel = _momentum_kernel_loop if NUMBA_AVAILABLE else _momentum_kernel_numpy
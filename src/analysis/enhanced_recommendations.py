@@ -5,17 +5,406 @@ Implements ForexApp_V2 style recommendations with multiple entry points, stop lo
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 import logging
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+
+from ..utils._njit import njit
 
 logger = logging.getLogger(__name__)
 
+_NAN = float('nan')
+
+# Used when ATR / Bollinger bands are missing: 2% of price
+ATR_FALLBACK_PCT = 0.02
+BB_FALLBACK_PCT = 0.02
+
+# (ATR multiple, key, description) for ATR-based stop losses
+_ATR_STOPS = (
+    (1, 'tight_1atr', 'Tight stop - Quick exit, less risk'),
+    (2, 'standard_2atr', 'Standard stop - Recommended'),
+    (3, 'wide_3atr', 'Wide stop - More room, more risk'),
+)
+
+# (percent, key, description) for fixed percentage stop losses
+_PCT_STOPS = (
+    (2.0, 'percentage_2pct', '2% fixed stop loss'),
+    (3.0, 'percentage_3pct', '3% fixed stop loss'),
+    (5.0, 'percentage_5pct', '5% fixed stop loss'),
+)
+
+# (ATR multiple, key, description) for take profit targets
+_TAKE_PROFITS = (
+    (1, 'tp1_scalp', 'Scalp/Quick profit (25% position)'),
+    (2, 'tp2_conservative', 'Conservative target (25% position)'),
+    (3, 'tp3_moderate', 'Moderate target (25% position)'),
+    (5, 'tp4_aggressive', 'Aggressive target (25% - let it run!)'),
+)
+
+# Score -> recommendation: <= -3, <= -1, between, >= 1, >= 3.  Sell bounds
+# are inclusive from above (bisect_left) and buy bounds from below
+# (bisect_right), so the two indices add up to the bucket.
+_RECOMMENDATIONS = ("STRONG SELL", "SELL", "HOLD", "BUY", "STRONG BUY")
+_SELL_THRESHOLDS = (-3, -1)
+_BUY_THRESHOLDS = (1, 3)
+
+# Targets are k ATR away and the standard stop 2 ATR, so R:R is k / 2
+_RR_RATIOS = {key: k / 2 for k, key, _ in _TAKE_PROFITS}
+
+# Trade direction per recommendation: +1 long, -1 short (HOLD is 0)
+_DIR = {"BUY": 1, "STRONG BUY": 1, "SELL": -1, "STRONG SELL": -1}
+
+# Columns reported in the 'indicators' block
+_INDICATOR_COLUMNS = ('RSI', 'MACD', 'MACD_Signal', 'Stoch_K', 'Stoch_D', 'ATR', 'MA_20', 'MA_50')
+
+# Scoring inputs, in _score_values argument order
+_SCORE_COLUMNS = (
+    'Close', 'MA_20', 'MA_50', 'MACD', 'MACD_Signal', 'MACD_Hist', 'RSI',
+    'BB_Lower', 'BB_Upper', 'Stoch_K', 'Stoch_D',
+)
+
+# Columns stacked by batch_generate, in array column order (scoring inputs first)
+_BATCH_COLUMNS = _SCORE_COLUMNS + ('ATR',)
+
+# Every column read from the last row (a 'timestamp' column is the
+# fallback when the index is not datetime-like)
+_ROW_COLUMNS = _BATCH_COLUMNS + ('Open', 'High', 'Low', 'timestamp')
+
+# Flat price level layout: stop losses then take profits, in table order.
+# A level sits at close * (1 + d * pct) + d * atr_mult * atr for trade
+# direction d, so stops carry negative multiples and targets positive ones.
+LEVEL_KEYS = tuple(key for _, key, _ in _ATR_STOPS + _PCT_STOPS + _TAKE_PROFITS)
+LEVEL_DESCRIPTIONS = tuple(desc for _, _, desc in _ATR_STOPS + _PCT_STOPS + _TAKE_PROFITS)
+_LEVEL_ATR_MULT = np.array(
+    [-k for k, _, _ in _ATR_STOPS] + [0] * len(_PCT_STOPS) + [k for k, _, _ in _TAKE_PROFITS],
+    dtype=np.float64
+)
+_LEVEL_PCT = np.array(
+    [0] * len(_ATR_STOPS) + [-pct / 100 for pct, _, _ in _PCT_STOPS] + [0] * len(_TAKE_PROFITS),
+    dtype=np.float64
+)
+
+
+def _last_row(df: pd.DataFrame) -> Dict[str, float]:
+    """
+    Extract the last row of the columns used here as a plain dict
+
+    Column positions are resolved in one ``get_indexer`` call and only
+    those cells of the last row are converted, so the rest of a wide
+    indicator frame is never touched. Absent columns are left out, and NaN
+    can then be tested with ``x != x`` instead of ``pd.isna``.
+
+    Args:
+        df: DataFrame with indicators
+
+    Returns:
+        Dictionary mapping column names to last-row values
+    """
+    positions = df.columns.get_indexer(_ROW_COLUMNS)
+    present = positions >= 0
+    names = [col for col, found in zip(_ROW_COLUMNS, present) if found]
+    return dict(zip(names, df.iloc[-1:, positions[present]].to_numpy()[0]))
+
+
+@njit(cache=True, nogil=True)
+def _score_kernel(close, ma_20, ma_50, macd, macd_signal, macd_hist, rsi,
+                  bb_lower, bb_upper, stoch_k, stoch_d):
+    """
+    Sum the indicator scoring rules for one bar
+
+    Compiled with numba when it is installed. NaN means the indicator is
+    missing and contributes nothing.
+
+    Returns:
+        Total signal score
+    """
+    trend = 0.0
+    momentum = 0.0
+    strength = 0.0
+    volatility = 0.0
+
+    # Trend Analysis (from moving averages)
+    if ma_20 == ma_20 and ma_50 == ma_50:
+        trend += 1.0 if ma_20 > ma_50 else -1.0
+        trend += 1.0 if close > ma_20 else -1.0
+
+    # MACD Signal
+    if macd == macd and macd_signal == macd_signal:
+        momentum += 1.0 if macd > macd_signal else -1.0
+        if macd_hist == macd_hist:
+            momentum += 0.5 if macd_hist > 0 else -0.5
+
+    # RSI Analysis
+    if rsi == rsi:
+        if rsi < 30:
+            strength += 2.0  # Oversold - strong buy
+        elif rsi < 40:
+            strength += 1.0  # Slightly oversold
+        elif rsi > 70:
+            strength -= 2.0  # Overbought - strong sell
+        elif rsi > 60:
+            strength -= 1.0  # Slightly overbought
+
+    # Bollinger Bands
+    if bb_lower == bb_lower and bb_upper == bb_upper:
+        if close < bb_lower:
+            volatility += 1.0  # Below lower band - buy signal
+        elif close > bb_upper:
+            volatility -= 1.0  # Above upper band - sell signal
+
+    # Stochastic
+    if stoch_k == stoch_k and stoch_d == stoch_d:
+        if stoch_k < 20 and stoch_k > stoch_d:
+            momentum += 1.0  # Oversold and turning up
+        elif stoch_k > 80 and stoch_k < stoch_d:
+            momentum -= 1.0  # Overbought and turning down
+
+    return trend + momentum + strength + volatility
+
+
+@lru_cache(maxsize=4096)
+def _score_values(close: float, ma_20: float, ma_50: float, macd: float,
+                  macd_signal: float, macd_hist: float, rsi: float,
+                  bb_lower: float, bb_upper: float, stoch_k: float,
+                  stoch_d: float) -> Tuple[float, str]:
+    """
+    Score the latest indicator values (memoized)
+
+    Between ticks the last bar of a timeframe is unchanged, so repeated
+    scans hit the cache; ``_score_values.cache_info()`` reports the hit rate.
+
+    Returns:
+        Tuple of (score, recommendation)
+    """
+    total_score = _score_kernel(close, ma_20, ma_50, macd, macd_signal, macd_hist,
+                                rsi, bb_lower, bb_upper, stoch_k, stoch_d)
+
+    # Determine recommendation
+    index = bisect_left(_SELL_THRESHOLDS, total_score) + bisect_right(_BUY_THRESHOLDS, total_score)
+    return total_score, _RECOMMENDATIONS[index]
+
+
+def _score_row(latest: Dict[str, float], _columns=_SCORE_COLUMNS, _nan=_NAN,
+               _float=float, _score=_score_values) -> Tuple[float, str]:
+    """
+    Score a last-row dict through the memoized scorer
+
+    Missing columns score the same as NaN; NaNs are normalised to one
+    object so equal rows hash to the same cache key. The keyword defaults
+    bind globals as fast locals for this per-tick path; do not pass them.
+
+    Args:
+        latest: Mapping of column name to latest value
+
+    Returns:
+        Tuple of (score, recommendation)
+    """
+    get = latest.get
+    values = []
+    for col in _columns:
+        value = get(col, _nan)
+        values.append(_float(value) if value == value else _nan)
+    return _score(*values)
+
+
+def _level_inputs(latest: Dict[str, float]) -> Tuple[float, float, float, float]:
+    """
+    Read close, ATR and Bollinger bands, falling back to percentages of price
+
+    Args:
+        latest: Mapping of column name to latest value
+
+    Returns:
+        Tuple of (close, atr, bb_lower, bb_upper)
+    """
+    current_price = latest['Close']
+
+    # Missing or NaN values fall back to a fixed percentage of price; the
+    # fallback is only computed when it is needed
+    atr = latest.get('ATR')
+    if atr is None or atr != atr:
+        atr = current_price * ATR_FALLBACK_PCT
+    bb_lower = latest.get('BB_Lower')
+    if bb_lower is None or bb_lower != bb_lower:
+        bb_lower = current_price * (1 - BB_FALLBACK_PCT)
+    bb_upper = latest.get('BB_Upper')
+    if bb_upper is None or bb_upper != bb_upper:
+        bb_upper = current_price * (1 + BB_FALLBACK_PCT)
+
+    return current_price, atr, bb_lower, bb_upper
+
+
+def _row_price_levels(latest: Dict[str, float], recommendation: str) -> Dict:
+    """
+    Build price levels from a last-row dict
+
+    Args:
+        latest: Mapping of column name to latest value
+        recommendation: Trading recommendation
+
+    Returns:
+        Dictionary with all price levels
+    """
+    return _build_price_levels(*_level_inputs(latest), recommendation)
+
+
+def _build_price_levels(current_price: float, atr: float, bb_lower: float,
+                        bb_upper: float, recommendation: str) -> Dict:
+    """
+    Build entry points, stop losses, and take profit targets from scalars
+
+    Args:
+        current_price: Latest close
+        atr: Average true range used to space the levels
+        bb_lower: Lower Bollinger band (strong buy level)
+        bb_upper: Upper Bollinger band (strong sell level)
+        recommendation: Trading recommendation
+
+    Returns:
+        Dictionary with all price levels
+    """
+    # ATR as a percentage of price; k-ATR levels are k of these away
+    atr_pct = atr / current_price * 100
+
+    # Buy price ranges (support levels)
+    buy_range = {
+        'strong_buy': bb_lower,
+        'buy_zone_low': current_price - 1.5 * atr,
+        'buy_zone_high': current_price - 0.5 * atr
+    }
+
+    # Sell price ranges (resistance levels)
+    sell_range = {
+        'sell_zone_low': current_price + 0.5 * atr,
+        'sell_zone_high': current_price + 1.5 * atr,
+        'strong_sell': bb_upper
+    }
+
+    # Stops sit against the direction of the trade and targets with it
+    direction = _DIR.get(recommendation, 0)
+
+    if direction == 0:
+        entry_points = {
+            'entry_1_now': {
+                'price': current_price,
+                'description': 'No clear entry - HOLD',
+                'urgency': 'WAIT'
+            }
+        }
+        stop_losses = {
+            'standard_2atr': {
+                'price': current_price - 2 * atr,
+                'description': 'Protective stop if entering',
+                'risk_pct': 2 * atr_pct
+            }
+        }
+        take_profits = {}
+    else:
+        # Multiple entry points
+        entry_points = {
+            'entry_1_now': {
+                'price': current_price,
+                'description': 'Current price - Immediate entry',
+                'urgency': 'NOW'
+            },
+            'entry_2_pullback': {
+                'price': current_price - direction * 0.5 * atr,
+                'description': 'Better entry on pullback',
+                'urgency': 'LIMIT ORDER'
+            },
+            'entry_3_best': {
+                'price': current_price - direction * 1.5 * atr,
+                'description': 'Best entry in support zone' if direction > 0
+                               else 'Best entry in resistance zone',
+                'urgency': 'LIMIT ORDER'
+            }
+        }
+
+        # Multiple stop loss levels
+        stop_losses = {
+            key: {
+                'price': current_price - direction * k * atr,
+                'description': description,
+                'risk_pct': k * atr_pct
+            }
+            for k, key, description in _ATR_STOPS
+        }
+        for pct, key, description in _PCT_STOPS:
+            stop_losses[key] = {
+                'price': current_price * (1 - direction * pct / 100),
+                'description': description,
+                'risk_pct': pct
+            }
+
+        # Multiple take profit targets
+        take_profits = {
+            key: {
+                'price': current_price + direction * k * atr,
+                'description': description,
+                'gain_pct': k * atr_pct,
+                'atr_multiple': k
+            }
+            for k, key, description in _TAKE_PROFITS
+        }
+
+    # Risk/reward ratios against the standard stop are constant
+    risk_reward_ratios = dict(_RR_RATIOS) if take_profits and atr > 0 else {}
+
+    return {
+        'buy_range': buy_range,
+        'sell_range': sell_range,
+        'entry_points': entry_points,
+        'stop_losses': stop_losses,
+        'take_profits': take_profits,
+        'risk_reward_ratios': risk_reward_ratios
+    }
+
+
+def _assemble_recommendation(latest, timestamp, timeframe: str, score: float,
+                             recommendation: str, price_levels: Dict) -> Dict:
+    """
+    Assemble the recommendation dictionary for one timeframe
+
+    Args:
+        latest: Last row of the indicator DataFrame (Series or dict)
+        timestamp: Index label of the last row
+        timeframe: Timeframe being analyzed
+        score: Signal score
+        recommendation: Trading recommendation
+        price_levels: Output of the price level builder
+
+    Returns:
+        Complete recommendation dictionary
+    """
+    # One lookup per indicator; NaN fails self-equality
+    indicators = {}
+    for name in _INDICATOR_COLUMNS:
+        value = latest.get(name)
+        indicators[name] = None if value is None or value != value else value
+
+    return {
+        'timeframe': timeframe,
+        'recommendation': recommendation,
+        'score': score,
+        'current_price': latest['Close'],
+        'ohlc': {
+            'open': latest['Open'],
+            'high': latest['High'],
+            'low': latest['Low'],
+            'close': latest['Close']
+        },
+        **price_levels,
+        'indicators': indicators,
+        'timestamp': timestamp if hasattr(timestamp, 'strftime') else latest.get('timestamp', 'N/A')
+    }
+
 
 class EnhancedRecommendations:
     """Generate detailed trading recommendations similar to ForexApp_V2"""
 
     @staticmethod
-    def calculate_signal_score(df: pd.DataFrame, signals: Dict[str, str]) -> Tuple[int, str]:
+    def calculate_signal_score(df: pd.DataFrame, signals: Dict[str, str]) -> Tuple[float, str]:
         """
         Calculate signal score and recommendation
 
@@ -26,79 +415,7 @@ class EnhancedRecommendations:
         Returns:
             Tuple of (score, recommendation)
         """
-        latest = df.iloc[-1]
-        score_parts = {'trend': 0, 'momentum': 0, 'strength': 0, 'volatility': 0}
-
-        # Trend Analysis (from moving averages)
-        if 'MA_20' in df.columns and 'MA_50' in df.columns:
-            if not pd.isna(latest['MA_20']) and not pd.isna(latest['MA_50']):
-                if latest['MA_20'] > latest['MA_50']:
-                    score_parts['trend'] += 1
-                else:
-                    score_parts['trend'] -= 1
-
-                if latest['Close'] > latest['MA_20']:
-                    score_parts['trend'] += 1
-                else:
-                    score_parts['trend'] -= 1
-
-        # MACD Signal
-        if 'MACD' in df.columns and 'MACD_Signal' in df.columns:
-            if not pd.isna(latest['MACD']) and not pd.isna(latest['MACD_Signal']):
-                if latest['MACD'] > latest['MACD_Signal']:
-                    score_parts['momentum'] += 1
-                else:
-                    score_parts['momentum'] -= 1
-
-                if 'MACD_Hist' in df.columns and not pd.isna(latest['MACD_Hist']):
-                    if latest['MACD_Hist'] > 0:
-                        score_parts['momentum'] += 0.5
-                    else:
-                        score_parts['momentum'] -= 0.5
-
-        # RSI Analysis
-        if 'RSI' in df.columns and not pd.isna(latest['RSI']):
-            if latest['RSI'] < 30:
-                score_parts['strength'] += 2  # Oversold - strong buy
-            elif latest['RSI'] < 40:
-                score_parts['strength'] += 1  # Slightly oversold
-            elif latest['RSI'] > 70:
-                score_parts['strength'] -= 2  # Overbought - strong sell
-            elif latest['RSI'] > 60:
-                score_parts['strength'] -= 1  # Slightly overbought
-
-        # Bollinger Bands
-        if 'BB_Lower' in df.columns and 'BB_Upper' in df.columns:
-            if not pd.isna(latest['BB_Lower']) and not pd.isna(latest['BB_Upper']):
-                if latest['Close'] < latest['BB_Lower']:
-                    score_parts['volatility'] += 1  # Below lower band - buy signal
-                elif latest['Close'] > latest['BB_Upper']:
-                    score_parts['volatility'] -= 1  # Above upper band - sell signal
-
-        # Stochastic
-        if 'Stoch_K' in df.columns and 'Stoch_D' in df.columns:
-            if not pd.isna(latest['Stoch_K']) and not pd.isna(latest['Stoch_D']):
-                if latest['Stoch_K'] < 20 and latest['Stoch_K'] > latest['Stoch_D']:
-                    score_parts['momentum'] += 1  # Oversold and turning up
-                elif latest['Stoch_K'] > 80 and latest['Stoch_K'] < latest['Stoch_D']:
-                    score_parts['momentum'] -= 1  # Overbought and turning down
-
-        # Calculate total score
-        total_score = sum(score_parts.values())
-
-        # Determine recommendation
-        if total_score >= 3:
-            recommendation = "STRONG BUY"
-        elif total_score >= 1:
-            recommendation = "BUY"
-        elif total_score <= -3:
-            recommendation = "STRONG SELL"
-        elif total_score <= -1:
-            recommendation = "SELL"
-        else:
-            recommendation = "HOLD"
-
-        return total_score, recommendation
+        return _score_row(_last_row(df))
 
     @staticmethod
     def calculate_price_levels(df: pd.DataFrame, recommendation: str) -> Dict:
@@ -112,270 +429,136 @@ class EnhancedRecommendations:
         Returns:
             Dictionary with all price levels
         """
-        latest = df.iloc[-1]
-        current_price = latest['Close']
-
-        # Get ATR for calculations
-        atr = latest.get('ATR', current_price * 0.02)  # Fallback to 2% if no ATR
+        return _row_price_levels(_last_row(df), recommendation)
 
-        # Buy price ranges (support levels)
-        buy_range = {
-            'strong_buy': round(latest.get('BB_Lower', current_price * 0.98), 5),
-            'buy_zone_low': round(current_price - (1.5 * atr), 5),
-            'buy_zone_high': round(current_price - (0.5 * atr), 5)
-        }
+    @staticmethod
+    def generate_enhanced_recommendation(df: pd.DataFrame, signals: Dict[str, str],
+                                        timeframe: str) -> Dict:
+        """
+        Generate enhanced recommendation with all details
 
-        # Sell price ranges (resistance levels)
-        sell_range = {
-            'sell_zone_low': round(current_price + (0.5 * atr), 5),
-            'sell_zone_high': round(current_price + (1.5 * atr), 5),
-            'strong_sell': round(latest.get('BB_Upper', current_price * 1.02), 5)
-        }
+        Args:
+            df: DataFrame with indicators
+            signals: Dictionary of signal types
+            timeframe: Timeframe being analyzed
 
-        # Multiple entry points
-        if recommendation in ["BUY", "STRONG BUY"]:
-            entry_points = {
-                'entry_1_now': {
-                    'price': round(current_price, 5),
-                    'description': 'Current price - Immediate entry',
-                    'urgency': 'NOW'
-                },
-                'entry_2_pullback': {
-                    'price': round(buy_range['buy_zone_high'], 5),
-                    'description': 'Better entry on pullback',
-                    'urgency': 'LIMIT ORDER'
-                },
-                'entry_3_best': {
-                    'price': round(buy_range['buy_zone_low'], 5),
-                    'description': 'Best entry in support zone',
-                    'urgency': 'LIMIT ORDER'
-                }
-            }
-        elif recommendation in ["SELL", "STRONG SELL"]:
-            entry_points = {
-                'entry_1_now': {
-                    'price': round(current_price, 5),
-                    'description': 'Current price - Immediate entry',
-                    'urgency': 'NOW'
-                },
-                'entry_2_pullback': {
-                    'price': round(sell_range['sell_zone_low'], 5),
-                    'description': 'Better entry on pullback',
-                    'urgency': 'LIMIT ORDER'
-                },
-                'entry_3_best': {
-                    'price': round(sell_range['sell_zone_high'], 5),
-                    'description': 'Best entry in resistance zone',
-                    'urgency': 'LIMIT ORDER'
-                }
-            }
-        else:
-            entry_points = {
-                'entry_1_now': {
-                    'price': round(current_price, 5),
-                    'description': 'No clear entry - HOLD',
-                    'urgency': 'WAIT'
-                }
-            }
+        Returns:
+            Complete recommendation dictionary
+        """
+        # Extract the last row once and share it with every step
+        latest = _last_row(df)
 
-        # Multiple stop loss levels
-        if recommendation in ["BUY", "STRONG BUY"]:
-            stop_losses = {
-                'tight_1atr': {
-                    'price': round(current_price - (1 * atr), 5),
-                    'description': 'Tight stop - Quick exit, less risk',
-                    'risk_pct': round(((current_price - (current_price - (1 * atr))) / current_price) * 100, 2)
-                },
-                'standard_2atr': {
-                    'price': round(current_price - (2 * atr), 5),
-                    'description': 'Standard stop - Recommended',
-                    'risk_pct': round(((current_price - (current_price - (2 * atr))) / current_price) * 100, 2)
-                },
-                'wide_3atr': {
-                    'price': round(current_price - (3 * atr), 5),
-                    'description': 'Wide stop - More room, more risk',
-                    'risk_pct': round(((current_price - (current_price - (3 * atr))) / current_price) * 100, 2)
-                },
-                'percentage_2pct': {
-                    'price': round(current_price * 0.98, 5),
-                    'description': '2% fixed stop loss',
-                    'risk_pct': 2.0
-                },
-                'percentage_3pct': {
-                    'price': round(current_price * 0.97, 5),
-                    'description': '3% fixed stop loss',
-                    'risk_pct': 3.0
-                },
-                'percentage_5pct': {
-                    'price': round(current_price * 0.95, 5),
-                    'description': '5% fixed stop loss',
-                    'risk_pct': 5.0
-                }
-            }
+        # Calculate score and recommendation
+        score, recommendation = _score_row(latest)
 
-            # Multiple take profit targets
-            take_profits = {
-                'tp1_scalp': {
-                    'price': round(current_price + (1 * atr), 5),
-                    'description': 'Scalp/Quick profit (25% position)',
-                    'gain_pct': round((((current_price + (1 * atr)) - current_price) / current_price) * 100, 2),
-                    'atr_multiple': 1
-                },
-                'tp2_conservative': {
-                    'price': round(current_price + (2 * atr), 5),
-                    'description': 'Conservative target (25% position)',
-                    'gain_pct': round((((current_price + (2 * atr)) - current_price) / current_price) * 100, 2),
-                    'atr_multiple': 2
-                },
-                'tp3_moderate': {
-                    'price': round(current_price + (3 * atr), 5),
-                    'description': 'Moderate target (25% position)',
-                    'gain_pct': round((((current_price + (3 * atr)) - current_price) / current_price) * 100, 2),
-                    'atr_multiple': 3
-                },
-                'tp4_aggressive': {
-                    'price': round(current_price + (5 * atr), 5),
-                    'description': 'Aggressive target (25% - let it run!)',
-                    'gain_pct': round((((current_price + (5 * atr)) - current_price) / current_price) * 100, 2),
-                    'atr_multiple': 5
-                }
-            }
+        # Calculate all price levels
+        price_levels = _row_price_levels(latest, recommendation)
 
-        elif recommendation in ["SELL", "STRONG SELL"]:
-            stop_losses = {
-                'tight_1atr': {
-                    'price': round(current_price + (1 * atr), 5),
-                    'description': 'Tight stop - Quick exit, less risk',
-                    'risk_pct': round((((current_price + (1 * atr)) - current_price) / current_price) * 100, 2)
-                },
-                'standard_2atr': {
-                    'price': round(current_price + (2 * atr), 5),
-                    'description': 'Standard stop - Recommended',
-                    'risk_pct': round((((current_price + (2 * atr)) - current_price) / current_price) * 100, 2)
-                },
-                'wide_3atr': {
-                    'price': round(current_price + (3 * atr), 5),
-                    'description': 'Wide stop - More room, more risk',
-                    'risk_pct': round((((current_price + (3 * atr)) - current_price) / current_price) * 100, 2)
-                },
-                'percentage_2pct': {
-                    'price': round(current_price * 1.02, 5),
-                    'description': '2% fixed stop loss',
-                    'risk_pct': 2.0
-                },
-                'percentage_3pct': {
-                    'price': round(current_price * 1.03, 5),
-                    'description': '3% fixed stop loss',
-                    'risk_pct': 3.0
-                },
-                'percentage_5pct': {
-                    'price': round(current_price * 1.05, 5),
-                    'description': '5% fixed stop loss',
-                    'risk_pct': 5.0
-                }
-            }
+        return _assemble_recommendation(latest, df.index[-1], timeframe, score,
+                                        recommendation, price_levels)
 
-            take_profits = {
-                'tp1_scalp': {
-                    'price': round(current_price - (1 * atr), 5),
-                    'description': 'Scalp/Quick profit (25% position)',
-                    'gain_pct': round(((current_price - (current_price - (1 * atr))) / current_price) * 100, 2),
-                    'atr_multiple': 1
-                },
-                'tp2_conservative': {
-                    'price': round(current_price - (2 * atr), 5),
-                    'description': 'Conservative target (25% position)',
-                    'gain_pct': round(((current_price - (current_price - (2 * atr))) / current_price) * 100, 2),
-                    'atr_multiple': 2
-                },
-                'tp3_moderate': {
-                    'price': round(current_price - (3 * atr), 5),
-                    'description': 'Moderate target (25% position)',
-                    'gain_pct': round(((current_price - (current_price - (3 * atr))) / current_price) * 100, 2),
-                    'atr_multiple': 3
-                },
-                'tp4_aggressive': {
-                    'price': round(current_price - (5 * atr), 5),
-                    'description': 'Aggressive target (25% - let it run!)',
-                    'gain_pct': round(((current_price - (current_price - (5 * atr))) / current_price) * 100, 2),
-                    'atr_multiple': 5
-                }
-            }
-        else:
-            # HOLD recommendation
-            stop_losses = {
-                'standard_2atr': {
-                    'price': round(current_price - (2 * atr), 5),
-                    'description': 'Protective stop if entering',
-                    'risk_pct': round(((current_price - (current_price - (2 * atr))) / current_price) * 100, 2)
-                }
-            }
-            take_profits = {}
+    @classmethod
+    def batch_generate(cls, dfs: List[pd.DataFrame], timeframes: List[str]) -> List[Dict]:
+        """
+        Generate enhanced recommendations for many DataFrames in one pass
 
-        # Calculate risk/reward ratios
-        risk_reward_ratios = {}
-        if take_profits and stop_losses.get('standard_2atr'):
-            standard_sl = stop_losses['standard_2atr']['price']
-            potential_loss = abs(current_price - standard_sl)
+        The last rows are stacked into a single (N, K) array; each row is
+        scored by the same kernel as calculate_signal_score, while the
+        recommendation buckets and level fallbacks run as vectorized NumPy
+        operations.
 
-            if potential_loss > 0:
-                for tp_name, tp_data in take_profits.items():
-                    potential_gain = abs(tp_data['price'] - current_price)
-                    risk_reward_ratios[tp_name] = round(potential_gain / potential_loss, 2)
+        Args:
+            dfs: DataFrames with indicators
+            timeframes: Timeframe label for each DataFrame
 
-        return {
-            'buy_range': buy_range,
-            'sell_range': sell_range,
-            'entry_points': entry_points,
-            'stop_losses': stop_losses,
-            'take_profits': take_profits,
-            'risk_reward_ratios': risk_reward_ratios
-        }
+        Returns:
+            List of recommendation dictionaries, in input order
+        """
+        if not dfs:
+            return []
+
+        rows = [_last_row(df) for df in dfs]
+        values = np.array(
+            [[row.get(col, _NAN) for col in _BATCH_COLUMNS] for row in rows],
+            dtype=np.float64
+        )
+        close, atr, bb_lower, bb_upper = (
+            values[:, _BATCH_COLUMNS.index(col)] for col in ('Close', 'ATR', 'BB_Lower', 'BB_Upper')
+        )
+
+        # One rule set: every row goes through the same kernel as
+        # calculate_signal_score (unmemoized, since batch rows rarely repeat)
+        n_score = len(_SCORE_COLUMNS)
+        scores = np.array([_score_kernel(*row[:n_score]) for row in values], dtype=np.float64)
+        recommendations = np.take(
+            _RECOMMENDATIONS,
+            np.searchsorted(_SELL_THRESHOLDS, scores, side='left')
+            + np.searchsorted(_BUY_THRESHOLDS, scores, side='right')
+        )
+
+        # Same fallbacks as calculate_price_levels, applied column-wise
+        atr = np.where(np.isnan(atr), close * ATR_FALLBACK_PCT, atr)
+        bb_lower = np.where(np.isnan(bb_lower), close * (1 - BB_FALLBACK_PCT), bb_lower)
+        bb_upper = np.where(np.isnan(bb_upper), close * (1 + BB_FALLBACK_PCT), bb_upper)
+
+        results = []
+        for i, (df, row, timeframe) in enumerate(zip(dfs, rows, timeframes)):
+            recommendation = str(recommendations[i])
+            price_levels = _build_price_levels(
+                float(close[i]), float(atr[i]), float(bb_lower[i]),
+                float(bb_upper[i]), recommendation
+            )
+            results.append(_assemble_recommendation(
+                row, df.index[-1], timeframe, float(scores[i]),
+                recommendation, price_levels
+            ))
+
+        return results
 
     @staticmethod
-    def generate_enhanced_recommendation(df: pd.DataFrame, signals: Dict[str, str],
-                                        timeframe: str) -> Dict:
+    def level_matrix(close: np.ndarray, atr: np.ndarray,
+                     recommendations: List[str]) -> np.ndarray:
         """
-        Generate enhanced recommendation with all details
+        Compute every stop loss and take profit price for many setups at once
 
         Args:
-            df: DataFrame with indicators
-            signals: Dictionary of signal types
-            timeframe: Timeframe being analyzed
+            close: Latest close per setup, shape (N,)
+            atr: ATR per setup, shape (N,)
+            recommendations: Recommendation per setup
 
         Returns:
-            Complete recommendation dictionary
+            (N, len(LEVEL_KEYS)) float array ordered as LEVEL_KEYS; HOLD rows
+            are NaN
         """
-        # Calculate score and recommendation
-        score, recommendation = EnhancedRecommendations.calculate_signal_score(df, signals)
+        close = np.asarray(close, dtype=np.float64)
+        atr = np.asarray(atr, dtype=np.float64)
+        direction = np.array([_DIR.get(rec, 0) for rec in recommendations], dtype=np.float64)
 
-        # Calculate all price levels
-        price_levels = EnhancedRecommendations.calculate_price_levels(df, recommendation)
+        levels = (close[:, None] * (1 + direction[:, None] * _LEVEL_PCT)
+                  + (direction * atr)[:, None] * _LEVEL_ATR_MULT)
+        levels[direction == 0] = np.nan
+        return levels
+
+    @staticmethod
+    def calculate_level_array(df: pd.DataFrame, recommendation: str) -> Dict:
+        """
+        Calculate stop losses and take profits as a flat array plus schema
 
-        # Get latest price data
-        latest = df.iloc[-1]
+        Columnar alternative to calculate_price_levels for batch consumers;
+        ``levels[i]`` is the price for ``schema[i]``.
 
+        Args:
+            df: DataFrame with indicators
+            recommendation: Trading recommendation
+
+        Returns:
+            Dictionary with 'levels', 'schema' and 'descriptions'
+        """
+        close, atr, _, _ = _level_inputs(_last_row(df))
+        levels = EnhancedRecommendations.level_matrix([close], [atr], [recommendation])[0]
         return {
-            'timeframe': timeframe,
-            'recommendation': recommendation,
-            'score': score,
-            'current_price': round(latest['Close'], 5),
-            'ohlc': {
-                'open': round(latest['Open'], 5),
-                'high': round(latest['High'], 5),
-                'low': round(latest['Low'], 5),
-                'close': round(latest['Close'], 5)
-            },
-            **price_levels,
-            'indicators': {
-                'RSI': round(latest.get('RSI', 0), 2) if not pd.isna(latest.get('RSI')) else None,
-                'MACD': round(latest.get('MACD', 0), 5) if not pd.isna(latest.get('MACD')) else None,
-                'MACD_Signal': round(latest.get('MACD_Signal', 0), 5) if not pd.isna(latest.get('MACD_Signal')) else None,
-                'Stoch_K': round(latest.get('Stoch_K', 0), 2) if not pd.isna(latest.get('Stoch_K')) else None,
-                'Stoch_D': round(latest.get('Stoch_D', 0), 2) if not pd.isna(latest.get('Stoch_D')) else None,
-                'ATR': round(latest.get('ATR', 0), 5) if not pd.isna(latest.get('ATR')) else None,
-                'MA_20': round(latest.get('MA_20', 0), 5) if not pd.isna(latest.get('MA_20')) else None,
-                'MA_50': round(latest.get('MA_50', 0), 5) if not pd.isna(latest.get('MA_50')) else None
-            },
-            'timestamp': latest.name if hasattr(latest.name, 'strftime') else latest.get('timestamp', 'N/A')
+            'levels': levels,
+            'schema': LEVEL_KEYS,
+            'descriptions': LEVEL_DESCRIPTIONS
         }
+
@@ -3,18 +3,35 @@ Multi-Timeframe Analysis Module
 Analyzes forex signals across multiple timeframes
 """
 
+import io
 import pandas as pd
 import numpy as np
-from typing import Dict, List
+from typing import Dict, Optional
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from ..indicators.technical_indicators import TechnicalIndicators, SignalGenerator
 from ..indicators.support_resistance import SupportResistance
 from .enhanced_recommendations import EnhancedRecommendations
-from .trend_momentum import TrendMomentumAnalyzer
+from .trend_momentum import TrendMomentumAnalyzer, _DIRECTIONS
 
 logger = logging.getLogger(__name__)
 
+# Fewest bars analyze_timeframe will run the indicator pipeline on
+MIN_BARS = 50
+
+# Fewest bars kept in the results; the app and Scanner chart df.tail(100)
+MIN_DF_TAIL = 100
+
+# Signal encoding used by the vectorized consensus; anything else counts as HOLD
+_SIGNAL_CODES = {'BUY': 1, 'HOLD': 0, 'SELL': -1}
+
+
+def _encode_signals(signals: Dict[str, str]) -> np.ndarray:
+    """Indicator signals as an int8 array (BUY=1, HOLD=0, SELL=-1)"""
+    return np.fromiter((_SIGNAL_CODES.get(v, 0) for v in signals.values()),
+                       dtype=np.int8, count=len(signals))
+
 
 class MultiTimeframeAnalyzer:
     """Analyze forex signals across multiple timeframes"""
@@ -29,6 +46,21 @@ class MultiTimeframeAnalyzer:
         self.config = config
         self.indicator_config = config.get('indicators', {})
 
+        # Resolved once; get_timeframe_consensus runs per report
+        self._tf_weights = config.get('timeframe_weights', {
+            '1d': 0.4,
+            '4h': 0.3,
+            '1h': 0.2,
+            '15m': 0.1
+        })
+        # Keep the confluence dict itself: the GUI edits min_timeframes_agree
+        # in place after construction, so the value is read per call
+        self._confluence = config.get('confluence', {})
+
+        # Bars of each frame kept in the results; every consumer reads the
+        # frame, so smaller settings (including 0) are raised to MIN_DF_TAIL
+        self._keep_df_tail = max(int(config.get('keep_df_tail', 256)), MIN_DF_TAIL)
+
     def analyze_timeframe(self, df: pd.DataFrame, timeframe: str) -> Dict:
         """
         Analyze a single timeframe
@@ -40,7 +72,7 @@ class MultiTimeframeAnalyzer:
         Returns:
             Dictionary with analysis results
         """
-        if df is None or len(df) < 50:
+        if df is None or len(df) < MIN_BARS:
             logger.warning(f"Insufficient data for {timeframe}")
             return None
 
@@ -57,19 +89,23 @@ class MultiTimeframeAnalyzer:
             # Add S/R signal
             signals['support_resistance'] = SupportResistance.get_sr_signal(df)
 
+            # Fetch the last row and the close array once for the helpers
+            last = df.iloc[-1]
+            close = df['Close'].to_numpy()
+
             # Calculate trend strength
-            trend_strength = self._calculate_trend_strength(df)
+            trend_strength = self._calculate_trend_strength(last, close)
 
             # Calculate momentum
-            momentum = self._calculate_momentum(df)
+            momentum = self._calculate_momentum(last)
 
             # Get current values
             current_data = {
-                'price': df['Close'].iloc[-1],
-                'rsi': df['RSI'].iloc[-1] if 'RSI' in df.columns else None,
-                'macd': df['MACD'].iloc[-1] if 'MACD' in df.columns else None,
-                'atr': df['ATR'].iloc[-1] if 'ATR' in df.columns else None,
-                'volume': df['Volume'].iloc[-1],
+                'price': last['Close'],
+                'rsi': last['RSI'] if 'RSI' in last else None,
+                'macd': last['MACD'] if 'MACD' in last else None,
+                'atr': last['ATR'] if 'ATR' in last else None,
+                'volume': last['Volume'],
             }
 
             # Get support/resistance levels
@@ -80,31 +116,20 @@ class MultiTimeframeAnalyzer:
                 df, signals, timeframe
             )
 
-            # NEW: Calculate trend momentum from historical candles
-            trend_momentum = TrendMomentumAnalyzer.calculate_trend_momentum(df, lookback=20)
-
-            # NEW: Detect potential reversals
-            reversal_detection = TrendMomentumAnalyzer.detect_reversal(
-                df, recent_lookback=5, historical_lookback=20
-            )
-
             # Get current consensus signal from indicators
-            tf_signals = list(signals.values())
-            tf_buy = tf_signals.count('BUY')
-            tf_sell = tf_signals.count('SELL')
-
-            if tf_buy > tf_sell:
-                current_consensus = 'BUY'
-            elif tf_sell > tf_buy:
-                current_consensus = 'SELL'
-            else:
-                current_consensus = 'HOLD'
+            sign = int(_encode_signals(signals).sum())
+            current_consensus = ('SELL', 'HOLD', 'BUY')[(sign > 0) - (sign < 0) + 1]
 
             # NEW: Get enhanced signal with momentum and reversal consideration
             enhanced_signal_analysis = TrendMomentumAnalyzer.get_enhanced_analysis(
                 df, current_consensus
             )
 
+            # Trend momentum and reversal detection come from the same fused
+            # pass (lookback 20, reversal 5 vs 20) as the enhanced signal
+            trend_momentum = enhanced_signal_analysis['momentum']
+            reversal_detection = enhanced_signal_analysis['reversal']
+
             return {
                 'timeframe': timeframe,
                 'signals': signals,
@@ -119,7 +144,7 @@ class MultiTimeframeAnalyzer:
                 'current_data': current_data,
                 'support_levels': sr_levels['support'],
                 'resistance_levels': sr_levels['resistance'],
-                'dataframe': df,
+                'dataframe': self._frame_tail(df),
                 'enhanced_recommendation': enhanced_rec,
                 'signal_changed': enhanced_signal_analysis['signal_changed']  # NEW: Did signal change?
             }
@@ -128,12 +153,27 @@ class MultiTimeframeAnalyzer:
             logger.error(f"Error analyzing {timeframe}: {e}")
             return None
 
-    def _calculate_trend_strength(self, df: pd.DataFrame) -> float:
+    def _frame_tail(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Copy of the last bars for the result dict
+
+        Copying (rather than slicing) lets the full frame be freed.
+
+        Args:
+            df: Analyzed DataFrame
+
+        Returns:
+            Last keep_df_tail bars
+        """
+        return df.iloc[-self._keep_df_tail:].copy()
+
+    def _calculate_trend_strength(self, last: pd.Series, close: np.ndarray) -> float:
         """
         Calculate trend strength from 0 (no trend) to 1 (strong trend)
 
         Args:
-            df: DataFrame with indicators
+            last: Last row of the DataFrame with indicators
+            close: Close prices as a NumPy array
 
         Returns:
             Trend strength score
@@ -141,10 +181,10 @@ class MultiTimeframeAnalyzer:
         scores = []
 
         # MA alignment
-        if all(col in df.columns for col in ['MA_20', 'MA_50', 'MA_200']):
-            ma20 = df['MA_20'].iloc[-1]
-            ma50 = df['MA_50'].iloc[-1]
-            ma200 = df['MA_200'].iloc[-1]
+        if all(col in last for col in ['MA_20', 'MA_50', 'MA_200']):
+            ma20 = last['MA_20']
+            ma50 = last['MA_50']
+            ma200 = last['MA_200']
 
             # Bullish alignment
             if ma20 > ma50 > ma200:
@@ -156,54 +196,41 @@ class MultiTimeframeAnalyzer:
                 scores.append(0.3)
 
         # ADX would be ideal here, but we'll use price momentum
-        if len(df) >= 20:
-            price_change = (df['Close'].iloc[-1] - df['Close'].iloc[-20]) / df['Close'].iloc[-20]
+        if len(close) >= 20:
+            price_change = (close[-1] - close[-20]) / close[-20]
             momentum_score = min(abs(price_change) * 10, 1.0)  # Scale to 0-1
             scores.append(momentum_score)
 
-        return np.mean(scores) if scores else 0.5
+        # At most two scores; plain arithmetic avoids an np.asarray round trip
+        return (sum(scores) / len(scores)) if scores else 0.5
 
-    def _calculate_momentum(self, df: pd.DataFrame) -> str:
+    def _calculate_momentum(self, last: pd.Series) -> str:
         """
         Calculate overall momentum direction
 
         Args:
-            df: DataFrame with indicators
+            last: Last row of the DataFrame with indicators
 
         Returns:
             'BULLISH', 'BEARISH', or 'NEUTRAL'
         """
-        bullish_count = 0
-        bearish_count = 0
+        # One signed tally: +1 per bullish check, -1 per bearish check
+        score = 0
 
-        # Check RSI
-        if 'RSI' in df.columns:
-            rsi = df['RSI'].iloc[-1]
-            if rsi > 50:
-                bullish_count += 1
-            elif rsi < 50:
-                bearish_count += 1
+        # Check RSI (exactly 50 counts for neither side)
+        if 'RSI' in last:
+            rsi = last['RSI']
+            score += int(rsi > 50) - int(rsi < 50)
 
         # Check MACD
-        if 'MACD' in df.columns and 'MACD_Signal' in df.columns:
-            if df['MACD'].iloc[-1] > df['MACD_Signal'].iloc[-1]:
-                bullish_count += 1
-            else:
-                bearish_count += 1
+        if 'MACD' in last and 'MACD_Signal' in last:
+            score += 2 * int(last['MACD'] > last['MACD_Signal']) - 1
 
         # Check price vs MA
-        if 'MA_50' in df.columns:
-            if df['Close'].iloc[-1] > df['MA_50'].iloc[-1]:
-                bullish_count += 1
-            else:
-                bearish_count += 1
+        if 'MA_50' in last:
+            score += 2 * int(last['Close'] > last['MA_50']) - 1
 
-        if bullish_count > bearish_count:
-            return 'BULLISH'
-        elif bearish_count > bullish_count:
-            return 'BEARISH'
-        else:
-            return 'NEUTRAL'
+        return _DIRECTIONS[(score > 0) - (score < 0) + 1]
 
     def analyze_multiple_timeframes(
         self,
@@ -220,14 +247,62 @@ class MultiTimeframeAnalyzer:
         """
         results = {}
 
-        for timeframe, df in data_dict.items():
-            logger.info(f"Analyzing {timeframe}")
-            analysis = self.analyze_timeframe(df, timeframe)
-            if analysis:
-                results[timeframe] = analysis
+        if len(data_dict) <= 1:
+            for timeframe, df in data_dict.items():
+                logger.info(f"Analyzing {timeframe}")
+                analysis = self.analyze_timeframe(df, timeframe)
+                if analysis:
+                    results[timeframe] = analysis
+            return results
+
+        # Timeframes are independent and the indicator work is mostly NumPy,
+        # which releases the GIL. analyze_timeframe only reads self.config,
+        # so it is safe to run concurrently.
+        with ThreadPoolExecutor(max_workers=len(data_dict)) as executor:
+            futures = {}
+            for timeframe, df in data_dict.items():
+                logger.info(f"Analyzing {timeframe}")
+                futures[timeframe] = executor.submit(self.analyze_timeframe, df, timeframe)
+
+            # Collect in submission order so results keep the input ordering
+            for timeframe, future in futures.items():
+                analysis = future.result()
+                if analysis:
+                    results[timeframe] = analysis
 
         return results
 
+    def analyze_many_symbols(
+        self,
+        data_by_symbol: Dict[str, Dict[str, pd.DataFrame]],
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Dict[str, Dict]]:
+        """
+        Analyze multiple timeframes for many symbols in worker processes
+
+        Symbols are independent, and most of the indicator work holds the
+        GIL, so screens over many symbols fan out across processes. Each
+        worker builds its own analyzer from this config once.
+
+        Args:
+            data_by_symbol: Dictionary mapping symbol to a timeframe -> DataFrame dict
+            max_workers: Worker processes (default: CPU count)
+
+        Returns:
+            Dictionary mapping symbol to analyze_multiple_timeframes results
+        """
+        if len(data_by_symbol) <= 1:
+            return {symbol: self.analyze_multiple_timeframes(data_dict)
+                    for symbol, data_dict in data_by_symbol.items()}
+
+        symbols = list(data_by_symbol)
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_symbol_worker,
+                                 initargs=(self.config,)) as executor:
+            results = executor.map(_analyze_symbol_worker,
+                                   (data_by_symbol[symbol] for symbol in symbols))
+            return dict(zip(symbols, results))
+
     def get_timeframe_consensus(self, analyses: Dict[str, Dict]) -> Dict:
         """
         Get consensus across all timeframes
@@ -246,62 +321,55 @@ class MultiTimeframeAnalyzer:
                 'confidence': 0.0
             }
 
-        # Count signals across all timeframes
-        buy_count = 0
-        sell_count = 0
-        hold_count = 0
-
+        # Encode each timeframe's signal, weight and confidence once so the
+        # weighted tallies become a couple of NumPy reductions
+        tf_list = list(analyses.items())
+        signals = np.fromiter(
+            (_SIGNAL_CODES.get(
+                a.get('enhanced_signal', a.get('current_consensus', 'HOLD')), 0)
+             for _, a in tf_list),
+            dtype=np.int8, count=len(tf_list)
+        )
         # Weight signals by timeframe importance
-        timeframe_weights = self.config.get('timeframe_weights', {
-            '1d': 0.4,
-            '4h': 0.3,
-            '1h': 0.2,
-            '15m': 0.1
-        })
-
-        weighted_buy = 0.0
-        weighted_sell = 0.0
+        timeframe_weights = self._tf_weights
+        weights = np.fromiter(
+            (timeframe_weights.get(tf, 0.1) for tf, _ in tf_list),
+            dtype=np.float64, count=len(tf_list)
+        )
+        conf = np.fromiter(
+            (a.get('signal_confidence', 0.5) for _, a in tf_list),
+            dtype=np.float64, count=len(tf_list)
+        )
+
+        # Apply confidence weighting (stronger signals get more weight)
+        cw = weights * conf
+        weighted_buy = float(cw[signals == 1].sum())
+        weighted_sell = float(cw[signals == -1].sum())
+        sell_count, hold_count, buy_count = (
+            int(c) for c in np.bincount(signals + 1, minlength=3)
+        )
 
         # NEW: Track timeframes with reversals for additional context
         reversals_detected = []
-
-        for tf, analysis in analyses.items():
-            weight = timeframe_weights.get(tf, 0.1)
-
-            # NEW: Use enhanced signal instead of just indicator signals
-            # This considers historical momentum and reversals
-            enhanced_signal = analysis.get('enhanced_signal', analysis.get('current_consensus', 'HOLD'))
-            signal_confidence = analysis.get('signal_confidence', 0.5)
-
-            # Apply confidence weighting (stronger signals get more weight)
-            confidence_weight = weight * signal_confidence
-
-            # Check for reversal warnings
-            if analysis.get('reversal_detection', {}).get('is_reversal', False):
+        for tf, analysis in tf_list:
+            reversal = analysis.get('reversal_detection')
+            if reversal and reversal.get('is_reversal', False):
                 reversals_detected.append({
                     'timeframe': tf,
-                    'type': analysis['reversal_detection']['reversal_type'],
-                    'strength': analysis['reversal_detection']['reversal_strength'],
-                    'warning_level': analysis['reversal_detection']['warning_level']
+                    'type': reversal['reversal_type'],
+                    'strength': reversal['reversal_strength'],
+                    'warning_level': reversal['warning_level']
                 })
 
-            if enhanced_signal == 'BUY':
-                buy_count += 1
-                weighted_buy += confidence_weight
-            elif enhanced_signal == 'SELL':
-                sell_count += 1
-                weighted_sell += confidence_weight
-            else:
-                hold_count += 1
-
         # Determine consensus
         total_timeframes = len(analyses)
+        min_agree = self._confluence.get('min_timeframes_agree', 3)
 
-        if weighted_buy > weighted_sell and buy_count >= self.config.get('confluence', {}).get('min_timeframes_agree', 3):
+        if weighted_buy > weighted_sell and buy_count >= min_agree:
             consensus = 'BUY'
             agreement_count = buy_count
             confidence = weighted_buy
-        elif weighted_sell > weighted_buy and sell_count >= self.config.get('confluence', {}).get('min_timeframes_agree', 3):
+        elif weighted_sell > weighted_buy and sell_count >= min_agree:
             consensus = 'SELL'
             agreement_count = sell_count
             confidence = weighted_sell
@@ -335,50 +403,71 @@ class MultiTimeframeAnalyzer:
         if not analyses:
             return "No analysis data available"
 
-        report = []
-        report.append("=" * 60)
-        report.append("MULTI-TIMEFRAME FOREX ANALYSIS REPORT")
-        report.append("=" * 60)
+        buf = io.StringIO()
+        w = buf.write
+        rule = "=" * 60 + "\n"
+        thin_rule = "-" * 60 + "\n"
+
+        w(rule)
+        w("MULTI-TIMEFRAME FOREX ANALYSIS REPORT\n")
+        w(rule)
 
         # Overall consensus
         consensus = self.get_timeframe_consensus(analyses)
-        report.append(f"\nOVERALL CONSENSUS: {consensus['consensus']}")
-        report.append(f"Confidence: {consensus['confidence']:.2%}")
-        report.append(f"Agreement: {consensus['agreement_count']}/{consensus['total_timeframes']} timeframes")
+        w(f"\nOVERALL CONSENSUS: {consensus['consensus']}\n"
+          f"Confidence: {consensus['confidence']:.2%}\n"
+          f"Agreement: {consensus['agreement_count']}/{consensus['total_timeframes']} timeframes\n")
 
         # Individual timeframe details
-        report.append("\n" + "-" * 60)
-        report.append("TIMEFRAME BREAKDOWN")
-        report.append("-" * 60)
+        w("\n" + thin_rule)
+        w("TIMEFRAME BREAKDOWN\n")
+        w(thin_rule)
 
         for tf in ['1d', '4h', '1h', '15m']:
             if tf not in analyses:
                 continue
 
             analysis = analyses[tf]
-            report.append(f"\n[{tf.upper()}] Timeframe:")
-            report.append(f"  Price: {analysis['current_data']['price']:.5f}")
-            report.append(f"  Trend Strength: {analysis['trend_strength']:.2%}")
-            report.append(f"  Momentum: {analysis['momentum']}")
+            tf_upper = tf.upper()
+            w(f"\n[{tf_upper}] Timeframe:\n"
+              f"  Price: {analysis['current_data']['price']:.5f}\n"
+              f"  Trend Strength: {analysis['trend_strength']:.2%}\n"
+              f"  Momentum: {analysis['momentum']}\n")
 
             # Signals
             signals = analysis['signals']
-            buy_signals = sum(1 for s in signals.values() if s == 'BUY')
-            sell_signals = sum(1 for s in signals.values() if s == 'SELL')
+            codes = _encode_signals(signals)
+            buy_signals = int((codes == 1).sum())
+            sell_signals = int((codes == -1).sum())
 
-            report.append(f"  Signals: {buy_signals} BUY, {sell_signals} SELL")
-            report.append(f"    - MA Cross: {signals.get('ma_cross', 'N/A')}")
-            report.append(f"    - RSI: {signals.get('rsi', 'N/A')}")
-            report.append(f"    - MACD: {signals.get('macd', 'N/A')}")
-            report.append(f"    - Stochastic: {signals.get('stochastic', 'N/A')}")
-            report.append(f"    - S/R: {signals.get('support_resistance', 'N/A')}")
+            w(f"  Signals: {buy_signals} BUY, {sell_signals} SELL\n"
+              f"    - MA Cross: {signals.get('ma_cross', 'N/A')}\n"
+              f"    - RSI: {signals.get('rsi', 'N/A')}\n"
+              f"    - MACD: {signals.get('macd', 'N/A')}\n"
+              f"    - Stochastic: {signals.get('stochastic', 'N/A')}\n"
+              f"    - S/R: {signals.get('support_resistance', 'N/A')}\n")
 
             # Key levels
             if analysis['support_levels']:
-                report.append(f"  Support: {', '.join([f'{s:.5f}' for s in analysis['support_levels'][:3]])}")
+                w(f"  Support: {', '.join([f'{s:.5f}' for s in analysis['support_levels'][:3]])}\n")
             if analysis['resistance_levels']:
-                report.append(f"  Resistance: {', '.join([f'{r:.5f}' for r in analysis['resistance_levels'][:3]])}")
+                w(f"  Resistance: {', '.join([f'{r:.5f}' for r in analysis['resistance_levels'][:3]])}\n")
+
+        w("\n" + "=" * 60)
+
+        return buf.getvalue()
+
+
+# Per-process analyzer for analyze_many_symbols, built once by the pool initializer
+_worker_analyzer = None
+
+
+def _init_symbol_worker(config: Dict):
+    """Create the worker process's analyzer"""
+    global _worker_analyzer
+    _worker_analyzer = MultiTimeframeAnalyzer(config)
 
-        report.append("\n" + "=" * 60)
 
-        return "\n".join(report)
+def _analyze_symbol_worker(data_dict: Dict[str, pd.DataFrame]) -> Dict[str, Dict]:
+    """Analyze one symbol's timeframes in a worker process"""
+    return _worker_analyzer.analyze_multiple_timeframes(data_dict)
@@ -5,11 +5,291 @@ Analyzes historical candles to detect trend strength and potential reversals
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple
+from typing import Dict, NamedTuple, Tuple
 import logging
+from functools import lru_cache
+from math import isfinite
+
+from ._momentum_jit import _momentum_kernel
 
 logger = logging.getLogger(__name__)
 
+# Momentum/reversal strengths are quantized to 0.1% before the signal cache
+_SCORE_QUANTUM = 1000
+
+_EMPTY = np.empty(0, dtype=np.float32)
+
+# Direction labels indexed by direction code + 1
+_DIRECTIONS = ('BEARISH', 'NEUTRAL', 'BULLISH')
+
+# Signals as numeric scores (-1 to +1)
+_SIGNAL_SCORE = {'BUY': 1.0, 'SELL': -1.0, 'HOLD': 0.0}
+
+
+class MomentumResult(NamedTuple):
+    """Momentum metrics for one window of candles"""
+    direction: str
+    strength: float
+    consistency: float
+    momentum_score: float
+    price_change_pct: float
+    bullish_candles: int
+    bearish_candles: int
+    higher_highs: int
+    lower_lows: int
+    volume_trend: float
+
+    def to_dict(self) -> Dict:
+        """Plain dict for display and serialization"""
+        return dict(self._asdict())
+
+
+# Results for windows shorter than the lookback
+_NO_MOMENTUM = MomentumResult(
+    direction='NEUTRAL',
+    strength=0.0,
+    consistency=0.0,
+    momentum_score=0.0,
+    price_change_pct=0.0,
+    bullish_candles=0,
+    bearish_candles=0,
+    higher_highs=0,
+    lower_lows=0,
+    volume_trend=1.0
+)
+_NO_REVERSAL = {
+    'is_reversal': False,
+    'reversal_strength': 0.0,
+    'reversal_type': 'NONE',
+    'previous_trend': 'NEUTRAL',
+    'warning_level': 'LOW'
+}
+
+
+def _column_array(df: pd.DataFrame, column: str) -> np.ndarray:
+    """
+    Column as a float32 NumPy array for the momentum kernel
+
+    The kernel only compares neighbouring candles and takes ratios that are
+    thresholded at one or two decimals, so single precision is plenty and
+    halves the bytes it streams. Reported prices still come from the
+    float64 DataFrame.
+    """
+    return df[column].to_numpy(dtype=np.float32)
+
+
+def _ohlcv_arrays(df: pd.DataFrame) -> Tuple[np.ndarray, ...]:
+    """
+    Open, Close, High, Low and Volume arrays for the momentum kernel
+
+    Volume is an empty array when the column is missing.
+    """
+    volume = _column_array(df, 'Volume') if 'Volume' in df.columns else _EMPTY
+    return (_column_array(df, 'Open'), _column_array(df, 'Close'),
+            _column_array(df, 'High'), _column_array(df, 'Low'), volume)
+
+
+def _momentum_from_arrays(arrays: Tuple[np.ndarray, ...], lookback: int) -> MomentumResult:
+    """
+    Momentum metrics for the last `lookback` bars of the OHLCV arrays
+
+    Args:
+        arrays: Tuple from _ohlcv_arrays (or slices of it)
+        lookback: Number of candles to analyze
+
+    Returns:
+        MomentumResult with momentum metrics
+    """
+    open_, close, high, low, volume = arrays
+    if len(close) < lookback:
+        return _NO_MOMENTUM
+
+    # Count candles, highs/lows pattern and volume in one pass over the
+    # last `lookback` bars (numba-compiled when available)
+    (bullish_candles, bearish_candles, price_change, higher_highs, lower_lows,
+     vol_head_mean, vol_tail_mean, direction_code) = _momentum_kernel(
+        open_, close, high, low, volume, lookback)
+
+    # Price momentum as percentage (the kernel works in float32)
+    price_momentum = float(price_change) * 100
+
+    # Momentum consistency (are candles mostly in same direction?)
+    total_candles = lookback
+    consistency = max(bullish_candles, bearish_candles) / total_candles
+
+    # Volume-weighted momentum (if volume available; flat when the opening
+    # candles traded nothing, e.g. forex feeds without real volume)
+    if volume.size and vol_head_mean != 0:
+        volume_trend = float(vol_tail_mean / vol_head_mean)
+    else:
+        volume_trend = 1.0
+
+    # Direction and strength from the kernel's -1/0/1 code: candle share on
+    # the biased side, 0.5 when neither side dominates
+    index = direction_code + 1
+    direction = _DIRECTIONS[index]
+    strength = (bearish_candles / total_candles, 0.5, bullish_candles / total_candles)[index]
+    pattern = (lower_lows, lower_lows, higher_highs)[index]
+
+    # Calculate overall momentum score (0-1)
+    momentum_score = (
+        consistency * 0.3 +  # 30% weight on consistency
+        abs(price_momentum) / 10 * 0.3 +  # 30% weight on price change
+        strength * 0.2 +  # 20% weight on candle direction
+        pattern / (total_candles - 1) * 0.2  # 20% on pattern
+    )
+    momentum_score = min(momentum_score, 1.0)  # Cap at 1.0
+
+    return MomentumResult(
+        direction=direction,
+        strength=strength,
+        consistency=consistency,
+        momentum_score=momentum_score,
+        price_change_pct=price_momentum,
+        bullish_candles=bullish_candles,
+        bearish_candles=bearish_candles,
+        higher_highs=higher_highs,
+        lower_lows=lower_lows,
+        volume_trend=volume_trend
+    )
+
+
+def _warn_level(consistency: float) -> str:
+    """Warning level based on how sudden (consistent) a reversal is"""
+    return 'HIGH' if consistency > 0.7 else 'MEDIUM' if consistency > 0.5 else 'LOW'
+
+
+def _reversal_from_momentum(historical_momentum: MomentumResult,
+                            recent_momentum: MomentumResult) -> Dict:
+    """
+    Compare a historical and a recent momentum window for a reversal
+
+    Args:
+        historical_momentum: Momentum of the candles before the recent window
+        recent_momentum: Momentum of the recent candles
+
+    Returns:
+        Dictionary with reversal detection info
+    """
+    # Detect reversal: strong historical trend + opposite recent movement
+    is_reversal = False
+    reversal_strength = 0.0
+    reversal_type = 'NONE'
+    warning_level = 'LOW'
+
+    # Check if historical trend was strong
+    if historical_momentum.momentum_score > 0.6:  # Strong trend threshold
+
+        # Check if recent candles show opposite direction
+        if historical_momentum.direction == 'BULLISH' and recent_momentum.direction == 'BEARISH':
+            # Bullish to Bearish reversal
+            is_reversal = True
+            reversal_type = 'BULLISH_TO_BEARISH'
+            reversal_strength = recent_momentum.consistency
+            warning_level = _warn_level(recent_momentum.consistency)
+
+        elif historical_momentum.direction == 'BEARISH' and recent_momentum.direction == 'BULLISH':
+            # Bearish to Bullish reversal
+            is_reversal = True
+            reversal_type = 'BEARISH_TO_BULLISH'
+            reversal_strength = recent_momentum.consistency
+            warning_level = _warn_level(recent_momentum.consistency)
+
+    return {
+        'is_reversal': is_reversal,
+        'reversal_strength': reversal_strength,
+        'reversal_type': reversal_type,
+        'previous_trend': historical_momentum.direction,
+        'previous_trend_strength': historical_momentum.momentum_score,
+        'recent_trend': recent_momentum.direction,
+        'recent_trend_strength': recent_momentum.momentum_score,
+        'warning_level': warning_level,
+        'historical_momentum': historical_momentum.to_dict(),
+        'recent_momentum': recent_momentum.to_dict()
+    }
+
+
+@lru_cache(maxsize=4096)
+def _weighted_signal_core(current_signal: str, momentum_direction: str,
+                          momentum_strength: float, reversal_type: str,
+                          reversal_strength: float, warning_level: str,
+                          current_weight: float, momentum_weight: float,
+                          reversal_weight: float) -> Tuple[str, float, str]:
+    """
+    Weighted signal from already-extracted inputs (memoized)
+
+    reversal_type is None when no reversal was detected. Callers quantize
+    the strengths first so screens over many symbols hit the cache;
+    ``_weighted_signal_core.cache_info()`` reports the hit rate.
+
+    Returns:
+        Tuple of (final_signal, confidence, reasoning)
+    """
+    # 1. Current signal score
+    current_score = _SIGNAL_SCORE.get(current_signal, 0.0)
+
+    # 2. Momentum score
+    if momentum_direction == 'BULLISH':
+        momentum_score = momentum_strength
+    elif momentum_direction == 'BEARISH':
+        momentum_score = -momentum_strength
+    else:
+        momentum_score = 0.0
+
+    # 3. Reversal adjustment
+    reversal_score = 0.0
+    reversal_reasoning = ""
+
+    if reversal_type is not None:
+        if reversal_type == 'BULLISH_TO_BEARISH':
+            # Was bullish, now turning bearish
+            reversal_score = -reversal_strength
+            reversal_reasoning = f"⚠️ REVERSAL DETECTED: Strong bullish trend reversing to bearish ({warning_level} confidence)"
+
+        elif reversal_type == 'BEARISH_TO_BULLISH':
+            # Was bearish, now turning bullish
+            reversal_score = reversal_strength
+            reversal_reasoning = f"⚠️ REVERSAL DETECTED: Strong bearish trend reversing to bullish ({warning_level} confidence)"
+
+    # Calculate weighted final score
+    final_score = (
+        current_score * current_weight +
+        momentum_score * momentum_weight +
+        reversal_score * reversal_weight
+    )
+
+    # Determine final signal
+    if final_score > 0.3:
+        final_signal = 'BUY'
+    elif final_score < -0.3:
+        final_signal = 'SELL'
+    else:
+        final_signal = 'HOLD'
+
+    # Calculate confidence (0-1)
+    confidence = min(abs(final_score), 1.0)
+
+    # Build reasoning
+    reasoning_parts = []
+
+    if current_signal != 'HOLD':
+        reasoning_parts.append(f"Current indicators suggest {current_signal}")
+
+    if momentum_direction != 'NEUTRAL':
+        reasoning_parts.append(
+            f"Historical momentum is {momentum_direction} (strength: {momentum_strength:.1%})"
+        )
+
+    if reversal_reasoning:
+        reasoning_parts.append(reversal_reasoning)
+
+    if not reasoning_parts:
+        reasoning_parts.append("No clear signal - market is neutral")
+
+    reasoning = " | ".join(reasoning_parts)
+
+    return final_signal, confidence, reasoning
+
 
 class TrendMomentumAnalyzer:
     """
@@ -30,73 +310,9 @@ class TrendMomentumAnalyzer:
             Dictionary with momentum metrics
         """
         if len(df) < lookback:
-            return {
-                'direction': 'NEUTRAL',
-                'strength': 0.0,
-                'consistency': 0.0,
-                'momentum_score': 0.0
-            }
-
-        # Get recent candles
-        recent_df = df.iloc[-lookback:]
-
-        # 1. Calculate directional movement
-        bullish_candles = (recent_df['Close'] > recent_df['Open']).sum()
-        bearish_candles = (recent_df['Close'] < recent_df['Open']).sum()
-
-        # 2. Calculate price momentum
-        price_change = (recent_df['Close'].iloc[-1] - recent_df['Close'].iloc[0]) / recent_df['Close'].iloc[0]
-        price_momentum = price_change * 100  # As percentage
-
-        # 3. Calculate momentum consistency (are candles mostly in same direction?)
-        total_candles = len(recent_df)
-        consistency = max(bullish_candles, bearish_candles) / total_candles
-
-        # 4. Calculate higher highs / lower lows pattern
-        highs = recent_df['High'].values
-        lows = recent_df['Low'].values
+            return _NO_MOMENTUM.to_dict()
 
-        higher_highs = sum(1 for i in range(1, len(highs)) if highs[i] > highs[i-1])
-        lower_lows = sum(1 for i in range(1, len(lows)) if lows[i] < lows[i-1])
-
-        # 5. Calculate volume-weighted momentum (if volume available)
-        if 'Volume' in recent_df.columns:
-            volume_trend = recent_df['Volume'].iloc[-5:].mean() / recent_df['Volume'].iloc[:5].mean()
-        else:
-            volume_trend = 1.0
-
-        # Determine direction and strength
-        if bullish_candles > bearish_candles * 1.5:  # Strong bullish bias
-            direction = 'BULLISH'
-            strength = (bullish_candles / total_candles)
-        elif bearish_candles > bullish_candles * 1.5:  # Strong bearish bias
-            direction = 'BEARISH'
-            strength = (bearish_candles / total_candles)
-        else:
-            direction = 'NEUTRAL'
-            strength = 0.5
-
-        # Calculate overall momentum score (0-1)
-        momentum_score = (
-            consistency * 0.3 +  # 30% weight on consistency
-            abs(price_momentum) / 10 * 0.3 +  # 30% weight on price change
-            strength * 0.2 +  # 20% weight on candle direction
-            (higher_highs if direction == 'BULLISH' else lower_lows) / (total_candles - 1) * 0.2  # 20% on pattern
-        )
-        momentum_score = min(momentum_score, 1.0)  # Cap at 1.0
-
-        return {
-            'direction': direction,
-            'strength': strength,
-            'consistency': consistency,
-            'momentum_score': momentum_score,
-            'price_change_pct': price_momentum,
-            'bullish_candles': bullish_candles,
-            'bearish_candles': bearish_candles,
-            'higher_highs': higher_highs,
-            'lower_lows': lower_lows,
-            'volume_trend': volume_trend
-        }
+        return _momentum_from_arrays(_ohlcv_arrays(df), lookback).to_dict()
 
     @staticmethod
     def detect_reversal(df: pd.DataFrame, recent_lookback: int = 5, historical_lookback: int = 20) -> Dict:
@@ -112,71 +328,19 @@ class TrendMomentumAnalyzer:
             Dictionary with reversal detection info
         """
         if len(df) < historical_lookback + recent_lookback:
-            return {
-                'is_reversal': False,
-                'reversal_strength': 0.0,
-                'reversal_type': 'NONE',
-                'previous_trend': 'NEUTRAL',
-                'warning_level': 'LOW'
-            }
+            return dict(_NO_REVERSAL)
+
+        # Slice the combined window once; both windows are views into it
+        tail = _ohlcv_arrays(df.iloc[-(historical_lookback + recent_lookback):])
 
         # Analyze historical trend (excluding recent candles)
-        historical_df = df.iloc[-(historical_lookback + recent_lookback):-recent_lookback]
-        historical_momentum = TrendMomentumAnalyzer.calculate_trend_momentum(historical_df, historical_lookback)
-
-        # Analyze recent candles
-        recent_df = df.iloc[-recent_lookback:]
-        recent_momentum = TrendMomentumAnalyzer.calculate_trend_momentum(recent_df, recent_lookback)
-
-        # Detect reversal: strong historical trend + opposite recent movement
-        is_reversal = False
-        reversal_strength = 0.0
-        reversal_type = 'NONE'
-        warning_level = 'LOW'
-
-        # Check if historical trend was strong
-        if historical_momentum['momentum_score'] > 0.6:  # Strong trend threshold
-
-            # Check if recent candles show opposite direction
-            if historical_momentum['direction'] == 'BULLISH' and recent_momentum['direction'] == 'BEARISH':
-                # Bullish to Bearish reversal
-                is_reversal = True
-                reversal_type = 'BULLISH_TO_BEARISH'
-                reversal_strength = recent_momentum['consistency']
-
-                # Warning level based on how sudden the reversal is
-                if recent_momentum['consistency'] > 0.7:
-                    warning_level = 'HIGH'  # Very sudden reversal
-                elif recent_momentum['consistency'] > 0.5:
-                    warning_level = 'MEDIUM'
-                else:
-                    warning_level = 'LOW'
-
-            elif historical_momentum['direction'] == 'BEARISH' and recent_momentum['direction'] == 'BULLISH':
-                # Bearish to Bullish reversal
-                is_reversal = True
-                reversal_type = 'BEARISH_TO_BULLISH'
-                reversal_strength = recent_momentum['consistency']
-
-                if recent_momentum['consistency'] > 0.7:
-                    warning_level = 'HIGH'
-                elif recent_momentum['consistency'] > 0.5:
-                    warning_level = 'MEDIUM'
-                else:
-                    warning_level = 'LOW'
+        historical_momentum = _momentum_from_arrays(
+            tuple(arr[:historical_lookback] for arr in tail), historical_lookback)
 
-        return {
-            'is_reversal': is_reversal,
-            'reversal_strength': reversal_strength,
-            'reversal_type': reversal_type,
-            'previous_trend': historical_momentum['direction'],
-            'previous_trend_strength': historical_momentum['momentum_score'],
-            'recent_trend': recent_momentum['direction'],
-            'recent_trend_strength': recent_momentum['momentum_score'],
-            'warning_level': warning_level,
-            'historical_momentum': historical_momentum,
-            'recent_momentum': recent_momentum
-        }
+        # Analyze recent candles (the kernel reads the last recent_lookback bars)
+        recent_momentum = _momentum_from_arrays(tail, recent_lookback)
+
+        return _reversal_from_momentum(historical_momentum, recent_momentum)
 
     @staticmethod
     def calculate_weighted_signal(
@@ -195,7 +359,7 @@ class TrendMomentumAnalyzer:
 
         Args:
             current_signal: Signal from current candle ('BUY', 'SELL', 'HOLD')
-            momentum: Momentum analysis dict
+            momentum: Momentum analysis result
             reversal: Reversal detection dict
             current_weight: Weight for current signal (default 0.4)
             momentum_weight: Weight for momentum (default 0.4)
@@ -204,80 +368,76 @@ class TrendMomentumAnalyzer:
         Returns:
             Tuple of (final_signal, confidence, reasoning)
         """
-        # Convert signals to numeric scores (-1 to +1)
-        signal_scores = {'BUY': 1.0, 'SELL': -1.0, 'HOLD': 0.0}
-
-        # 1. Current signal score
-        current_score = signal_scores.get(current_signal, 0.0)
-
-        # 2. Momentum score
         momentum_direction = momentum.get('direction', 'NEUTRAL')
         momentum_strength = momentum.get('momentum_score', 0.5)
-
-        if momentum_direction == 'BULLISH':
-            momentum_score = momentum_strength
-        elif momentum_direction == 'BEARISH':
-            momentum_score = -momentum_strength
-        else:
-            momentum_score = 0.0
-
-        # 3. Reversal adjustment
-        reversal_score = 0.0
-        reversal_reasoning = ""
-
         if reversal.get('is_reversal', False):
             reversal_type = reversal.get('reversal_type')
             reversal_strength = reversal.get('reversal_strength', 0.0)
             warning_level = reversal.get('warning_level', 'LOW')
-
-            if reversal_type == 'BULLISH_TO_BEARISH':
-                # Was bullish, now turning bearish
-                reversal_score = -reversal_strength
-                reversal_reasoning = f"⚠️ REVERSAL DETECTED: Strong bullish trend reversing to bearish ({warning_level} confidence)"
-
-            elif reversal_type == 'BEARISH_TO_BULLISH':
-                # Was bearish, now turning bullish
-                reversal_score = reversal_strength
-                reversal_reasoning = f"⚠️ REVERSAL DETECTED: Strong bearish trend reversing to bullish ({warning_level} confidence)"
-
-        # Calculate weighted final score
-        final_score = (
-            current_score * current_weight +
-            momentum_score * momentum_weight +
-            reversal_score * reversal_weight
-        )
-
-        # Determine final signal
-        if final_score > 0.3:
-            final_signal = 'BUY'
-        elif final_score < -0.3:
-            final_signal = 'SELL'
         else:
-            final_signal = 'HOLD'
+            reversal_type = None
+            reversal_strength = 0.0
+            warning_level = 'LOW'
+
+        core = _weighted_signal_core
+        if isfinite(momentum_strength) and isfinite(reversal_strength):
+            # Quantize so repeated market states share a cache entry
+            momentum_strength = round(momentum_strength * _SCORE_QUANTUM) / _SCORE_QUANTUM
+            reversal_strength = round(reversal_strength * _SCORE_QUANTUM) / _SCORE_QUANTUM
+        else:
+            # NaN/inf from gappy data cannot be quantized; compute uncached
+            core = _weighted_signal_core.__wrapped__
 
-        # Calculate confidence (0-1)
-        confidence = min(abs(final_score), 1.0)
+        return core(current_signal, momentum_direction, momentum_strength,
+                    reversal_type, reversal_strength, warning_level,
+                    current_weight, momentum_weight, reversal_weight)
 
-        # Build reasoning
-        reasoning_parts = []
+    @staticmethod
+    def analyze_window_fused(df: pd.DataFrame, recent_lookback: int = 5,
+                             historical_lookback: int = 20, lookback: int = 20) -> Dict:
+        """
+        Compute trend momentum and reversal detection from one slice
 
-        if current_signal != 'HOLD':
-            reasoning_parts.append(f"Current indicators suggest {current_signal}")
+        Equivalent to calculate_trend_momentum(df, lookback) plus
+        detect_reversal(df, recent_lookback, historical_lookback), but the
+        tail of the DataFrame is converted to arrays once and every window
+        is a view into them.
 
-        if momentum_direction != 'NEUTRAL':
-            reasoning_parts.append(
-                f"Historical momentum is {momentum_direction} (strength: {momentum_strength:.1%})"
-            )
+        Args:
+            df: DataFrame with OHLCV data
+            recent_lookback: Recent candles to check for reversal (default 5)
+            historical_lookback: Historical candles to establish trend (default 20)
+            lookback: Candles for the overall momentum (default 20)
 
-        if reversal_reasoning:
-            reasoning_parts.append(reversal_reasoning)
+        Returns:
+            Dictionary with 'momentum', 'historical' and 'recent' momentum
+            dicts ('historical'/'recent' are None when too short) and 'reversal'
+        """
+        span = historical_lookback + recent_lookback
+        arrays = _ohlcv_arrays(df.iloc[-max(span, lookback):])
+        momentum = _momentum_from_arrays(arrays, lookback)
 
-        if not reasoning_parts:
-            reasoning_parts.append("No clear signal - market is neutral")
+        if len(df) < span:
+            return {
+                'momentum': momentum.to_dict(),
+                'historical': None,
+                'recent': None,
+                'reversal': dict(_NO_REVERSAL)
+            }
 
-        reasoning = " | ".join(reasoning_parts)
+        # Windows are views into the same arrays; the kernel reads the last
+        # `lookback` entries of whatever it is given
+        tail = tuple(arr[-span:] for arr in arrays)
+        historical = _momentum_from_arrays(tuple(arr[:historical_lookback] for arr in tail),
+                                           historical_lookback)
+        recent = _momentum_from_arrays(tail, recent_lookback)
 
-        return final_signal, confidence, reasoning
+        return {
+            'momentum': momentum.to_dict(),
+            'historical': historical.to_dict(),
+            'recent': recent.to_dict(),
+            'reversal': _reversal_from_momentum(historical, recent)
+        }
 
     @staticmethod
     def get_enhanced_analysis(df: pd.DataFrame, current_signal: str) -> Dict:
@@ -291,11 +451,11 @@ class TrendMomentumAnalyzer:
         Returns:
             Dictionary with complete analysis
         """
-        # Calculate momentum
-        momentum = TrendMomentumAnalyzer.calculate_trend_momentum(df, lookback=20)
-
-        # Detect reversals
-        reversal = TrendMomentumAnalyzer.detect_reversal(df, recent_lookback=5, historical_lookback=20)
+        # Momentum and reversal windows in one pass over shared arrays
+        window = TrendMomentumAnalyzer.analyze_window_fused(df, recent_lookback=5,
+                                                            historical_lookback=20)
+        momentum = window['momentum']
+        reversal = window['reversal']
 
         # Calculate weighted signal
         final_signal, confidence, reasoning = TrendMomentumAnalyzer.calculate_weighted_signal(
@@ -1,5 +1,5 @@
 """Authentication and Authorization Package"""
 
-from .authentication import Authenticator, Role, Permissions, ROLE_PERMISSIONS
+from .authentication import Authenticator, Role, Permissions, ROLE_PERMISSIONS, get_authenticator
 
-__all__ = ['Authenticator', 'Role', 'Permissions', 'ROLE_PERMISSIONS']
+__all__ = ['Authenticator', 'Role', 'Permissions', 'ROLE_PERMISSIONS', 'get_authenticator']
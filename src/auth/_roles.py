@@ -0,0 +1,64 @@
+"""
+Roles and Permissions
+Shared by the YAML and database authenticators
+"""
+
+from typing import Optional
+
+
+class Role:
+    """User roles with permissions"""
+    ADMIN = "admin"
+    USER = "user"
+
+
+class Permissions:
+    """Permission definitions"""
+    VIEW_ANALYSIS = "view_analysis"
+    REFRESH_DATA = "refresh_data"
+    TRAIN_MODEL = "train_model"
+    SCAN_PAIRS = "scan_pairs"
+    MANAGE_USERS = "manage_users"
+    CHANGE_SETTINGS = "change_settings"
+
+
+# Role-Permission Mapping
+ROLE_PERMISSIONS = {
+    Role.ADMIN: frozenset({
+        Permissions.VIEW_ANALYSIS,
+        Permissions.REFRESH_DATA,
+        Permissions.TRAIN_MODEL,
+        Permissions.SCAN_PAIRS,
+        Permissions.MANAGE_USERS,
+        Permissions.CHANGE_SETTINGS
+    }),
+    Role.USER: frozenset({
+        Permissions.VIEW_ANALYSIS,
+        Permissions.SCAN_PAIRS,
+        # Refresh data and training are NOT included for user role
+    })
+}
+
+
+# One bit per permission, and each role's permissions folded into a mask,
+# so a permission check is a single AND
+_PERM_BIT = {
+    permission: 1 << bit
+    for bit, permission in enumerate((
+        Permissions.VIEW_ANALYSIS,
+        Permissions.REFRESH_DATA,
+        Permissions.TRAIN_MODEL,
+        Permissions.SCAN_PAIRS,
+        Permissions.MANAGE_USERS,
+        Permissions.CHANGE_SETTINGS
+    ))
+}
+_ROLE_MASK = {
+    role: sum(_PERM_BIT[permission] for permission in permissions)
+    for role, permissions in ROLE_PERMISSIONS.items()
+}
+
+
+def _has(role: Optional[str], permission: str) -> bool:
+    """Whether a role grants a permission"""
+    return bool(_ROLE_MASK.get(role, 0) & _PERM_BIT.get(permission, 0))
@@ -7,42 +7,231 @@ import streamlit as st
 import yaml
 import bcrypt
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import hashlib
+import hmac
+import json
 import os
+import threading
+import time
+import logging
+
+from ._roles import Role, Permissions, ROLE_PERMISSIONS, _has
+
+# Permissions and ROLE_PERMISSIONS are re-exported for existing importers
+__all__ = ['Authenticator', 'Role', 'Permissions', 'ROLE_PERMISSIONS', 'get_authenticator']
+
+logger = logging.getLogger(__name__)
+
+# Argon2id for new password hashes when argon2-cffi is installed; bcrypt
+# hashes are still verified and migrated on the next successful login
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+    ARGON2_AVAILABLE = True
+    _PH = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
+except ImportError:
+    ARGON2_AVAILABLE = False
+    _PH = None
+
+# orjson serializes the JSON users store several times faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 'json' keeps users in a JSON file next to the YAML (users.yaml -> users.json);
+# the YAML is then only read to seed that file on first run
+USERS_FORMAT = os.environ.get('USERS_FORMAT', 'yaml').lower()
+
+# libyaml-backed parser/emitter when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# bcrypt and argon2 release the GIL while hashing, so hashes run on worker
+# threads and several can proceed at once
+_HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Parsed users files: path -> (mtime_ns, size, users), least recently used first
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Dict]]" = OrderedDict()
+_YAML_CACHE_MAX = 32
+_YAML_CACHE_LOCK = threading.Lock()
+
+
+def _cache_users(path: str, users: Dict):
+    """Remember the parsed users for the file's current mtime and size"""
+    stat = os.stat(path)
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[path] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(users))
+        _YAML_CACHE.move_to_end(path)
+        if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+
+
+# Recent successful password checks: stored hash -> (keyed password digest,
+# expiry). Only successes are cached, so failed guesses always pay full
+# bcrypt cost; the key is per-process and never stored.
+_VERIFY_CACHE: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+_VERIFY_CACHE_MAX = 64
+_VERIFY_CACHE_TTL = 300.0
+_VERIFY_CACHE_LOCK = threading.Lock()
+_VERIFY_KEY = os.urandom(32)
+
+
+def _new_hash(password: str) -> str:
+    """Hash a password with Argon2id, or bcrypt when argon2-cffi is missing"""
+    if ARGON2_AVAILABLE:
+        return _PH.hash(password)
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+
+
+def _check_hash(password: str, hashed: str) -> bool:
+    """Verify a password against an Argon2 or bcrypt hash"""
+    if hashed.startswith('$argon2'):
+        if not ARGON2_AVAILABLE:
+            logger.error("Argon2 password hash found but argon2-cffi is not installed")
+            return False
+        try:
+            return _PH.verify(hashed, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
 
 
-class Role:
-    """User roles with permissions"""
-    ADMIN = "admin"
-    USER = "user"
-
-
-class Permissions:
-    """Permission definitions"""
-    VIEW_ANALYSIS = "view_analysis"
-    REFRESH_DATA = "refresh_data"
-    TRAIN_MODEL = "train_model"
-    SCAN_PAIRS = "scan_pairs"
-    MANAGE_USERS = "manage_users"
-    CHANGE_SETTINGS = "change_settings"
-
-
-# Role-Permission Mapping
-ROLE_PERMISSIONS = {
-    Role.ADMIN: [
-        Permissions.VIEW_ANALYSIS,
-        Permissions.REFRESH_DATA,
-        Permissions.TRAIN_MODEL,
-        Permissions.SCAN_PAIRS,
-        Permissions.MANAGE_USERS,
-        Permissions.CHANGE_SETTINGS
-    ],
-    Role.USER: [
-        Permissions.VIEW_ANALYSIS,
-        Permissions.SCAN_PAIRS,
-        # Refresh data and training are NOT included for user role
-    ]
+def _needs_rehash(hashed: str) -> bool:
+    """True for hashes that should be upgraded to the current Argon2 parameters"""
+    if not ARGON2_AVAILABLE:
+        return False
+    return not hashed.startswith('$argon2') or _PH.check_needs_rehash(hashed)
+
+
+# Hashes of random bytes, checked for unknown usernames. The bcrypt one is
+# used while the store still holds bcrypt hashes, so unknown names cost the
+# same as those users. Built at import so the first miss is not slower.
+_DUMMY_BCRYPT_HASH = bcrypt.hashpw(os.urandom(16), bcrypt.gensalt()).decode('utf-8')
+_DUMMY_HASH = _new_hash(os.urandom(16).hex()) if ARGON2_AVAILABLE else _DUMMY_BCRYPT_HASH
+
+
+def _password_digest(password: str) -> bytes:
+    """Keyed digest of a password for the verification cache"""
+    return hmac.new(_VERIFY_KEY, password.encode('utf-8'), hashlib.sha256).digest()
+
+
+def _write_json_sidecar(path: str, users: Dict):
+    """
+    Write users as JSON next to the YAML file, tagged with the YAML's mtime
+
+    The YAML stays the source of truth; a sidecar whose mtime no longer
+    matches (e.g. after a hand edit) is ignored on load.
+    """
+    sidecar = path + '.json'
+    try:
+        payload = json.dumps({'_yaml_mtime_ns': os.stat(path).st_mtime_ns, 'users': users})
+    except TypeError:
+        # Hand-edited YAML can hold values JSON cannot (e.g. dates); drop
+        # any old sidecar so it is not trusted
+        if os.path.exists(sidecar):
+            os.remove(sidecar)
+        return
+
+    with open(sidecar, 'w') as file:
+        file.write(payload)
+
+
+def _read_json_sidecar(path: str) -> Optional[Dict]:
+    """Users from the JSON sidecar if it matches the YAML's mtime, else None"""
+    try:
+        with open(path + '.json', 'r') as file:
+            payload = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if payload.get('_yaml_mtime_ns') != os.stat(path).st_mtime_ns:
+        return None
+    return payload.get('users')
+
+
+def _dumps_users(users: Dict) -> bytes:
+    """Serialize users for the JSON store"""
+    # default=str covers dates from hand-edited YAML seeds
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(users, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(users, default=str, indent=2).encode('utf-8')
+
+
+def _loads_users(data: bytes) -> Dict:
+    """Parse the JSON store"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _cached_users(path: str) -> Optional[Dict]:
+    """Copy of the cached users if the file is unchanged, else None"""
+    stat = os.stat(path)
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(path)
+        if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+            return None
+        _YAML_CACHE.move_to_end(path)
+    # Callers mutate the users dict (create/delete/change password)
+    return copy.deepcopy(cached[2])
+
+
+# Session state keys set by login and cleared by logout
+_SESSION_KEYS = ('authenticated', 'username', 'role', 'user_name', 'login_time')
+
+# Sidebar role badge; only colour, emoji and role name vary
+_ROLE_BADGE_TMPL = (
+    '<div style="background-color: {color}; color: white; '
+    'padding: 0.5rem; border-radius: 5px; text-align: center;">'
+    '{emoji} <b>{name}</b></div>'
+)
+
+# Login page markup, built once at import
+_LOGIN_CSS = """
+<style>
+.login-container {
+    max-width: 400px;
+    margin: auto;
+    padding: 2rem;
+    background-color: #f0f2f6;
+    border-radius: 10px;
+    margin-top: 5rem;
+}
+.login-header {
+    text-align: center;
+    color: #1f77b4;
+    margin-bottom: 2rem;
 }
+</style>
+"""
+_LOGIN_HEADER = (
+    '<h1 class="login-header">📈 Forex Analyzer Pro</h1>'
+    '<h3 style="text-align: center;">Login</h3>'
+)
+# Everything above the inputs, sent as one element. The opening
+# login-container div could never wrap the widgets that follow it (each
+# markdown element is closed on its own), so it is kept as the empty box
+# it always rendered as.
+_LOGIN_STATIC_HTML = _LOGIN_CSS + '<div class="login-container"></div>' + _LOGIN_HEADER
+_DEMO_CREDENTIALS = """
+**Demo Credentials:**
+
+👤 **Admin Account:**
+- Username: `admin`
+- Password: `admin123`
+
+👤 **User Account:**
+- Username: `user`
+- Password: `user123`
+"""
 
 
 class Authenticator:
@@ -56,35 +245,90 @@ class Authenticator:
             config_path: Path to user configuration file
         """
         self.config_path = config_path
+        # Primary store when USERS_FORMAT=json, else None
+        self.json_path = (
+            os.path.splitext(config_path)[0] + '.json' if USERS_FORMAT == 'json' else None
+        )
+        self._users_view = None  # get_all_users projection, reset on save
+        # Guards self.users: the get_authenticator instance is shared by sessions
+        self._lock = threading.Lock()
         self.users = self._load_users()
 
     def _load_users(self) -> Dict:
         """Load users from configuration file"""
+        if self.json_path and os.path.exists(self.json_path):
+            return self._load_users_json()
+
         if not os.path.exists(self.config_path):
             # Create default users if file doesn't exist
             return self._create_default_users()
 
         try:
-            with open(self.config_path, 'r') as file:
-                config = yaml.safe_load(file)
-                return config.get('users', {})
+            users = _cached_users(self.config_path)
+            if users is not None:
+                return users
+
+            # JSON sidecar written by _save_users parses much faster than YAML
+            users = _read_json_sidecar(self.config_path)
+            if users is None:
+                with open(self.config_path, 'r') as file:
+                    config = yaml.load(file, Loader=SafeLoader)
+                    users = config.get('users', {})
+
+            _cache_users(self.config_path, users)
+            if self.json_path:
+                # First run in JSON mode: seed the JSON store from the YAML
+                self._save_users(users)
+            return users
         except Exception as e:
             st.error(f"Error loading users: {e}")
             return {}
 
+    def _load_users_json(self) -> Dict:
+        """Load users from the JSON store"""
+        try:
+            users = _cached_users(self.json_path)
+            if users is None:
+                with open(self.json_path, 'rb') as file:
+                    users = _loads_users(file.read())
+                _cache_users(self.json_path, users)
+            return users
+        except Exception as e:
+            st.error(f"Error loading users: {e}")
+            return {}
+
+    def _refresh_users(self):
+        """
+        Reload the users if their file changed since it was last read or saved
+
+        The get_authenticator instance lives for the whole process, so hand
+        edits to the users file are picked up here rather than on restart.
+        """
+        path = self.json_path if self.json_path and os.path.exists(self.json_path) else self.config_path
+        if not os.path.exists(path) or _cached_users(path) is not None:
+            return
+
+        with self._lock:
+            self.users = self._load_users()
+            self._users_view = None
+
     def _create_default_users(self) -> Dict:
         """Create default admin and user accounts"""
+        # Hash both passwords concurrently
+        admin_hash = _HASH_POOL.submit(self._hash_password, 'admin123')
+        user_hash = _HASH_POOL.submit(self._hash_password, 'user123')
+
         default_users = {
             'admin': {
                 'name': 'Administrator',
-                'password': self._hash_password('admin123'),
+                'password': admin_hash.result(),
                 'role': Role.ADMIN,
                 'email': 'admin@forexanalyzer.com',
                 'created': datetime.now().isoformat()
             },
             'user': {
                 'name': 'Demo User',
-                'password': self._hash_password('user123'),
+                'password': user_hash.result(),
                 'role': Role.USER,
                 'email': 'user@forexanalyzer.com',
                 'created': datetime.now().isoformat()
@@ -99,17 +343,50 @@ class Authenticator:
         """Save users to configuration file"""
         os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
 
+        self._users_view = None
+
+        if self.json_path:
+            with open(self.json_path, 'wb') as file:
+                file.write(_dumps_users(users))
+            _cache_users(self.json_path, users)
+            return
+
         config = {'users': users}
         with open(self.config_path, 'w') as file:
-            yaml.dump(config, file, default_flow_style=False)
+            yaml.dump(config, file, Dumper=SafeDumper, default_flow_style=False)
+
+        _write_json_sidecar(self.config_path, users)
+        _cache_users(self.config_path, users)
 
     def _hash_password(self, password: str) -> str:
-        """Hash password using bcrypt"""
-        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        """Hash password using Argon2id (bcrypt without argon2-cffi)"""
+        return _new_hash(password)
 
     def _verify_password(self, password: str, hashed: str) -> bool:
-        """Verify password against hash"""
-        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+        """
+        Verify password against hash
+
+        A password verified against the same stored hash within the last
+        five minutes is accepted from cache instead of re-running bcrypt.
+        Changing the password changes the hash, which invalidates the entry.
+        """
+        digest = _password_digest(password)
+        now = time.monotonic()
+
+        with _VERIFY_CACHE_LOCK:
+            cached = _VERIFY_CACHE.get(hashed)
+        if cached is not None and cached[1] > now and hmac.compare_digest(cached[0], digest):
+            return True
+
+        if not _check_hash(password, hashed):
+            return False
+
+        with _VERIFY_CACHE_LOCK:
+            _VERIFY_CACHE[hashed] = (digest, now + _VERIFY_CACHE_TTL)
+            _VERIFY_CACHE.move_to_end(hashed)
+            if len(_VERIFY_CACHE) > _VERIFY_CACHE_MAX:
+                _VERIFY_CACHE.popitem(last=False)
+        return True
 
     def login(self, username: str, password: str) -> bool:
         """
@@ -122,26 +399,43 @@ class Authenticator:
         Returns:
             True if authentication successful
         """
-        if username not in self.users:
-            return False
+        self._refresh_users()
+
+        # Always run one password check (against a dummy hash for unknown
+        # users) so response time does not reveal which usernames exist
+        user = self.users.get(username)
+        if user is not None:
+            hashed = user['password']
+        else:
+            legacy = any(not u['password'].startswith('$argon2') for u in self.users.values())
+            hashed = _DUMMY_BCRYPT_HASH if legacy else _DUMMY_HASH
+        verified = self._verify_password(password, hashed)
+
+        ok = int(user is not None) & int(verified)
+        if hmac.compare_digest(b'1' if ok else b'0', b'1'):
+            # Migrate legacy bcrypt hashes now that the plaintext is known
+            if _needs_rehash(hashed):
+                new_hash = self._hash_password(password)
+                with self._lock:
+                    user['password'] = new_hash
+                    self._save_users(self.users)
 
-        user = self.users[username]
-        if self._verify_password(password, user['password']):
             # Store user info in session
-            st.session_state['authenticated'] = True
-            st.session_state['username'] = username
-            st.session_state['role'] = user['role']
-            st.session_state['user_name'] = user['name']
-            st.session_state['login_time'] = datetime.now()
+            st.session_state.update({
+                'authenticated': True,
+                'username': username,
+                'role': user['role'],
+                'user_name': user['name'],
+                'login_time': datetime.now()
+            })
             return True
 
         return False
 
     def logout(self):
         """Logout current user"""
-        for key in ['authenticated', 'username', 'role', 'user_name', 'login_time']:
-            if key in st.session_state:
-                del st.session_state[key]
+        for key in _SESSION_KEYS:
+            st.session_state.pop(key, None)
 
     def is_authenticated(self) -> bool:
         """Check if user is authenticated"""
@@ -151,6 +445,13 @@ class Authenticator:
         """Get current username"""
         return st.session_state.get('username')
 
+    def _is_current_user(self, username: str) -> bool:
+        """Constant-time check that username is the logged-in user"""
+        current = self.get_current_user()
+        if current is None or username is None:
+            return False
+        return hmac.compare_digest(current.encode('utf-8'), username.encode('utf-8'))
+
     def get_current_role(self) -> Optional[str]:
         """Get current user role"""
         return st.session_state.get('role')
@@ -165,11 +466,7 @@ class Authenticator:
         Returns:
             True if user has permission
         """
-        if not self.is_authenticated():
-            return False
-
-        role = self.get_current_role()
-        return permission in ROLE_PERMISSIONS.get(role, [])
+        return self.is_authenticated() and _has(self.get_current_role(), permission)
 
     def is_admin(self) -> bool:
         """Check if current user is admin"""
@@ -197,15 +494,24 @@ class Authenticator:
             st.error(f"User '{username}' already exists")
             return False
 
-        self.users[username] = {
-            'name': name,
-            'password': self._hash_password(password),
-            'role': role,
-            'email': email,
-            'created': datetime.now().isoformat()
-        }
+        with st.spinner("Creating user..."):
+            hashed = _HASH_POOL.submit(self._hash_password, password).result()
 
-        self._save_users(self.users)
+        with self._lock:
+            # Re-check: another session may have created it while hashing
+            if username in self.users:
+                st.error(f"User '{username}' already exists")
+                return False
+
+            self.users[username] = {
+                'name': name,
+                'password': hashed,
+                'role': role,
+                'email': email,
+                'created': datetime.now().isoformat()
+            }
+
+            self._save_users(self.users)
         return True
 
     def delete_user(self, username: str) -> bool:
@@ -222,16 +528,17 @@ class Authenticator:
             st.error("Only administrators can delete users")
             return False
 
-        if username == self.get_current_user():
+        if self._is_current_user(username):
             st.error("Cannot delete your own account")
             return False
 
-        if username not in self.users:
-            st.error(f"User '{username}' not found")
-            return False
+        with self._lock:
+            if username not in self.users:
+                st.error(f"User '{username}' not found")
+                return False
 
-        del self.users[username]
-        self._save_users(self.users)
+            del self.users[username]
+            self._save_users(self.users)
         return True
 
     def change_password(self, username: str, old_password: str, new_password: str) -> bool:
@@ -247,7 +554,8 @@ class Authenticator:
             True if password changed successfully
         """
         # Users can change their own password, admins can change any password
-        if username != self.get_current_user() and not self.is_admin():
+        is_self = self._is_current_user(username)
+        if not is_self and not self.is_admin():
             st.error("You can only change your own password")
             return False
 
@@ -258,16 +566,19 @@ class Authenticator:
         user = self.users[username]
 
         # Verify old password (skip for admin changing other user's password)
-        if username == self.get_current_user():
+        if is_self:
             if not self._verify_password(old_password, user['password']):
                 st.error("Current password is incorrect")
                 return False
 
         # Update password
-        user['password'] = self._hash_password(new_password)
-        user['password_changed'] = datetime.now().isoformat()
+        with st.spinner("Updating password..."):
+            new_hash = _HASH_POOL.submit(self._hash_password, new_password).result()
 
-        self._save_users(self.users)
+        with self._lock:
+            user['password'] = new_hash
+            user['password_changed'] = datetime.now().isoformat()
+            self._save_users(self.users)
         return True
 
     def get_all_users(self) -> List[Dict]:
@@ -280,44 +591,31 @@ class Authenticator:
         if not self.is_admin():
             return []
 
-        users_list = []
-        for username, user_data in self.users.items():
-            users_list.append({
-                'username': username,
-                'name': user_data['name'],
-                'role': user_data['role'],
-                'email': user_data.get('email', ''),
-                'created': user_data.get('created', '')
-            })
+        self._refresh_users()
 
-        return users_list
+        # Built once per change to the users; every writer goes through _save_users
+        if self._users_view is None:
+            self._users_view = [
+                {
+                    'username': username,
+                    'name': user_data['name'],
+                    'role': user_data['role'],
+                    'email': user_data.get('email', ''),
+                    'created': user_data.get('created', '')
+                }
+                for username, user_data in self.users.items()
+            ]
+
+        return list(self._users_view)
 
     def render_login_page(self):
         """Render login page"""
-        st.markdown("""
-        <style>
-        .login-container {
-            max-width: 400px;
-            margin: auto;
-            padding: 2rem;
-            background-color: #f0f2f6;
-            border-radius: 10px;
-            margin-top: 5rem;
-        }
-        .login-header {
-            text-align: center;
-            color: #1f77b4;
-            margin-bottom: 2rem;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
         col1, col2, col3 = st.columns([1, 2, 1])
 
         with col2:
-            st.markdown('<div class="login-container">', unsafe_allow_html=True)
-            st.markdown('<h1 class="login-header">📈 Forex Analyzer Pro</h1>', unsafe_allow_html=True)
-            st.markdown('<h3 style="text-align: center;">Login</h3>', unsafe_allow_html=True)
+            # Streamlit drops elements not re-emitted on a rerun, so the
+            # static markup is sent every run, as a single prebuilt element
+            st.markdown(_LOGIN_STATIC_HTML, unsafe_allow_html=True)
 
             username = st.text_input("Username", key="login_username")
             password = st.text_input("Password", type="password", key="login_password")
@@ -336,48 +634,55 @@ class Authenticator:
                 if st.button("Reset", use_container_width=True):
                     st.rerun()
 
-            st.markdown('</div>', unsafe_allow_html=True)
-
             # Show default credentials for demo
-            st.info("""
-            **Demo Credentials:**
-
-            👤 **Admin Account:**
-            - Username: `admin`
-            - Password: `admin123`
-
-            👤 **User Account:**
-            - Username: `user`
-            - Password: `user123`
-            """)
+            st.info(_DEMO_CREDENTIALS)
 
     def render_user_info(self):
         """Render user info in sidebar"""
-        if self.is_authenticated():
-            st.sidebar.markdown("---")
-            st.sidebar.markdown("### 👤 User Information")
-            st.sidebar.write(f"**Name:** {st.session_state.get('user_name', 'Unknown')}")
-            st.sidebar.write(f"**Username:** {self.get_current_user()}")
+        # Read the session once; each access goes through Streamlit's hooks
+        session = st.session_state
+        if session.get('authenticated', False):
+            role = session.get('role')
+            login_time = session.get('login_time')
+
+            st.sidebar.markdown("---\n### 👤 User Information")
+            st.sidebar.write(f"**Name:** {session.get('user_name', 'Unknown')}")
+            st.sidebar.write(f"**Username:** {session.get('username')}")
 
-            role = self.get_current_role()
             role_emoji = "👑" if role == Role.ADMIN else "👤"
             role_color = "#28a745" if role == Role.ADMIN else "#17a2b8"
 
             st.sidebar.markdown(
-                f'<div style="background-color: {role_color}; color: white; '
-                f'padding: 0.5rem; border-radius: 5px; text-align: center;">'
-                f'{role_emoji} <b>{role.upper()}</b></div>',
+                _ROLE_BADGE_TMPL.format_map({'color': role_color, 'emoji': role_emoji,
+                                             'name': role.upper()}),
                 unsafe_allow_html=True
             )
 
             # Show session duration
-            login_time = st.session_state.get('login_time')
             if login_time:
                 duration = datetime.now() - login_time
-                st.sidebar.caption(f"Session: {duration.seconds // 60} minutes")
+                st.sidebar.caption(f"Session: {int(duration.total_seconds()) // 60} minutes")
 
             st.sidebar.markdown("---")
 
             if st.sidebar.button("🚪 Logout", use_container_width=True):
                 self.logout()
                 st.rerun()
+
+
+@st.cache_resource
+def get_authenticator(config_path: str = 'config/users.yaml') -> Authenticator:
+    """
+    Get the shared authenticator for a users file
+
+    Use this instead of constructing Authenticator directly: one instance
+    (and one parse of the users file) serves every session. Login state
+    lives in st.session_state, so it stays per session.
+
+    Args:
+        config_path: Path to user configuration file
+
+    Returns:
+        Authenticator instance
+    """
+    return Authenticator(config_path)
@@ -6,58 +6,60 @@ Handles user login, role-based access control, and session management using SQLi
 import streamlit as st
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List
+import hmac
 import logging
 
 from ..database.db_manager import DatabaseManager
+from .authentication import _HASH_POOL, _LOGIN_STATIC_HTML, _DEMO_CREDENTIALS
+from ._roles import Role, Permissions, ROLE_PERMISSIONS, _has
+
+# Permissions and ROLE_PERMISSIONS are re-exported for existing importers
+__all__ = ['AuthenticatorDB', 'Role', 'Permissions', 'ROLE_PERMISSIONS',
+           'get_authenticator_db', 'get_database']
 
 logger = logging.getLogger(__name__)
 
 
-class Role:
-    """User roles with permissions"""
-    ADMIN = "admin"
-    USER = "user"
-
-
-class Permissions:
-    """Permission definitions"""
-    VIEW_ANALYSIS = "view_analysis"
-    REFRESH_DATA = "refresh_data"
-    TRAIN_MODEL = "train_model"
-    SCAN_PAIRS = "scan_pairs"
-    MANAGE_USERS = "manage_users"
-    CHANGE_SETTINGS = "change_settings"
-
-
-# Role-Permission Mapping
-ROLE_PERMISSIONS = {
-    Role.ADMIN: [
-        Permissions.VIEW_ANALYSIS,
-        Permissions.REFRESH_DATA,
-        Permissions.TRAIN_MODEL,
-        Permissions.SCAN_PAIRS,
-        Permissions.MANAGE_USERS,
-        Permissions.CHANGE_SETTINGS
-    ],
-    Role.USER: [
-        Permissions.VIEW_ANALYSIS,
-        Permissions.SCAN_PAIRS,
-        # Refresh data and training are NOT included for user role
-    ]
-}
+# Session state keys set by login and cleared by logout
+_SESSION_KEYS = ('authenticated', 'user_id', 'username', 'role', 'user_name', 'login_time')
+
+# Sidebar role badge; only colour, emoji and role name vary
+_ROLE_BADGE_TMPL = (
+    '<div style="background-color: {color}; color: white; '
+    'padding: 0.5rem; border-radius: 5px; text-align: center;">'
+    '{emoji} <b>{name}</b></div>'
+)
+
+
+@st.cache_resource
+def get_database(db_path: str = 'data/users.db') -> DatabaseManager:
+    """
+    Get the shared database manager for a path
+
+    The manager opens a connection per operation, so one instance can be
+    shared by every session; schema setup then runs once per process.
+
+    Args:
+        db_path: Path to SQLite database
+
+    Returns:
+        DatabaseManager instance
+    """
+    return DatabaseManager(db_path)
 
 
 class AuthenticatorDB:
     """Handles authentication and authorization using database"""
 
-    def __init__(self, db_path: str = 'data/users.db'):
+    def __init__(self, db_path: str = 'data/users.db', db: Optional[DatabaseManager] = None):
         """
         Initialize authenticator with database
 
         Args:
             db_path: Path to SQLite database
+            db: Database manager to use (defaults to the shared one for db_path)
         """
-        self.db = DatabaseManager(db_path)
+        self.db = db if db is not None else get_database(db_path)
         self._ensure_default_users()
 
     def _ensure_default_users(self):
@@ -71,27 +73,25 @@ class AuthenticatorDB:
             if not users:
                 logger.info("No users found - creating default users")
 
-                # Create default admin
-                success, msg = self.db.create_user(
-                    username='admin',
-                    password='admin123',
-                    name='Administrator',
-                    role=Role.ADMIN,
-                    email='admin@forexanalyzer.com'
-                )
+                # Create default admin and user in one transaction
+                success, msg = self.db.create_users_bulk([
+                    {
+                        'username': 'admin',
+                        'password': 'admin123',
+                        'name': 'Administrator',
+                        'role': Role.ADMIN,
+                        'email': 'admin@forexanalyzer.com'
+                    },
+                    {
+                        'username': 'user',
+                        'password': 'user123',
+                        'name': 'Demo User',
+                        'role': Role.USER,
+                        'email': 'user@forexanalyzer.com'
+                    }
+                ])
                 if success:
-                    logger.info("Default admin user created")
-
-                # Create default user
-                success, msg = self.db.create_user(
-                    username='user',
-                    password='user123',
-                    name='Demo User',
-                    role=Role.USER,
-                    email='user@forexanalyzer.com'
-                )
-                if success:
-                    logger.info("Default user created")
+                    logger.info("Default admin and user created")
 
         except Exception as e:
             logger.error(f"Error ensuring default users: {e}")
@@ -112,12 +112,14 @@ class AuthenticatorDB:
 
             if success and user_data:
                 # Store user info in session
-                st.session_state['authenticated'] = True
-                st.session_state['user_id'] = user_data['id']
-                st.session_state['username'] = user_data['username']
-                st.session_state['role'] = user_data['role']
-                st.session_state['user_name'] = user_data['name']
-                st.session_state['login_time'] = datetime.now()
+                st.session_state.update({
+                    'authenticated': True,
+                    'user_id': user_data['id'],
+                    'username': user_data['username'],
+                    'role': user_data['role'],
+                    'user_name': user_data['name'],
+                    'login_time': datetime.now()
+                })
 
                 logger.info(f"User {username} logged in successfully")
                 return True
@@ -133,9 +135,8 @@ class AuthenticatorDB:
         """Logout current user"""
         username = st.session_state.get('username', 'Unknown')
 
-        for key in ['authenticated', 'user_id', 'username', 'role', 'user_name', 'login_time']:
-            if key in st.session_state:
-                del st.session_state[key]
+        for key in _SESSION_KEYS:
+            st.session_state.pop(key, None)
 
         logger.info(f"User {username} logged out")
 
@@ -151,6 +152,13 @@ class AuthenticatorDB:
         """Get current user ID"""
         return st.session_state.get('user_id')
 
+    def _is_current_user(self, username: str) -> bool:
+        """Constant-time check that username is the logged-in user"""
+        current = self.get_current_user()
+        if current is None or username is None:
+            return False
+        return hmac.compare_digest(current.encode('utf-8'), username.encode('utf-8'))
+
     def get_current_role(self) -> Optional[str]:
         """Get current user role"""
         return st.session_state.get('role')
@@ -165,11 +173,7 @@ class AuthenticatorDB:
         Returns:
             True if user has permission
         """
-        if not self.is_authenticated():
-            return False
-
-        role = self.get_current_role()
-        return permission in ROLE_PERMISSIONS.get(role, [])
+        return self.is_authenticated() and _has(self.get_current_role(), permission)
 
     def is_admin(self) -> bool:
         """Check if current user is admin"""
@@ -200,7 +204,11 @@ class AuthenticatorDB:
             st.error("Only administrators can create users")
             return False
 
-        success, message = self.db.create_user(username, password, name, role, email)
+        # Hashing happens inside create_user; run it on the hash pool
+        with st.spinner("Creating user..."):
+            success, message = _HASH_POOL.submit(
+                self.db.create_user, username, password, name, role, email
+            ).result()
 
         if success:
             st.success(message)
@@ -223,7 +231,7 @@ class AuthenticatorDB:
             st.error("Only administrators can delete users")
             return False
 
-        if username == self.get_current_user():
+        if self._is_current_user(username):
             st.error("Cannot delete your own account")
             return False
 
@@ -254,19 +262,23 @@ class AuthenticatorDB:
             True if password changed successfully
         """
         # Users can change their own password, admins can change any password
-        if username != self.get_current_user() and not self.is_admin():
+        is_self = self._is_current_user(username)
+        if not is_self and not self.is_admin():
             st.error("You can only change your own password")
             return False
 
         # Verify old password if changing own password
-        if username == self.get_current_user():
+        if is_self:
             success, _ = self.db.authenticate_user(username, old_password)
             if not success:
                 st.error("Current password is incorrect")
                 return False
 
         # Change password
-        success, message = self.db.change_password(username, new_password)
+        with st.spinner("Updating password..."):
+            success, message = _HASH_POOL.submit(
+                self.db.change_password, username, new_password
+            ).result()
 
         if success:
             st.success(message)
@@ -286,22 +298,19 @@ class AuthenticatorDB:
             return []
 
         try:
-            users = self.db.get_all_users()
-
-            # Format for display
-            formatted_users = []
-            for user in users:
-                if user.get('is_active', 1):  # Only show active users
-                    formatted_users.append({
-                        'username': user['username'],
-                        'name': user['name'],
-                        'role': user['role'],
-                        'email': user.get('email', ''),
-                        'created': user['created_at'],
-                        'last_login': user.get('last_login', 'Never')
-                    })
-
-            return formatted_users
+            # Format for display (only active users)
+            return [
+                {
+                    'username': user['username'],
+                    'name': user['name'],
+                    'role': user['role'],
+                    'email': user.get('email', ''),
+                    'created': user['created_at'],
+                    'last_login': user.get('last_login', 'Never')
+                }
+                for user in self.db.get_all_users()
+                if user.get('is_active', 1)
+            ]
 
         except Exception as e:
             logger.error(f"Error getting users: {e}")
@@ -329,30 +338,12 @@ class AuthenticatorDB:
 
     def render_login_page(self):
         """Render login page"""
-        st.markdown("""
-        <style>
-        .login-container {
-            max-width: 400px;
-            margin: auto;
-            padding: 2rem;
-            background-color: #f0f2f6;
-            border-radius: 10px;
-            margin-top: 5rem;
-        }
-        .login-header {
-            text-align: center;
-            color: #1f77b4;
-            margin-bottom: 2rem;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
         col1, col2, col3 = st.columns([1, 2, 1])
 
         with col2:
-            st.markdown('<div class="login-container">', unsafe_allow_html=True)
-            st.markdown('<h1 class="login-header">📈 Forex Analyzer Pro</h1>', unsafe_allow_html=True)
-            st.markdown('<h3 style="text-align: center;">Login</h3>', unsafe_allow_html=True)
+            # Streamlit drops elements not re-emitted on a rerun, so the
+            # static markup is sent every run, as a single prebuilt element
+            st.markdown(_LOGIN_STATIC_HTML, unsafe_allow_html=True)
 
             username = st.text_input("Username", key="login_username")
             password = st.text_input("Password", type="password", key="login_password")
@@ -371,48 +362,55 @@ class AuthenticatorDB:
                 if st.button("Reset", use_container_width=True):
                     st.rerun()
 
-            st.markdown('</div>', unsafe_allow_html=True)
-
             # Show default credentials for demo
-            st.info("""
-            **Demo Credentials:**
-
-            👤 **Admin Account:**
-            - Username: `admin`
-            - Password: `admin123`
-
-            👤 **User Account:**
-            - Username: `user`
-            - Password: `user123`
-            """)
+            st.info(_DEMO_CREDENTIALS)
 
     def render_user_info(self):
         """Render user info in sidebar"""
-        if self.is_authenticated():
-            st.sidebar.markdown("---")
-            st.sidebar.markdown("### 👤 User Information")
-            st.sidebar.write(f"**Name:** {st.session_state.get('user_name', 'Unknown')}")
-            st.sidebar.write(f"**Username:** {self.get_current_user()}")
+        # Read the session once; each access goes through Streamlit's hooks
+        session = st.session_state
+        if session.get('authenticated', False):
+            role = session.get('role')
+            login_time = session.get('login_time')
+
+            st.sidebar.markdown("---\n### 👤 User Information")
+            st.sidebar.write(f"**Name:** {session.get('user_name', 'Unknown')}")
+            st.sidebar.write(f"**Username:** {session.get('username')}")
 
-            role = self.get_current_role()
             role_emoji = "👑" if role == Role.ADMIN else "👤"
             role_color = "#28a745" if role == Role.ADMIN else "#17a2b8"
 
             st.sidebar.markdown(
-                f'<div style="background-color: {role_color}; color: white; '
-                f'padding: 0.5rem; border-radius: 5px; text-align: center;">'\
-                f'{role_emoji} <b>{role.upper()}</b></div>',
+                _ROLE_BADGE_TMPL.format_map({'color': role_color, 'emoji': role_emoji,
+                                             'name': role.upper()}),
                 unsafe_allow_html=True
             )
 
             # Show session duration
-            login_time = st.session_state.get('login_time')
             if login_time:
                 duration = datetime.now() - login_time
-                st.sidebar.caption(f"Session: {duration.seconds // 60} minutes")
+                st.sidebar.caption(f"Session: {int(duration.total_seconds()) // 60} minutes")
 
             st.sidebar.markdown("---")
 
             if st.sidebar.button("🚪 Logout", use_container_width=True):
                 self.logout()
                 st.rerun()
+
+
+@st.cache_resource
+def get_authenticator_db(db_path: str = 'data/users.db') -> AuthenticatorDB:
+    """
+    Get the shared database authenticator for a path
+
+    Use this instead of constructing AuthenticatorDB directly: the default
+    user check runs once per process rather than on every rerun. Login
+    state lives in st.session_state, so it stays per session.
+
+    Args:
+        db_path: Path to SQLite database
+
+    Returns:
+        AuthenticatorDB instance
+    """
+    return AuthenticatorDB(db_path)
@@ -3,17 +3,30 @@ Data Fetcher Module
 Handles downloading and caching forex data from multiple sources
 """
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
-from datetime import datetime, timedelta
+from datetime import timedelta
+import asyncio
 import os
 import pickle
-from typing import Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Feather (Arrow IPC) cache files when pyarrow is installed; pickle otherwise
+try:
+    import pyarrow  # noqa: F401
+    FEATHER_AVAILABLE = True
+except ImportError:
+    FEATHER_AVAILABLE = False
+
 # Import Twelve Data fetcher
 try:
     from .twelvedata_fetcher import TwelveDataFetcher
@@ -24,10 +37,11 @@ except ImportError:
 
 # Import Finnhub fetcher
 try:
-    from .finnhub_fetcher import FinnhubDataFetcher
+    from .finnhub_fetcher import FinnhubDataFetcher, AIOHTTP_AVAILABLE
     FINNHUB_AVAILABLE = True
 except ImportError:
     FINNHUB_AVAILABLE = False
+    AIOHTTP_AVAILABLE = False
     logger.info("Finnhub fetcher not available")
 
 # Import Oanda fetcher
@@ -38,6 +52,15 @@ except ImportError:
     logger.info("Oanda fetcher not available")
 
 
+def _in_event_loop() -> bool:
+    """True when called from inside a running asyncio event loop (e.g. Jupyter)"""
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
 class ForexDataFetcher:
     """Fetches and caches forex data from multiple sources (yfinance, Oanda, MT5)"""
 
@@ -55,7 +78,8 @@ class ForexDataFetcher:
         Initialize the data fetcher
 
         Args:
-            cache_dir: Directory to store cached data
+            cache_dir: Directory to store cached data (uncompressed; keep it
+                on local disk or tmpfs rather than a network share)
             cache_duration_minutes: How long to cache data before refreshing
             data_source: Data source to use ('twelvedata', 'finnhub', 'yfinance', 'oanda', 'auto')
             twelvedata_api_key: Twelve Data API key (FREE - supports forex!)
@@ -65,9 +89,16 @@ class ForexDataFetcher:
         """
         self.cache_dir = cache_dir
         self.cache_duration = timedelta(minutes=cache_duration_minutes)
+        self._cache_seconds = cache_duration_minutes * 60.0
         self.data_source = data_source.lower()
         os.makedirs(cache_dir, exist_ok=True)
 
+        # Recently loaded cache files: path -> (mtime_ns, DataFrame), least
+        # recently used first; saves re-reading a file that has not changed
+        self._mem_cache: "OrderedDict[str, Tuple[int, pd.DataFrame]]" = OrderedDict()
+        self._mem_cache_max = 32
+        self._mem_cache_lock = threading.Lock()
+
         # Initialize Twelve Data fetcher if requested (BEST for free forex!)
         self.twelvedata_fetcher = None
         if self.data_source in ['twelvedata', 'auto'] and TWELVEDATA_AVAILABLE:
@@ -141,15 +172,72 @@ class ForexDataFetcher:
 
     def _get_cache_path(self, symbol: str, timeframe: str) -> str:
         """Generate cache file path for a symbol and timeframe"""
-        return os.path.join(self.cache_dir, f"{symbol}_{timeframe}.pkl")
+        ext = 'feather' if FEATHER_AVAILABLE else 'pkl'
+        return os.path.join(self.cache_dir, f"{symbol}_{timeframe}.{ext}")
+
+    def _memory_get(self, cache_path: str, mtime_ns: int) -> Optional[pd.DataFrame]:
+        """Copy of the in-memory frame for a cache file if it is unchanged, else None"""
+        with self._mem_cache_lock:
+            cached = self._mem_cache.get(cache_path)
+            if cached is None or cached[0] != mtime_ns:
+                return None
+            self._mem_cache.move_to_end(cache_path)
+        # Callers add indicator columns to the frames they get back
+        return cached[1].copy()
+
+    def _memory_put(self, cache_path: str, mtime_ns: int, df: pd.DataFrame):
+        """Remember a copy of the frame stored in a cache file"""
+        with self._mem_cache_lock:
+            self._mem_cache[cache_path] = (mtime_ns, df.copy())
+            self._mem_cache.move_to_end(cache_path)
+            if len(self._mem_cache) > self._mem_cache_max:
+                self._mem_cache.popitem(last=False)
+
+    def _read_cache(self, cache_path: str) -> pd.DataFrame:
+        """Load a cached DataFrame from a Feather or pickle file"""
+        if cache_path.endswith('.feather'):
+            df = pd.read_feather(cache_path)
+            # The index was written as the first column
+            df.set_index(df.columns[0], inplace=True)
+            if df.index.name == 'index':
+                df.index.name = None
+        else:
+            with open(cache_path, 'rb') as f:
+                df = pickle.load(f)
 
-    def _is_cache_valid(self, cache_path: str) -> bool:
-        """Check if cached data is still valid"""
-        if not os.path.exists(cache_path):
-            return False
+        # Volume is stored as int32 (see _downcast); hand it back as int64
+        if 'Volume' in df.columns and df['Volume'].dtype == np.int32:
+            df['Volume'] = df['Volume'].astype(np.int64)
+        return df
+
+    def _write_cache(self, df: pd.DataFrame, cache_path: str):
+        """Write a DataFrame to a Feather or pickle cache file"""
+        df = self._downcast(df)
+
+        if cache_path.endswith('.feather'):
+            # Feather stores columns only, so the index goes in as a column
+            df.reset_index().to_feather(cache_path, compression='uncompressed')
+            return
+
+        # Protocol 5+ hands NumPy blocks to the file as buffers, without
+        # first copying them into the pickle stream. Never compressed: cache
+        # hits are read-bound and decompression costs more than it saves.
+        with open(cache_path, 'wb') as f:
+            pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
 
-        cache_time = datetime.fromtimestamp(os.path.getmtime(cache_path))
-        return datetime.now() - cache_time < self.cache_duration
+    def _is_cache_valid(self, cache_path: str) -> Tuple[bool, Optional[int]]:
+        """
+        Check if cached data is still valid
+
+        Returns:
+            Tuple of (valid, mtime_ns); mtime_ns is None if the file is missing
+        """
+        try:
+            stat = os.stat(cache_path)
+        except FileNotFoundError:
+            return False, None
+
+        return time.time() - stat.st_mtime < self._cache_seconds, stat.st_mtime_ns
 
     def _convert_timeframe(self, timeframe: str) -> str:
         """
@@ -201,16 +289,11 @@ class ForexDataFetcher:
         Returns:
             DataFrame with OHLCV data
         """
-        cache_path = self._get_cache_path(symbol, timeframe)
-
         # Try to load from cache
-        if use_cache and self._is_cache_valid(cache_path):
-            try:
-                with open(cache_path, 'rb') as f:
-                    logger.info(f"Loading {symbol} {timeframe} from cache")
-                    return pickle.load(f)
-            except Exception as e:
-                logger.warning(f"Cache load failed: {e}")
+        if use_cache:
+            df = self._load_from_cache(symbol, timeframe)
+            if df is not None:
+                return df
 
         # Decide which data source to use
         df = None
@@ -272,13 +355,116 @@ class ForexDataFetcher:
 
         # Cache the data if successful
         if df is not None and not df.empty and use_cache:
+            self._save_to_cache(df, symbol, timeframe)
+
+        return df
+
+    @staticmethod
+    def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Copy of a frame with Volume stored as int32, for writing to the cache
+
+        Only an integer Volume column is narrowed, and only when its values
+        fit; prices are never touched, so cached data reads back unchanged.
+        """
+        if 'Volume' not in df.columns or df['Volume'].dtype != np.int64:
+            return df
+
+        volume = df['Volume']
+        if volume.abs().max() <= np.iinfo(np.int32).max:
+            df = df.copy(deep=False)
+            df['Volume'] = volume.astype(np.int32)
+        return df
+
+    def _load_from_cache(self, symbol: str, timeframe: str) -> Optional[pd.DataFrame]:
+        """Cached data for a symbol and timeframe if still fresh, else None"""
+        cache_path = self._get_cache_path(symbol, timeframe)
+
+        # Pickle files written before Feather caching are still used while
+        # they are fresh
+        cache_paths = [cache_path]
+        if FEATHER_AVAILABLE:
+            cache_paths.append(os.path.splitext(cache_path)[0] + '.pkl')
+
+        for path in cache_paths:
+            valid, mtime_ns = self._is_cache_valid(path)
+            if not valid:
+                continue
             try:
-                with open(cache_path, 'wb') as f:
-                    pickle.dump(df, f)
+                df = self._memory_get(path, mtime_ns)
+                if df is not None:
+                    return df
+
+                logger.info(f"Loading {symbol} {timeframe} from cache")
+                df = self._read_cache(path)
+                self._memory_put(path, mtime_ns, df)
+                return df
             except Exception as e:
-                logger.warning(f"Failed to cache data: {e}")
+                logger.warning(f"Cache load failed: {e}")
 
-        return df
+        return None
+
+    def _save_to_cache(self, df: pd.DataFrame, symbol: str, timeframe: str):
+        """Write fetched data to the disk and memory caches"""
+        cache_path = self._get_cache_path(symbol, timeframe)
+        try:
+            self._write_cache(df, cache_path)
+            self._memory_put(cache_path, os.stat(cache_path).st_mtime_ns, df)
+        except Exception as e:
+            logger.warning(f"Failed to cache data: {e}")
+
+    def fetch_many(
+        self,
+        pairs: List[Tuple[str, str]],
+        use_cache: bool = True
+    ) -> Dict[Tuple[str, str], pd.DataFrame]:
+        """
+        Fetch data for many (symbol, timeframe) pairs at once
+
+        With the Finnhub data source and aiohttp installed, uncached pairs
+        are requested concurrently over one aiohttp session; otherwise each
+        goes through fetch_data on a thread pool.
+
+        Args:
+            pairs: List of (symbol, timeframe) tuples
+            use_cache: Whether to use cached data
+
+        Returns:
+            Dictionary mapping (symbol, timeframe) to DataFrame
+        """
+        pairs = list(dict.fromkeys(pairs))
+        data = {}
+
+        missing = []
+        for symbol, timeframe in pairs:
+            df = self._load_from_cache(symbol, timeframe) if use_cache else None
+            if df is not None:
+                data[(symbol, timeframe)] = df
+            else:
+                missing.append((symbol, timeframe))
+
+        if missing:
+            if (AIOHTTP_AVAILABLE and self.data_source == 'finnhub'
+                    and self.finnhub_fetcher and not _in_event_loop()):
+                fetched = asyncio.run(
+                    self.finnhub_fetcher.fetch_many_candles_async(missing, limit=500)
+                )
+                if use_cache:
+                    for (symbol, timeframe), df in fetched.items():
+                        if not df.empty:
+                            self._save_to_cache(df, symbol, timeframe)
+            else:
+                with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+                    futures = {
+                        pair: executor.submit(self.fetch_data, pair[0], pair[1], use_cache)
+                        for pair in missing
+                    }
+                    fetched = {pair: future.result() for pair, future in futures.items()}
+
+            data.update((pair, df) for pair, df in fetched.items() if df is not None)
+
+        # Keep the input ordering
+        return {pair: data[pair] for pair in pairs if pair in data}
 
     def _convert_symbol_for_yfinance(self, symbol: str) -> str:
         """
@@ -362,15 +548,30 @@ class ForexDataFetcher:
             Dictionary mapping timeframe to DataFrame
         """
         data = {}
-        for tf in timeframes:
-            df = self.fetch_data(symbol, tf, use_cache)
-            if df is not None:
-                data[tf] = df
+        if not timeframes:
+            return data
+
+        # Fetches are network-bound, so timeframes are requested concurrently;
+        # each writes its own cache file and Twelve Data rate-limits under a lock
+        with ThreadPoolExecutor(max_workers=min(8, len(timeframes))) as executor:
+            futures = {
+                tf: executor.submit(self.fetch_data, symbol, tf, use_cache)
+                for tf in timeframes
+            }
+
+            # Collect in submission order so results keep the input ordering
+            for tf, future in futures.items():
+                df = future.result()
+                if df is not None:
+                    data[tf] = df
 
         return data
 
     def clear_cache(self):
         """Clear all cached data"""
+        with self._mem_cache_lock:
+            self._mem_cache.clear()
+
         try:
             for file in os.listdir(self.cache_dir):
                 os.remove(os.path.join(self.cache_dir, file))
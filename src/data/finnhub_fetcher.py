@@ -3,14 +3,28 @@ Finnhub Real-Time Data Fetcher
 Provides real-time forex OHLC data using Finnhub API
 """
 
+import asyncio
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import time
+import threading
 import logging
+from typing import Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# aiohttp for concurrent candle requests (fetch_many_candles_async)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 
 class FinnhubDataFetcher:
     """Fetch real-time forex data from Finnhub API"""
@@ -49,6 +63,12 @@ class FinnhubDataFetcher:
         'SI=F': 'OANDA:XAG_USD',  # Silver futures
     }
 
+    # Seconds to skip re-requesting candles Finnhub reported no data for
+    NEGATIVE_CACHE_TTL = 300.0
+
+    # Any other pair: EURUSD, EUR_USD, XAUUSD, with an optional =X/=F suffix
+    _SYMBOL_RE = re.compile(r'^([A-Za-z0-9]{3})_?([A-Za-z0-9]{3})(?:=[XF])?$')
+
     def __init__(self, api_key: str):
         """
         Initialize Finnhub data fetcher
@@ -59,6 +79,19 @@ class FinnhubDataFetcher:
         self.api_key = api_key
         self.session = requests.Session()
 
+        # (symbol, resolution, from hour, to hour) -> time of the empty answer
+        self._neg_cache: Dict[Tuple, float] = {}
+        self._neg_cache_lock = threading.Lock()
+
+        # Keep connections to finnhub.io alive across calls and threads, and
+        # retry dropped connections with a short backoff
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount("https://", adapter)
+
     def _convert_symbol(self, symbol: str) -> str:
         """
         Convert symbol to Finnhub format
@@ -77,21 +110,10 @@ class FinnhubDataFetcher:
         if symbol in self.SYMBOL_MAP:
             return self.SYMBOL_MAP[symbol]
 
-        # Try to parse if it's a standard pair
-        # Remove =X suffix if present
-        clean_symbol = symbol.replace('=X', '').replace('=F', '')
-
-        # Handle special cases
-        if clean_symbol == 'XAU_USD' or clean_symbol == 'XAUUSD':
-            return 'OANDA:XAU_USD'
-        if clean_symbol == 'XAG_USD' or clean_symbol == 'XAGUSD':
-            return 'OANDA:XAG_USD'
-
-        # Standard forex pair (6 characters)
-        if len(clean_symbol) == 6:
-            base = clean_symbol[:3]
-            quote = clean_symbol[3:]
-            return f'OANDA:{base}_{quote}'
+        # Standard forex or metals pair, split into base and quote
+        match = self._SYMBOL_RE.match(symbol)
+        if match:
+            return f'OANDA:{match[1]}_{match[2]}'
 
         # If we can't convert, return as-is and let API handle it
         logger.warning(f"Could not convert symbol {symbol}, using as-is")
@@ -131,84 +153,26 @@ class FinnhubDataFetcher:
             DataFrame with OHLC data
         """
         try:
-            # Convert symbol
-            finnhub_symbol = self._convert_symbol(symbol)
-            resolution = self._get_timeframe_resolution(timeframe)
-
-            # Calculate date range if not provided
-            if end_date is None:
-                end_date = datetime.now()
-
-            if start_date is None:
-                # Calculate based on timeframe and limit
-                if timeframe in ['1m', '5m', '15m', '30m']:
-                    days_back = (limit * int(timeframe.replace('m', ''))) / (60 * 24)
-                elif timeframe == '1h':
-                    days_back = limit / 24
-                elif timeframe == '4h':
-                    days_back = (limit * 4) / 24
-                elif timeframe == '1d':
-                    days_back = limit
-                elif timeframe == '1w':
-                    days_back = limit * 7
-                else:
-                    days_back = limit
-
-                start_date = end_date - timedelta(days=max(days_back, 30))
-
-            # Convert to Unix timestamps
-            from_ts = int(start_date.timestamp())
-            to_ts = int(end_date.timestamp())
-
-            # API endpoint
-            url = f"{self.BASE_URL}/forex/candle"
-            params = {
-                'symbol': finnhub_symbol,
-                'resolution': resolution,
-                'from': from_ts,
-                'to': to_ts,
-                'token': self.api_key
-            }
+            url, params = self._candle_request(symbol, timeframe, limit, start_date, end_date)
 
-            logger.info(f"Fetching {symbol} ({finnhub_symbol}) {timeframe} from Finnhub")
+            neg_key = self._negative_key(params)
+            if self._is_known_empty(neg_key):
+                logger.info(f"Skipping {symbol} {timeframe}: no Finnhub data on the last try")
+                return pd.DataFrame()
+
+            logger.info(f"Fetching {symbol} ({params['symbol']}) {timeframe} from Finnhub")
 
             # Make request
             response = self.session.get(url, params=params, timeout=10)
+            if response.status_code in (403, 404):
+                self._remember_empty(neg_key)
             response.raise_for_status()
 
             data = response.json()
-
-            # Check for errors
             if data.get('s') == 'no_data':
-                logger.warning(f"No data available for {symbol} {timeframe}")
-                return pd.DataFrame()
-
-            if 'c' not in data or len(data['c']) == 0:
-                logger.warning(f"Empty response for {symbol} {timeframe}")
-                return pd.DataFrame()
-
-            # Convert to DataFrame
-            df = pd.DataFrame({
-                'Open': data['o'],
-                'High': data['h'],
-                'Low': data['l'],
-                'Close': data['c'],
-                'Volume': data.get('v', [0] * len(data['c'])),
-                'timestamp': data['t']
-            })
-
-            # Convert timestamp to datetime
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
-            df.set_index('timestamp', inplace=True)
-            df.sort_index(inplace=True)
+                self._remember_empty(neg_key)
 
-            # Limit to requested number of candles
-            if len(df) > limit:
-                df = df.tail(limit)
-
-            logger.info(f"Fetched {len(df)} candles for {symbol} {timeframe}")
-
-            return df
+            return self._parse_candles(data, symbol, timeframe, limit)
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 429:
@@ -221,6 +185,196 @@ class FinnhubDataFetcher:
             logger.error(f"Error fetching {symbol} from Finnhub: {e}")
             return pd.DataFrame()
 
+    def _candle_request(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+        start_date: datetime = None,
+        end_date: datetime = None
+    ) -> Tuple[str, Dict]:
+        """
+        Build the URL and query parameters for a candle request
+
+        Returns:
+            Tuple of (url, params)
+        """
+        # Convert symbol
+        finnhub_symbol = self._convert_symbol(symbol)
+        resolution = self._get_timeframe_resolution(timeframe)
+
+        # Calculate date range if not provided
+        if end_date is None:
+            end_date = datetime.now()
+
+        if start_date is None:
+            # Calculate based on timeframe and limit
+            if timeframe in ['1m', '5m', '15m', '30m']:
+                days_back = (limit * int(timeframe.replace('m', ''))) / (60 * 24)
+            elif timeframe == '1h':
+                days_back = limit / 24
+            elif timeframe == '4h':
+                days_back = (limit * 4) / 24
+            elif timeframe == '1d':
+                days_back = limit
+            elif timeframe == '1w':
+                days_back = limit * 7
+            else:
+                days_back = limit
+
+            start_date = end_date - timedelta(days=max(days_back, 30))
+
+        # API endpoint; Unix timestamps for the range
+        url = f"{self.BASE_URL}/forex/candle"
+        params = {
+            'symbol': finnhub_symbol,
+            'resolution': resolution,
+            'from': int(start_date.timestamp()),
+            'to': int(end_date.timestamp()),
+            'token': self.api_key
+        }
+        return url, params
+
+    def _negative_key(self, params: Dict) -> Tuple:
+        """Negative-cache key for a candle request; the range is bucketed by hour"""
+        return (params['symbol'], params['resolution'], params['from'] // 3600, params['to'] // 3600)
+
+    def _is_known_empty(self, key: Tuple) -> bool:
+        """True if Finnhub answered this request with no data within the TTL"""
+        with self._neg_cache_lock:
+            answered = self._neg_cache.get(key, 0.0)
+        return answered > time.time() - self.NEGATIVE_CACHE_TTL
+
+    def _remember_empty(self, key: Tuple):
+        """Record an empty answer, dropping expired entries"""
+        now = time.time()
+        cutoff = now - self.NEGATIVE_CACHE_TTL
+        with self._neg_cache_lock:
+            self._neg_cache = {k: t for k, t in self._neg_cache.items() if t > cutoff}
+            self._neg_cache[key] = now
+
+    def _parse_candles(self, data: Dict, symbol: str, timeframe: str, limit: int) -> pd.DataFrame:
+        """
+        Convert a candle response to a DataFrame
+
+        Returns:
+            DataFrame with OHLC data (empty if the response has none)
+        """
+        # Check for errors
+        if data.get('s') == 'no_data':
+            logger.warning(f"No data available for {symbol} {timeframe}")
+            return pd.DataFrame()
+
+        if 'c' not in data or len(data['c']) == 0:
+            logger.warning(f"Empty response for {symbol} {timeframe}")
+            return pd.DataFrame()
+
+        # Convert to DataFrame from typed arrays; epoch seconds become
+        # the nanosecond DatetimeIndex directly
+        close = np.asarray(data['c'], dtype=np.float64)
+        volume = data.get('v')
+        index = pd.DatetimeIndex(
+            np.asarray(data['t'], dtype=np.int64) * 1_000_000_000,
+            name='timestamp'
+        )
+        df = pd.DataFrame({
+            'Open': np.asarray(data['o'], dtype=np.float64),
+            'High': np.asarray(data['h'], dtype=np.float64),
+            'Low': np.asarray(data['l'], dtype=np.float64),
+            'Close': close,
+            'Volume': (np.asarray(volume, dtype=np.float64) if volume is not None
+                       else np.zeros(len(close), dtype=np.float64))
+        }, index=index)
+        df.sort_index(inplace=True)
+
+        # Limit to requested number of candles
+        if len(df) > limit:
+            df = df.tail(limit)
+
+        logger.info(f"Fetched {len(df)} candles for {symbol} {timeframe}")
+
+        return df
+
+    async def fetch_candles_async(
+        self,
+        symbol: str,
+        timeframe: str,
+        session: "aiohttp.ClientSession",
+        limit: int = 200
+    ) -> pd.DataFrame:
+        """
+        Fetch OHLC candlestick data over a shared aiohttp session
+
+        Args:
+            symbol: Currency pair symbol
+            timeframe: Timeframe (1m, 5m, 15m, 30m, 1h, 4h, 1d)
+            session: Open aiohttp session
+            limit: Number of candles to fetch
+
+        Returns:
+            DataFrame with OHLC data
+        """
+        try:
+            url, params = self._candle_request(symbol, timeframe, limit)
+
+            neg_key = self._negative_key(params)
+            if self._is_known_empty(neg_key):
+                logger.info(f"Skipping {symbol} {timeframe}: no Finnhub data on the last try")
+                return pd.DataFrame()
+
+            logger.info(f"Fetching {symbol} ({params['symbol']}) {timeframe} from Finnhub")
+
+            async with session.get(url, params=params) as response:
+                if response.status == 429:
+                    logger.error("Finnhub API rate limit exceeded")
+                    return pd.DataFrame()
+                if response.status in (403, 404):
+                    self._remember_empty(neg_key)
+                response.raise_for_status()
+                data = await response.json()
+
+            if data.get('s') == 'no_data':
+                self._remember_empty(neg_key)
+
+            return self._parse_candles(data, symbol, timeframe, limit)
+
+        except Exception as e:
+            logger.error(f"Error fetching {symbol} from Finnhub: {e}")
+            return pd.DataFrame()
+
+    async def fetch_many_candles_async(
+        self,
+        pairs: List[Tuple[str, str]],
+        limit: int = 200,
+        max_concurrency: int = 8
+    ) -> Dict[Tuple[str, str], pd.DataFrame]:
+        """
+        Fetch candles for many (symbol, timeframe) pairs concurrently
+
+        Args:
+            pairs: List of (symbol, timeframe) tuples
+            limit: Number of candles to fetch per pair
+            max_concurrency: Most requests in flight at once (API rate limit)
+
+        Returns:
+            Dictionary mapping (symbol, timeframe) to DataFrame
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(session, symbol, timeframe):
+            async with semaphore:
+                return await self.fetch_candles_async(symbol, timeframe, session, limit)
+
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32),
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as session:
+            frames = await asyncio.gather(
+                *(fetch(session, symbol, timeframe) for symbol, timeframe in pairs)
+            )
+
+        return dict(zip(pairs, frames))
+
     def get_quote(self, symbol: str) -> dict:
         """
         Get current quote for a symbol
@@ -8,6 +8,7 @@ import requests
 import pandas as pd
 from datetime import datetime, timedelta
 import time
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
@@ -65,21 +66,24 @@ class TwelveDataFetcher:
         self.session = requests.Session()
         self.min_request_interval = min_request_interval
         self.last_request_time = 0
+        # Serializes _rate_limit when timeframes are fetched from several threads
+        self._rate_lock = threading.Lock()
 
     def _rate_limit(self):
         """
         Enforce rate limiting between API calls
         Ensures at least min_request_interval seconds between requests
         """
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        with self._rate_lock:
+            current_time = time.time()
+            time_since_last_request = current_time - self.last_request_time
 
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
-            logger.info(f"⏱️  Rate limiting: waiting {sleep_time:.1f}s before next API call")
-            time.sleep(sleep_time)
+            if time_since_last_request < self.min_request_interval:
+                sleep_time = self.min_request_interval - time_since_last_request
+                logger.info(f"⏱️  Rate limiting: waiting {sleep_time:.1f}s before next API call")
+                time.sleep(sleep_time)
 
-        self.last_request_time = time.time()
+            self.last_request_time = time.time()
 
     def _convert_symbol(self, symbol: str) -> str:
         """
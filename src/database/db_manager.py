@@ -9,10 +9,21 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
 
+# bcrypt hash of random bytes, checked when there is no real hash to check;
+# built at import so the first rejection costs the same as later ones
+_DUMMY_HASH = bcrypt.hashpw(os.urandom(16), bcrypt.gensalt())
+
+
+def _dummy_check(password: str):
+    """Spend one bcrypt verification so rejections take as long as a wrong password"""
+    bcrypt.checkpw(password.encode('utf-8'), _DUMMY_HASH)
+
+
 class DatabaseManager:
     """Manages SQLite database for user accounts"""
 
@@ -187,6 +198,69 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    def create_users_bulk(self, users: List[Dict]) -> Tuple[bool, str]:
+        """
+        Create several users in a single transaction
+
+        Passwords are hashed concurrently (bcrypt releases the GIL), then all
+        rows are inserted and committed together; if any insert fails, none
+        of the users are created.
+
+        Args:
+            users: Dicts with username, password, name, role and optional email
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        if not users:
+            return True, "No users to create"
+
+        with ThreadPoolExecutor(max_workers=min(len(users), os.cpu_count() or 1)) as pool:
+            password_hashes = list(pool.map(
+                lambda user: bcrypt.hashpw(
+                    user['password'].encode('utf-8'),
+                    bcrypt.gensalt()
+                ).decode('utf-8'),
+                users
+            ))
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            now = datetime.now().isoformat()
+
+            for user, password_hash in zip(users, password_hashes):
+                cursor.execute('''
+                    INSERT INTO users (
+                        username, password_hash, name, email, role,
+                        created_at, updated_at, is_active
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, 1)
+                ''', (user['username'], password_hash, user['name'],
+                      user.get('email', ''), user['role'], now, now))
+
+                self._log_action(
+                    cursor, cursor.lastrowid, 'USER_CREATED', f"User {user['username']} created"
+                )
+
+            conn.commit()
+            logger.info(f"{len(users)} users created successfully")
+            return True, f"{len(users)} users created successfully"
+
+        except sqlite3.IntegrityError as e:
+            conn.rollback()
+            logger.warning(f"Bulk user creation failed: {e}")
+            return False, f"User already exists: {str(e)}"
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error creating users: {e}")
+            return False, f"Error creating users: {str(e)}"
+
+        finally:
+            conn.close()
+
     def authenticate_user(self, username: str, password: str) -> Tuple[bool, Optional[Dict]]:
         """
         Authenticate a user
@@ -213,6 +287,9 @@ class DatabaseManager:
             row = cursor.fetchone()
 
             if not row:
+                # Same bcrypt cost as a wrong password: no user-enumeration
+                # timing oracle
+                _dummy_check(password)
                 logger.warning(f"Login attempt for non-existent user: {username}")
                 return False, None
 
@@ -224,6 +301,7 @@ class DatabaseManager:
 
             # Check if user is active
             if not is_active:
+                _dummy_check(password)
                 logger.warning(f"Login attempt for inactive user: {username}")
                 return False, None
 
@@ -231,6 +309,7 @@ class DatabaseManager:
             if locked_until:
                 lock_time = datetime.fromisoformat(locked_until)
                 if datetime.now() < lock_time:
+                    _dummy_check(password)
                     logger.warning(f"Login attempt for locked user: {username}")
                     return False, None
                 else:
@@ -452,6 +531,31 @@ class DatabaseManager:
             username: Username
             new_password: New plain text password
 
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        # Hash new password
+        password_hash = bcrypt.hashpw(
+            new_password.encode('utf-8'),
+            bcrypt.gensalt()
+        ).decode('utf-8')
+
+        return self.change_password_hash(username, password_hash)
+
+    def change_password_hash(
+        self,
+        username: str,
+        password_hash: str
+    ) -> Tuple[bool, str]:
+        """
+        Change user password using an already computed bcrypt hash
+
+        Lets admin tools hash once and retry the update without rehashing.
+
+        Args:
+            username: Username
+            password_hash: bcrypt hash of the new password
+
         Returns:
             Tuple of (success: bool, message: str)
         """
@@ -459,12 +563,6 @@ class DatabaseManager:
         cursor = conn.cursor()
 
         try:
-            # Hash new password
-            password_hash = bcrypt.hashpw(
-                new_password.encode('utf-8'),
-                bcrypt.gensalt()
-            ).decode('utf-8')
-
             # Update password
             cursor.execute('''
                 UPDATE users
@@ -1,4 +1,5 @@
 """Utilities module"""
 from .config_loader import load_config, get_default_config
+from .validation import validate_password
 
-__all__ = ['load_config', 'get_default_config']
+__all__ = ['load_config', 'get_default_config', 'validate_password']
@@ -0,0 +1,20 @@
+"""
+Optional Numba support
+Exposes ``njit`` and ``NUMBA_AVAILABLE``; without numba, ``njit`` returns the
+function unchanged so kernels run as plain Python
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
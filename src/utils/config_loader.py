@@ -42,6 +42,7 @@ def get_default_config() -> Dict:
             '1h': 0.2,
             '15m': 0.1
         },
+        'keep_df_tail': 256,
         'currency_pairs': ['EURUSD=X', 'GBPUSD=X'],
         'indicators': {
             'ma_periods': [20, 50, 200],
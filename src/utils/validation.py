@@ -0,0 +1,33 @@
+"""
+Input Validation
+Shared checks for the user-management forms and admin scripts
+"""
+
+from typing import Optional
+
+MIN_PASSWORD_LENGTH = 6
+
+
+def validate_password(
+    password: str,
+    confirm: str,
+    min_length: int = MIN_PASSWORD_LENGTH
+) -> Optional[str]:
+    """
+    Validate a new password and its confirmation
+
+    Args:
+        password: New password
+        confirm: Confirmation entry
+        min_length: Minimum accepted length
+
+    Returns:
+        Error message for the first failed check, or None if valid
+    """
+    if not password:
+        return "Please enter a new password"
+    if password != confirm:
+        return "Passwords do not match"
+    if len(password) < min_length:
+        return f"Password must be at least {min_length} characters long"
+    return None
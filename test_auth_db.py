@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Smoke test for the database authenticator
+Imports AuthenticatorDB, constructs it on a fresh database and checks the
+default accounts and role permissions
+"""
+
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.auth.authentication_db import AuthenticatorDB, Role, Permissions
+from src.auth._roles import _has
+
+
+def test_authenticator_db_creates_default_users():
+    """A new database gets the default admin and demo accounts"""
+    with tempfile.TemporaryDirectory() as tmp:
+        auth = AuthenticatorDB(os.path.join(tmp, 'users.db'))
+
+        users = {u['username']: u for u in auth.db.get_all_users()}
+        assert set(users) == {'admin', 'user'}
+        assert users['admin']['role'] == Role.ADMIN
+
+        success, user = auth.db.authenticate_user('user', 'user123')
+        assert success and user['role'] == Role.USER
+
+
+def test_role_permissions():
+    """Admins hold every permission; users only view and scan"""
+    assert _has(Role.ADMIN, Permissions.MANAGE_USERS)
+    assert _has(Role.USER, Permissions.SCAN_PAIRS)
+    assert not _has(Role.USER, Permissions.TRAIN_MODEL)
+    assert not _has(None, Permissions.VIEW_ANALYSIS)
+
+
+if __name__ == "__main__":
+    test_authenticator_db_creates_default_users()
+    test_role_permissions()
+    print("✅ AuthenticatorDB smoke test passed")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test the ForexDataFetcher disk and memory caches
+Cached frames must read back exactly as they were fetched
+"""
+
+import sys
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.data import data_fetcher
+from src.data.data_fetcher import ForexDataFetcher
+
+
+def _sample_frame(rows=50):
+    """Synthetic OHLCV frame with prices that float32 would round"""
+    index = pd.date_range('2024-01-01', periods=rows, freq='h', name='Date')
+    close = 2596.27462 + np.arange(rows) * 0.00013
+    return pd.DataFrame({
+        'Open': close - 0.5,
+        'High': close + 1.0,
+        'Low': close - 1.0,
+        'Close': close,
+        'Volume': np.arange(rows, dtype=np.int64) * 1000
+    }, index=index)
+
+
+def _round_trip(feather):
+    """Write and re-read a frame through the disk cache"""
+    original = data_fetcher.FEATHER_AVAILABLE
+    data_fetcher.FEATHER_AVAILABLE = feather and original
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            fetcher = ForexDataFetcher(cache_dir=tmp)
+            df = _sample_frame()
+            fetcher._save_to_cache(df, 'XAU_USD', '1h')
+            fetcher._mem_cache.clear()
+            return df, fetcher._load_from_cache('XAU_USD', '1h')
+    finally:
+        data_fetcher.FEATHER_AVAILABLE = original
+
+
+def test_cache_round_trip_is_exact():
+    """Prices stay float64 and Volume int64 through both cache formats"""
+    for feather in (True, False):
+        df, cached = _round_trip(feather)
+        pd.testing.assert_frame_equal(cached, df, check_freq=False)
+
+
+def test_memory_cache_returns_copies():
+    """Mutating a returned frame does not change later cache hits"""
+    with tempfile.TemporaryDirectory() as tmp:
+        fetcher = ForexDataFetcher(cache_dir=tmp)
+        fetcher._save_to_cache(_sample_frame(), 'EURUSD=X', '1d')
+
+        first = fetcher._load_from_cache('EURUSD=X', '1d')
+        first['RSI'] = 50.0
+        second = fetcher._load_from_cache('EURUSD=X', '1d')
+        assert 'RSI' not in second.columns
+
+
+def test_fetch_many_matches_fetch_data():
+    """fetch_many returns what fetch_data does per pair, deduplicated and in order"""
+    pairs = [('XAU_USD', '1h'), ('EUR_USD', '1d'), ('XAU_USD', '1h'), ('GBP_USD', '4h')]
+    with tempfile.TemporaryDirectory() as tmp:
+        fetcher = ForexDataFetcher(cache_dir=tmp)
+        for i, (symbol, timeframe) in enumerate(dict.fromkeys(pairs)):
+            fetcher._save_to_cache(_sample_frame(rows=50 + i), symbol, timeframe)
+
+        data = fetcher.fetch_many(pairs)
+
+        assert list(data) == list(dict.fromkeys(pairs))
+        for (symbol, timeframe), df in data.items():
+            pd.testing.assert_frame_equal(df, fetcher.fetch_data(symbol, timeframe))
+
+
+if __name__ == "__main__":
+    test_cache_round_trip_is_exact()
+    test_memory_cache_returns_copies()
+    test_fetch_many_matches_fetch_data()
+    print("✅ Data cache tests passed")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Test the batch recommendation path
+It must give the same recommendation as generate_enhanced_recommendation
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.analysis.enhanced_recommendations import EnhancedRecommendations
+from src.indicators.technical_indicators import TechnicalIndicators
+from src.utils.config_loader import get_default_config
+from sample_frames import random_walk_frame
+
+
+def _indicator_frame(rows=300, seed=7):
+    """Random-walk OHLCV frame with all indicators added"""
+    df = random_walk_frame(rows, seed)
+    return TechnicalIndicators.add_all_indicators(df, get_default_config()['indicators'])
+
+
+def _frames():
+    """Frames covering BUY, SELL and HOLD, plus one too short for MA_50"""
+    return [_indicator_frame(seed=seed) for seed in range(12)] + [_indicator_frame(rows=40)]
+
+
+def test_batch_generate_matches_single_path():
+    """batch_generate gives generate_enhanced_recommendation's output per frame"""
+    dfs = _frames()
+    timeframes = ['1h'] * len(dfs)
+
+    results = EnhancedRecommendations.batch_generate(dfs, timeframes)
+
+    assert len(results) == len(dfs)
+    for df, result in zip(dfs, results):
+        expected = EnhancedRecommendations.generate_enhanced_recommendation(df, {}, '1h')
+        np.testing.assert_equal(result, expected)
+
+
+if __name__ == "__main__":
+    test_batch_generate_matches_single_path()
+    print("✅ Enhanced recommendation tests passed")
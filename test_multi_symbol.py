@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Test MultiTimeframeAnalyzer.analyze_many_symbols
+The process-pool screen must match analyzing each symbol on its own
+"""
+
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.analysis.multi_timeframe import MultiTimeframeAnalyzer
+from src.utils.config_loader import get_default_config
+from sample_frames import random_walk_frame
+
+
+def _assert_same_analysis(result, expected):
+    """Compare two analyze_multiple_timeframes results"""
+    assert result.keys() == expected.keys()
+    for timeframe in expected:
+        got = dict(result[timeframe])
+        want = dict(expected[timeframe])
+        pd.testing.assert_frame_equal(got.pop('dataframe'), want.pop('dataframe'))
+        np.testing.assert_equal(got, want)
+
+
+def test_many_symbols_match_single_symbol_path():
+    """Each symbol's result equals analyze_multiple_timeframes on its data"""
+    analyzer = MultiTimeframeAnalyzer(get_default_config())
+    data_by_symbol = {
+        symbol: {'1h': random_walk_frame(seed=seed), '1d': random_walk_frame(seed=seed + 100)}
+        for seed, symbol in enumerate(['EUR_USD', 'GBP_USD', 'XAU_USD'])
+    }
+
+    results = analyzer.analyze_many_symbols(data_by_symbol, max_workers=2)
+
+    assert list(results) == list(data_by_symbol)
+    for symbol, data_dict in data_by_symbol.items():
+        _assert_same_analysis(results[symbol],
+                              analyzer.analyze_multiple_timeframes(data_dict))
+
+
+if __name__ == "__main__":
+    test_many_symbols_match_single_symbol_path()
+    print("✅ Multi-symbol analysis tests passed")